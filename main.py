@@ -9,14 +9,122 @@
     python main.py --output ./out/graph.cypher  # 출력 파일 지정
     python main.py --model qwen2.5:7b       # LLM 모델 지정
     python main.py --verbose                # 디버그 로깅
+    python main.py --export batched         # 기존 그래프를 배치 UNWIND 스크립트로 내보내기
+    python main.py --export csv             # neo4j-admin 벌크 임포트용 CSV
+    python main.py --export params          # 파라미터 템플릿 + JSON Lines
+    python main.py --load-params DIR        # 파라미터 내보내기를 Neo4j에 적재
+    python main.py --compact                # 그래프 파일 중복 제거
 """
 
 import argparse
 import sys
 from pathlib import Path
 
+from src.core.config import get_config
 from src.core.logger import setup_logger, set_log_level
 from src.graphs import KnowledgeGraphBuilder
+from src.tools.cypher import (
+    CypherManager,
+    BatchCypherExporter,
+    Neo4jCSVExporter,
+    ParameterizedExporter,
+    ParameterizedLoader,
+    compact_cypher_file,
+)
+from src.core.exceptions import ExportError
+
+
+def run_export(args) -> int:
+    """기존 그래프 파일을 다른 형식으로 내보내기"""
+    output_path = Path(args.output)
+    if not output_path.exists():
+        print(f"그래프 파일이 없습니다: {output_path}")
+        return 1
+
+    neo4j_config = get_config().neo4j
+    export_dir = Path(args.export_dir or neo4j_config.output_dir)
+    batch_size = args.batch_size or neo4j_config.export_batch_size
+
+    state = CypherManager(str(output_path)).load_existing()
+    print(f"그래프 로드: 노드 {len(state.nodes)}개, 관계 {len(state.relationships)}개")
+
+    if args.export == "batched":
+        stats = BatchCypherExporter(batch_size).export(
+            state, export_dir / f"{output_path.stem}_batched.cypher"
+        )
+    elif args.export == "csv":
+        stats = Neo4jCSVExporter(compress=args.compress).export(state, export_dir)
+    elif args.export == "params":
+        stats = ParameterizedExporter().export(
+            state, export_dir / f"{output_path.stem}_params"
+        )
+    else:
+        print(f"지원하지 않는 내보내기 형식: {args.export}")
+        return 1
+
+    print("내보내기 완료:")
+    for key, value in stats.items():
+        print(f"  - {key}: {value}")
+    return 0
+
+
+def run_load_params(args) -> int:
+    """파라미터 내보내기(templates.cypher + params.jsonl)를 Neo4j에 적재"""
+    neo4j_config = get_config().neo4j
+
+    try:
+        loader = ParameterizedLoader.from_config(neo4j_config, args.batch_size)
+    except ExportError as e:
+        print(f"적재 실패: {e}")
+        return 1
+
+    try:
+        stats = loader.load(args.load_params)
+    except (ExportError, OSError) as e:
+        print(f"적재 실패: {e}")
+        return 1
+    finally:
+        loader.close()
+
+    print("적재 완료:")
+    for key, value in stats.items():
+        print(f"  - {key}: {value}")
+    return 0
+
+
+def run_compact(args) -> int:
+    """그래프 파일 압축 (중복 제거 후 원자적 교체)"""
+    output_path = Path(args.output)
+    if not output_path.exists():
+        print(f"그래프 파일이 없습니다: {output_path}")
+        return 1
+
+    neo4j_config = get_config().neo4j
+    batched_output = None
+    if args.batched:
+        export_dir = Path(args.export_dir or neo4j_config.output_dir)
+        batched_output = export_dir / f"{output_path.stem}_batched.cypher"
+
+    try:
+        stats = compact_cypher_file(
+            output_path,
+            batched_output=batched_output,
+            batch_size=args.batch_size or neo4j_config.export_batch_size,
+            force=args.force
+        )
+    except ExportError as e:
+        print(f"압축 실패: {e}")
+        return 1
+
+    print("압축 완료:")
+    print(f"  - 문장: {stats['statements_before']} → {stats['statements_after']}")
+    print(
+        f"  - 크기: {stats['bytes_before']:,} → {stats['bytes_after']:,} bytes "
+        f"({stats['saved_ratio']:.1%} 절감)"
+    )
+    if batched_output:
+        print(f"  - 배치 스크립트: {stats['batched_output']}")
+    return 0
 
 
 def main():
@@ -28,6 +136,11 @@ def main():
   python main.py
   python main.py --input ./notes --output ./out/graph.cypher
   python main.py --model qwen2.5:7b --verbose
+  python main.py --export batched --batch-size 5000
+  python main.py --export csv --compress zstd
+  python main.py --export params
+  python main.py --load-params data/output/neo4j/graph_params
+  python main.py --compact --batched
 
 워크플로우:
   1. Research Agent: 문서 파싱, 개념 추출, 메타데이터 수집
@@ -66,6 +179,58 @@ def main():
         help="디버그 로깅 활성화"
     )
 
+    parser.add_argument(
+        "--export", "-e",
+        choices=["batched", "csv", "params"],
+        default=None,
+        help="워크플로우 대신 기존 그래프(--output)를 지정 형식으로 내보내기"
+    )
+
+    parser.add_argument(
+        "--load-params",
+        default=None,
+        metavar="DIR",
+        help="워크플로우 대신 --export params 결과를 Neo4j(설정의 neo4j.uri)에 적재"
+    )
+
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="워크플로우 대신 그래프 파일(--output)의 중복을 제거하고 다시 쓰기"
+    )
+
+    parser.add_argument(
+        "--batched",
+        action="store_true",
+        help="--compact 시 배치 UNWIND 스크립트도 함께 생성"
+    )
+
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="--compact 시 인식할 수 없는 줄이 있어도 진행"
+    )
+
+    parser.add_argument(
+        "--export-dir",
+        default=None,
+        help="내보내기 디렉토리 (기본: 설정의 neo4j.export.output_dir)"
+    )
+
+    parser.add_argument(
+        "--compress",
+        choices=["zstd"],
+        default=None,
+        help="CSV 내보내기 압축 (zstd)"
+    )
+
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=None,
+        help="UNWIND 배치 크기 (기본: 설정의 neo4j.export.batch_size)"
+    )
+
     args = parser.parse_args()
 
     # 로거 설정
@@ -75,6 +240,15 @@ def main():
     if args.verbose:
         set_log_level("DEBUG")
 
+    if args.compact:
+        return run_compact(args)
+
+    if args.export:
+        return run_export(args)
+
+    if args.load_params:
+        return run_load_params(args)
+
     # 입력 디렉토리 확인/생성
     input_dir = Path(args.input)
     if not input_dir.exists():
@@ -128,6 +302,9 @@ def main():
         print(f"  - 새 관계: {r.get('new_relationships', 0)}개")
         print(f"  - 총 쿼리: {r.get('total_queries', 0)}개")
         print(f"  - 출력 파일: {r.get('output_file', args.output)}")
+        run_stats = (result.get("final_state") or {}).get("run_stats", {})
+        for step, stats in run_stats.items():
+            print(f"  - {step}: {stats}")
     else:
         print("실패!")
         for error in result.get("errors", []):
@@ -1,12 +1,22 @@
 """Analyst Agent - 관계 분석 및 카테고리 분류"""
 
+from collections import Counter
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 from src.core.base_agent import BaseAgent
+from src.core.config import get_config
+from src.tools.analysis import available_tokens, pack_by_budget
+from src.tools.cypher import normalize_name
 from src.agents.analyst_agent.tools import AnalystTools
 from src.agents.analyst_agent.prompts import PROMPTS
 
 
+# 배치 분류 응답에서 문서 하나당 차지하는 토큰 (대략)
+_CATEGORY_RESULT_TOKENS = 40
+
+
 class AnalystAgent(BaseAgent):
     """Analyst Agent
 
@@ -31,6 +41,8 @@ class AnalystAgent(BaseAgent):
         super().__init__(model_name=model_name)
         self.prompts = PROMPTS
         self.tools = AnalystTools()
+        self.run_stats: dict = {}
+        self._llm_prompts = 0
 
     def run(self, state: dict) -> dict:
         """에이전트 실행
@@ -39,9 +51,10 @@ class AnalystAgent(BaseAgent):
             state: {output_file, parsed_docs, new_concepts, ...}
 
         Returns:
-            {existing_graph, categorized_docs, relationships}
+            {existing_graph, categorized_docs, relationships, run_stats}
         """
         self.logger.info("=== Analyst Agent 시작 ===")
+        self.run_stats = {}
 
         # 1. 기존 그래프 상태 로드
         output_file = state.get("output_file", "data/output/graph.cypher")
@@ -49,15 +62,20 @@ class AnalystAgent(BaseAgent):
 
         self.logger.info(f"기존 그래프: {existing_graph['stats']}")
 
-        # 2. 문서 카테고리 분류
-        parsed_docs = state.get("parsed_docs", [])
+        # 2. 기존 개념과 같은 새 개념은 기존 이름으로 통일
+        parsed_docs, new_concepts = self._merge_near_duplicates(
+            state.get("parsed_docs", []),
+            state.get("new_concepts", []),
+            existing_graph
+        )
+
+        # 3. 문서 카테고리 분류
         categorized_docs = self._categorize_documents(
             parsed_docs,
             existing_graph
         )
 
-        # 3. 개념 간 관계 분석
-        new_concepts = state.get("new_concepts", [])
+        # 4. 개념 간 관계 분석
         relationships = self._analyze_relationships(
             new_concepts,
             existing_graph
@@ -71,44 +89,362 @@ class AnalystAgent(BaseAgent):
         return {
             "existing_graph": existing_graph,
             "categorized_docs": categorized_docs,
-            "relationships": relationships
+            "relationships": relationships,
+            "run_stats": {**state.get("run_stats", {}), "analyst": self.run_stats}
         }
 
+    def _merge_near_duplicates(
+        self,
+        docs: list[dict],
+        new_concepts: list[dict],
+        existing_graph: Mapping
+    ) -> tuple[list[dict], list[dict]]:
+        """임베딩 유사도가 높은 새 개념을 기존 개념 이름으로 바꿈 (원래 이름은 alias)"""
+        names = [c.get("name", "") for c in new_concepts]
+        for doc in docs:
+            names.extend(
+                c.get("name", "") for c in doc.get("analysis", {}).get("concepts", [])
+            )
+
+        aliases = self.tools.find_near_duplicates(
+            names, existing_graph.get("concepts", [])
+        )
+        if not aliases:
+            return docs, new_concepts
+
+        self.logger.info(f"기존 개념으로 병합: {aliases}")
+
+        def rename(concept: dict) -> dict:
+            canonical = aliases.get(concept.get("name", ""))
+            if not canonical:
+                return concept
+            return {**concept, "name": canonical, "alias": concept["name"]}
+
+        merged_docs = []
+        for doc in docs:
+            analysis = doc.get("analysis", {})
+            if analysis.get("concepts"):
+                analysis = {
+                    **analysis,
+                    "concepts": [rename(c) for c in analysis["concepts"]],
+                }
+                doc = {**doc, "analysis": analysis}
+            merged_docs.append(doc)
+
+        return merged_docs, [rename(c) for c in new_concepts]
+
     def _categorize_documents(
         self,
         docs: list[dict],
-        existing_graph: dict
+        existing_graph: Mapping
     ) -> list[dict]:
-        """문서별 카테고리 분류"""
-        categorized = []
-
-        # 기존 카테고리 추출
-        existing_categories = [
-            node["properties"].get("name", "")
-            for node in existing_graph["nodes"].values()
-            if node["label"] == "Category"
+        """문서별 카테고리 분류
+
+        1단계: 모든 문서를 기존 카테고리 기준으로 동시에 분류
+        2단계: 새로 제안된 카테고리 중 같은 의미인 것을 한 번에 병합
+        """
+        if not docs:
+            return []
+
+        existing_categories = list(existing_graph.get("categories", []))
+        vectors = self._document_vectors(docs)
+
+        # 기존 카테고리/중심 벡터로 결정되지 않은 문서만 LLM에 배치로 보냄
+        results = [
+            self._categorize_locally(doc, vector, existing_categories)
+            for doc, vector in zip(docs, vectors)
         ]
+        pending = [i for i, result in enumerate(results) if result is None]
+        llm_categories = self._categorize_with_llm(
+            [docs[i] for i in pending], existing_categories
+        )
+        for i, category in zip(pending, llm_categories):
+            results[i] = (category, "llm")
+
+        categories = [category for category, _ in results]
+        mapping = self._reconcile_categories(categories, existing_categories)
+        final = [mapping.get(category, category) for category in categories]
+
+        sources = Counter(source for _, source in results)
+        self._update_centroids(docs, vectors, final, sources)
+        self.run_stats["categorization"] = {
+            "documents": len(docs),
+            "triage": sources["triage"],
+            "suggested": sources["suggested"],
+            "centroid": sources["centroid"],
+            "llm": sources["llm"],
+            "llm_prompts": self._llm_prompts,
+            "local_rate": round(1 - sources["llm"] / len(docs), 3),
+        }
 
-        for doc in docs:
-            analysis = doc.get("analysis", {})
-            suggested_category = analysis.get("category", "")
+        return [
+            {**doc, "final_category": category}
+            for doc, category in zip(docs, final)
+        ]
 
-            # LLM으로 카테고리 확정
-            if suggested_category:
-                category = self._confirm_category(
-                    doc, suggested_category, existing_categories
-                )
-            else:
-                category = self._assign_category(doc, existing_categories)
+    def _document_vectors(self, docs: list[dict]) -> list:
+        """카테고리 분류용 문서 임베딩 (중심 분류를 쓰지 않거나 triage 문서면 None)"""
+        if self.tools.get_category_centroids() is None:
+            return [None] * len(docs)
 
-            doc_with_category = {**doc, "final_category": category}
-            categorized.append(doc_with_category)
+        indices = [
+            i for i, doc in enumerate(docs) if not doc.get("analysis", {}).get("triage")
+        ]
+        vectors = self.tools.embed_texts(
+            [self.tools.document_text(docs[i]) for i in indices]
+        )
+        result = [None] * len(docs)
+        if vectors is not None:
+            for i, vector in zip(indices, vectors):
+                result[i] = vector
+        return result
 
-            # 새 카테고리면 목록에 추가
-            if category and category not in existing_categories:
-                existing_categories.append(category)
+    def _categorize_locally(
+        self,
+        doc: dict,
+        vector,
+        existing: list[str]
+    ) -> Optional[tuple[str, str]]:
+        """LLM 없이 정할 수 있는 카테고리
+
+        Returns:
+            (카테고리, 결정 방법: triage | suggested | centroid) 또는 None
+        """
+        suggested_category = doc.get("analysis", {}).get("category", "")
 
-        return categorized
+        # Research Agent가 로컬 분석한 문서는 제안된 카테고리 그대로
+        if doc.get("analysis", {}).get("triage"):
+            for cat in existing:
+                if suggested_category and cat.lower() == suggested_category.lower():
+                    return cat, "triage"
+            return suggested_category or "미분류", "triage"
+
+        # 제안된 카테고리가 기존 카테고리와 같으면 그대로 사용
+        for cat in existing:
+            if suggested_category and cat.lower() == suggested_category.lower():
+                return cat, "suggested"
+
+        # 중심 벡터가 충분히 가까우면 LLM 없이 할당
+        category = self._classify_by_centroid(vector, existing)
+        if category:
+            return category, "centroid"
+        return None
+
+    def _categorize_with_llm(
+        self,
+        docs: list[dict],
+        existing: list[str]
+    ) -> list[str]:
+        """여러 문서를 categorization_batch 프롬프트로 한 번에 분류
+
+        배치 크기는 num_ctx 예산으로 정하고, 배치들은 동시에 실행함.
+        응답에서 빠지거나 배치 호출이 실패한 문서만 문서별 프롬프트로 다시 분류.
+        """
+        self._llm_prompts = 0
+        if not docs:
+            return []
+
+        config = get_config()
+        existing_text = str(existing[:20])
+        budget = available_tokens(
+            config.llm.num_ctx,
+            self.prompts["system"]
+            + self.prompts["categorization_batch"]
+            + existing_text,
+            config.analysis.response_reserve_tokens,
+        )
+        groups = pack_by_budget(
+            enumerate(docs),
+            lambda item: self._format_document(*item),
+            budget,
+            max_items=config.analysis.categorization_batch_size,
+            item_overhead=_CATEGORY_RESULT_TOKENS
+        )
+
+        categories: list[Optional[str]] = [None] * len(docs)
+        workers = max(1, min(config.processing.max_concurrent, len(groups)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for assigned in executor.map(
+                lambda group: self._categorize_batch(group, existing), groups
+            ):
+                for index, category in assigned.items():
+                    categories[index] = category
+
+            missing = [i for i, category in enumerate(categories) if not category]
+            if missing:
+                self.logger.info(f"배치 분류에서 빠진 문서 {len(missing)}개는 개별 분류")
+            for i, category in zip(missing, executor.map(
+                lambda i: self._categorize_single(docs[i], existing), missing
+            )):
+                categories[i] = category
+
+        self._llm_prompts = sum(1 for group in groups if len(group) > 1) + len(missing)
+        return categories
+
+    @staticmethod
+    def _format_document(index: int, doc: dict) -> str:
+        """배치 프롬프트의 문서 항목 (id는 1부터)"""
+        analysis = doc.get("analysis", {})
+        concepts = ", ".join(
+            c.get("name", "") if isinstance(c, dict) else str(c)
+            for c in analysis.get("concepts", [])[:10]
+        )
+        lines = [
+            f"### id: {index + 1}",
+            f"제목: {doc.get('title', '')}",
+            f"요약: {analysis.get('summary', '')[:500]}",
+            f"개념: {concepts}",
+        ]
+        if analysis.get("category"):
+            lines.append(f"제안된 카테고리: {analysis['category']}")
+        return "\n".join(lines) + "\n\n"
+
+    def _categorize_batch(
+        self,
+        group: list[tuple[int, dict]],
+        existing: list[str]
+    ) -> dict[int, str]:
+        """문서 묶음 하나 분류 ({문서 인덱스: 카테고리}, 실패하면 빈 dict)"""
+        if len(group) < 2:
+            return {}
+
+        try:
+            prompt = self.get_prompt(
+                "categorization_batch",
+                existing_categories=existing[:20],
+                documents="".join(self._format_document(i, doc) for i, doc in group)
+            )
+            result = self.invoke_llm_json(prompt)
+
+        except Exception as e:
+            self.logger.warning(f"배치 카테고리 분류 실패 ({len(group)}개 문서): {e}")
+            return {}
+
+        indexes = {i for i, _ in group}
+        assigned = {}
+        for item in result.get("results", []):
+            if not isinstance(item, dict):
+                continue
+            try:
+                index = int(item.get("id")) - 1
+            except (TypeError, ValueError):
+                continue
+            category = item.get("category")
+            if index in indexes and isinstance(category, str) and category.strip():
+                assigned[index] = category.strip()
+        return assigned
+
+    def _categorize_single(self, doc: dict, existing: list[str]) -> str:
+        """문서 하나를 categorization 프롬프트로 분류"""
+        suggested_category = doc.get("analysis", {}).get("category", "")
+        if suggested_category:
+            return self._confirm_category(doc, suggested_category, existing)
+        return self._assign_category(doc, existing)
+
+    def _classify_by_centroid(self, vector, existing: list[str]) -> Optional[str]:
+        """기존 카테고리 중심과의 유사도/2위와의 차이가 기준 이상이면 그 카테고리"""
+        centroids = self.tools.get_category_centroids()
+        if vector is None or centroids is None or not existing:
+            return None
+
+        by_key = {normalize_name(cat): cat for cat in existing}
+        match = centroids.classify(vector, allowed=set(by_key))
+        if match is None:
+            return None
+
+        name, score, margin = match
+        config = get_config().analysis
+        if (score < config.centroid_min_score
+                or margin < config.centroid_margin
+                or centroids.count(name) < config.centroid_min_documents):
+            return None
+        return by_key[normalize_name(name)]
+
+    def _update_centroids(
+        self,
+        docs: list[dict],
+        vectors: list,
+        categories: list[str],
+        sources: Counter
+    ):
+        """분류 결과를 카테고리 중심과 누적 적중률에 반영
+
+        Thought ID를 키로 반영하므로 다시 처리된 문서는 이전 기여분이 교체됨.
+        """
+        centroids = self.tools.get_category_centroids()
+        if centroids is None:
+            return
+
+        for doc, vector, category in zip(docs, vectors, categories):
+            if vector is not None and category:
+                centroids.update(category, vector, key=self.tools.thought_id(doc))
+        centroids.hits += sources["centroid"]
+        centroids.fallbacks += sources["llm"]
+        centroids.save()
+
+        self.logger.info(
+            f"카테고리 중심 분류: 이번 실행 {sources['centroid']}건, "
+            f"LLM {sources['llm']}건 (누적 적중률 {centroids.hit_rate():.0%})"
+        )
+
+    def _reconcile_categories(
+        self,
+        categories: list[str],
+        existing: list[str]
+    ) -> dict[str, str]:
+        """새로 제안된 카테고리 병합
+
+        정규화/임베딩으로 묶은 뒤, 남은 새 카테고리가 여럿이면
+        LLM 병합 요청을 한 번 보냄.
+
+        Returns:
+            {제안된 카테고리: 최종 카테고리}
+        """
+        known = set(existing)
+        proposed = Counter(c for c in categories if c and c not in known)
+        if not proposed:
+            return {}
+
+        mapping = self.tools.cluster_categories(proposed, existing)
+
+        new_categories = sorted({c for c in mapping.values() if c not in known})
+        if len(new_categories) > 1:
+            merges = self._merge_categories(new_categories, existing)
+            mapping = {name: merges.get(c, c) for name, c in mapping.items()}
+
+        merged = {name: c for name, c in mapping.items() if name != c}
+        if merged:
+            self.logger.info(f"카테고리 병합: {merged}")
+        return mapping
+
+    def _merge_categories(
+        self,
+        new_categories: list[str],
+        existing: list[str]
+    ) -> dict[str, str]:
+        """LLM으로 같은 의미의 새 카테고리 병합 ({새 카테고리: 대상})"""
+        try:
+            prompt = self.get_prompt(
+                "category_merge",
+                new_categories=new_categories,
+                existing_categories=existing[:50]
+            )
+            result = self.invoke_llm_json(prompt)
+
+        except Exception as e:
+            self.logger.warning(f"카테고리 병합 실패: {e}")
+            return {}
+
+        merges = result.get("merges", {})
+        if not isinstance(merges, dict):
+            return {}
+
+        allowed = set(new_categories) | set(existing)
+        return {
+            source: target for source, target in merges.items()
+            if source in new_categories and target in allowed
+            and source != target and target not in merges
+        }
 
     def _confirm_category(
         self,
@@ -164,7 +500,7 @@ class AnalystAgent(BaseAgent):
     def _analyze_relationships(
         self,
         new_concepts: list[dict],
-        existing_graph: dict
+        existing_graph: Mapping
     ) -> list[dict]:
         """개념 간 관계 분석"""
         relationships = []
@@ -175,9 +511,7 @@ class AnalystAgent(BaseAgent):
 
         # 1. 새 개념 ↔ 기존 개념 관계
         if existing_concepts:
-            cross_rels = self._find_cross_relationships(
-                new_concepts, existing_concepts
-            )
+            cross_rels = self._find_cross_relationships(new_concepts)
             relationships.extend(cross_rels)
 
         # 2. 새 개념 ↔ 새 개념 관계 (같은 배치 내)
@@ -185,36 +519,174 @@ class AnalystAgent(BaseAgent):
             internal_rels = self._find_internal_relationships(new_concepts)
             relationships.extend(internal_rels)
 
+        # 3. 공동 출현 통계로 찾은 관계 (상위 쌍만 LLM으로 확인)
+        found = [
+            (rel.get("source", ""), rel.get("target", "")) for rel in relationships
+        ]
+        relationships.extend(
+            self._find_cooccurrence_relationships(new_concepts, found)
+        )
+
         return relationships
 
     def _find_cross_relationships(
         self,
-        new_concepts: list[dict],
-        existing_concepts: list[str]
+        new_concepts: list[dict]
     ) -> list[dict]:
-        """새 개념과 기존 개념 간 관계 찾기"""
-        new_names = list(set(c.get("name", "") for c in new_concepts if c.get("name")))
+        """새 개념과 기존 개념 간 관계 찾기
+
+        새 개념마다 기존 개념 후보 top-k를 검색하고(문자 n-gram, 공동 출현, 임베딩),
+        (새 개념, 후보) 묶음을 num_ctx에 맞는 최소 개수의 프롬프트로 나눠 보냄.
+        """
+        finder = self.tools.get_candidate_finder()
+        if finder is None:
+            return []
 
-        if not new_names or not existing_concepts:
+        analysis_config = get_config().analysis
+        candidates = finder.find(
+            new_concepts, k=analysis_config.relationship_candidates
+        )
+        if not candidates:
             return []
 
+        budget = available_tokens(
+            get_config().llm.num_ctx,
+            self.prompts["system"] + self.prompts["relationship_candidates"],
+            analysis_config.response_reserve_tokens
+        )
+        groups = pack_by_budget(candidates.items(), self._format_candidates, budget)
+
+        limit = analysis_config.max_relationship_prompts
+        if len(groups) > limit:
+            skipped = sum(len(group) for group in groups[limit:])
+            self.logger.warning(
+                f"교차 관계 프롬프트 {len(groups)}개 중 {limit}개만 실행 "
+                f"(개념 {skipped}개 생략)"
+            )
+            groups = groups[:limit]
+
+        relationships = []
+        for group in groups:
+            relationships.extend(self._analyze_candidate_group(dict(group)))
+
+        self.logger.info(
+            f"교차 관계 발견: {len(relationships)}개 "
+            f"(새 개념 {len(candidates)}개, 프롬프트 {len(groups)}개)"
+        )
+        return relationships
+
+    @staticmethod
+    def _format_candidates(item: tuple[str, list[str]]) -> str:
+        """프롬프트의 후보 한 줄: "- 새 개념: 후보1, 후보2" """
+        name, candidates = item
+        return f"- {name}: {', '.join(candidates)}\n"
+
+    def _analyze_candidate_group(
+        self,
+        candidates: dict[str, list[str]]
+    ) -> list[dict]:
+        """후보 묶음 하나를 LLM으로 분석 (후보 밖의 target은 버림)"""
         try:
             prompt = self.get_prompt(
-                "relationship_analysis",
-                new_concepts=new_names[:20],
-                existing_concepts=existing_concepts[:30]
+                "relationship_candidates",
+                candidates="".join(map(self._format_candidates, candidates.items()))
             )
-
             result = self.invoke_llm_json(prompt)
-            relationships = result.get("relationships", [])
-
-            self.logger.info(f"교차 관계 발견: {len(relationships)}개")
-            return relationships
 
         except Exception as e:
             self.logger.warning(f"교차 관계 분석 실패: {e}")
             return []
 
+        allowed = {
+            (normalize_name(name), normalize_name(target))
+            for name, targets in candidates.items()
+            for target in targets
+        }
+        return [
+            rel
+            for rel in result.get("relationships", [])
+            if (
+                normalize_name(rel.get("source", "")),
+                normalize_name(rel.get("target", "")),
+            )
+            in allowed
+        ]
+
+    def _find_cooccurrence_relationships(
+        self,
+        new_concepts: list[dict],
+        found: list[tuple[str, str]]
+    ) -> list[dict]:
+        """공동 출현/PMI 관계
+
+        점수 상위 cooccurrence_verify_top 쌍은 LLM이 관계 타입을 확인하고,
+        나머지는 RELATED_TO로 그대로 추가함.
+        """
+        pairs = self.tools.mine_cooccurrence(new_concepts, exclude=found)
+        if not pairs:
+            return []
+
+        top = get_config().analysis.cooccurrence_verify_top
+        relationships = self._verify_pairs(pairs[:top]) if top > 0 else []
+        relationships.extend(
+            self._pair_to_relationship(pair) for pair in pairs[max(top, 0):]
+        )
+
+        self.logger.info(
+            f"공동 출현 관계: 후보 {len(pairs)}쌍 → {len(relationships)}개"
+        )
+        return relationships
+
+    @staticmethod
+    def _pair_to_relationship(pair) -> dict:
+        return {
+            "source": pair.source,
+            "target": pair.target,
+            "type": "RELATED_TO",
+            "confidence": round(pair.jaccard, 3),
+            "reason": pair.reason(),
+        }
+
+    @staticmethod
+    def _format_pair(pair) -> str:
+        return f"- {pair.source} — {pair.target}: {pair.reason()}\n"
+
+    def _verify_pairs(self, pairs: list) -> list[dict]:
+        """LLM으로 공동 출현 쌍의 관계 타입 확인 (실패한 묶음은 RELATED_TO 유지)"""
+        budget = available_tokens(
+            get_config().llm.num_ctx,
+            self.prompts["system"] + self.prompts["relationship_verification"],
+            get_config().analysis.response_reserve_tokens
+        )
+
+        relationships = []
+        for group in pack_by_budget(pairs, self._format_pair, budget):
+            try:
+                prompt = self.get_prompt(
+                    "relationship_verification",
+                    pairs="".join(map(self._format_pair, group))
+                )
+                result = self.invoke_llm_json(prompt)
+
+            except Exception as e:
+                self.logger.warning(f"공동 출현 관계 확인 실패: {e}")
+                relationships.extend(map(self._pair_to_relationship, group))
+                continue
+
+            allowed = {
+                frozenset((normalize_name(p.source), normalize_name(p.target)))
+                for p in group
+            }
+            relationships.extend(
+                rel for rel in result.get("relationships", [])
+                if frozenset((
+                    normalize_name(rel.get("source", "")),
+                    normalize_name(rel.get("target", ""))
+                )) in allowed
+            )
+
+        return relationships
+
     def _find_internal_relationships(
         self,
         concepts: list[dict]
@@ -34,6 +34,65 @@ PROMPTS = {
     }}
   ]
 }}
+```""",
+
+    "relationship_candidates": """새 개념마다 관련 있을 수 있는 기존 개념 후보가 주어집니다.
+각 새 개념과 그 후보들 사이의 관계를 분석하세요.
+
+## 새 개념 → 기존 개념 후보
+{candidates}
+
+## 관계 타입
+- RELATED_TO: 의미적으로 관련 있음
+- MENTIONS: 한 개념이 다른 개념을 언급함
+- EVOLVED_TO: 개념이 발전/진화함
+- SUPPORTS: 한 개념이 다른 개념을 뒷받침함
+- CONTRADICTS: 개념 간 상충됨
+
+## 응답 형식 (JSON)
+target은 해당 새 개념의 후보 중에서만 고르고,
+의미적으로 명확히 관련 있는 쌍만 포함하세요.
+```json
+{{
+  "relationships": [
+    {{
+      "source": "새 개념",
+      "target": "기존 개념",
+      "type": "RELATED_TO",
+      "confidence": 0.8,
+      "reason": "관계 이유 (간단히)"
+    }}
+  ]
+}}
+```""",
+
+    "relationship_verification": """다음 개념 쌍들은 여러 문서에 함께 등장했습니다.
+각 쌍이 실제로 관계가 있는지 판단하고 관계 타입을 지정하세요.
+
+## 개념 쌍 (공동 출현 통계)
+{pairs}
+
+## 관계 타입
+- RELATED_TO: 의미적으로 관련 있음
+- MENTIONS: 한 개념이 다른 개념을 언급함
+- EVOLVED_TO: 개념이 발전/진화함
+- SUPPORTS: 한 개념이 다른 개념을 뒷받침함
+- CONTRADICTS: 개념 간 상충됨
+
+## 응답 형식 (JSON)
+관계가 없는 쌍은 제외하세요.
+```json
+{{
+  "relationships": [
+    {{
+      "source": "개념1",
+      "target": "개념2",
+      "type": "RELATED_TO",
+      "confidence": 0.8,
+      "reason": "관계 이유 (간단히)"
+    }}
+  ]
+}}
 ```""",
 
     "categorization": """다음 문서에 적절한 카테고리를 할당하세요.
@@ -58,6 +117,56 @@ PROMPTS = {
   "confidence": 0.8,
   "reason": "선택 이유"
 }}
+```""",
+
+    "categorization_batch": """다음 문서들에 각각 적절한 카테고리를 할당하세요.
+
+## 기존 카테고리
+{existing_categories}
+
+## 카테고리 선택 기준
+1. 기존 카테고리 중 적절한 것이 있으면 선택
+2. 없으면 새 카테고리 제안 (간결하고 명확하게)
+
+## 문서 목록
+{documents}
+## 응답 형식 (JSON)
+모든 문서 id에 대해 하나씩 응답하세요.
+```json
+{{
+  "results": [
+    {{
+      "id": 1,
+      "category": "선택된 카테고리",
+      "is_new": false,
+      "confidence": 0.8
+    }}
+  ]
+}}
+```""",
+
+    "category_merge": """여러 문서에 대해 동시에 새 카테고리가 제안되었습니다.
+같은 의미의 카테고리를 하나로 합치세요.
+
+## 새로 제안된 카테고리
+{new_categories}
+
+## 기존 카테고리
+{existing_categories}
+
+## 병합 기준
+- 동의어, 표기 차이, 번역어는 합침 (예: "AI" / "인공지능")
+- 상위/하위 관계는 합치지 않음
+- 기존 카테고리와 같은 의미면 기존 카테고리로 합침
+
+## 응답 형식 (JSON)
+합칠 카테고리만 포함하세요.
+```json
+{{
+  "merges": {{
+    "새 카테고리": "합칠 대상 카테고리"
+  }}
+}}
 ```""",
 
     "concept_deduplication": """다음 개념이 기존 개념과 중복되는지 판단하세요.
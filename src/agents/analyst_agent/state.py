@@ -1,5 +1,6 @@
 """Analyst Agent 전용 상태 정의"""
 
+from collections.abc import Mapping
 from typing import TypedDict
 from dataclasses import dataclass, field
 
@@ -28,7 +29,7 @@ class AnalystState(TypedDict, total=False):
     parsed_docs: list[dict]
     new_concepts: list[dict]
     existing_concepts: list[str]
-    existing_graph: dict
+    existing_graph: Mapping  # GraphView
 
     # 처리 중
     current_concept: str
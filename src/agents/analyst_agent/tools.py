@@ -1,7 +1,25 @@
 """Analyst Agent 전용 도구"""
 
-from typing import Optional
-from src.tools.cypher import CypherManager, GraphState
+from collections import Counter
+from typing import Iterable, Optional
+
+import numpy as np
+
+from src.core.config import get_config
+from src.core.exceptions import LLMError
+from src.core.llm import get_llm_manager
+from src.core.logger import get_logger
+from src.tools.analysis import (
+    CooccurrenceMiner,
+    CooccurrencePair,
+    RelationshipCandidateFinder,
+    cluster_categories,
+)
+from src.tools.cypher import CypherManager, GraphView, canonical_key, normalize_name
+from src.tools.search import CategoryCentroids, ConceptVectorIndex, normalize_rows
+
+
+logger = get_logger(__name__)
 
 
 class AnalystTools:
@@ -9,80 +27,217 @@ class AnalystTools:
 
     def __init__(self):
         self._cypher_manager: Optional[CypherManager] = None
+        self._vector_index: Optional[ConceptVectorIndex] = None
+        self._centroids: Optional[CategoryCentroids] = None
+        self._view: Optional[GraphView] = None
+        # 임베딩 모델 호출이 실패하면 이번 실행 동안 문자열 매칭만 사용
+        self._embedding_failed = False
+        # 기존 개념 목록 → (목록 길이, 허용 행 마스크, {canonical key: 이름})
+        self._allowed_cache: Optional[tuple] = None
 
-    def load_existing_graph(self, output_file: str) -> dict:
+    def load_existing_graph(self, output_file: str) -> GraphView:
         """기존 그래프 상태 로드
 
+        노드/관계를 복사하지 않고 CypherManager 상태를 참조하는
+        읽기 전용 뷰를 반환 (기존 dict 키로도 접근 가능).
+
         Args:
             output_file: Cypher 파일 경로
 
         Returns:
-            그래프 상태 정보
+            GraphView (concepts, tags, categories, nodes, relationships, stats,
+            cypher_manager)
         """
         self._cypher_manager = CypherManager(output_file)
-        graph_state = self._cypher_manager.load_existing()
+        self._cypher_manager.load_existing()
+        self._allowed_cache = None
 
-        existing_concepts = graph_state.get_all_concepts()
-        existing_tags = graph_state.get_all_tags()
+        self._view = GraphView(self._cypher_manager)
+        return self._view
 
-        existing_nodes = {
-            node_id: {
-                "label": node.label,
-                "properties": node.properties
-            }
-            for node_id, node in graph_state.nodes.items()
-        }
+    def get_vector_index(self) -> Optional[ConceptVectorIndex]:
+        """개념 임베딩 인덱스 (graph.cypher.vectors, 사용할 수 없으면 None)"""
+        config = get_config()
+        if not config.search.enabled or self._embedding_failed:
+            return None
+        if self._cypher_manager is None:
+            return None
 
-        existing_relationships = [
-            {
-                "source": rel.source_id,
-                "target": rel.target_id,
-                "type": rel.rel_type,
-                "properties": rel.properties
-            }
-            for rel in graph_state.relationships
-        ]
-
-        stats = {
-            "total_nodes": len(graph_state.nodes),
-            "total_relationships": len(graph_state.relationships),
-            "concept_count": len(existing_concepts),
-            "tag_count": len(existing_tags),
-            "thought_count": sum(
-                1 for n in graph_state.nodes.values()
-                if n.label == "Thought"
-            ),
-            "category_count": sum(
-                1 for n in graph_state.nodes.values()
-                if n.label == "Category"
-            ),
-        }
+        if self._vector_index is None:
+            output_path = self._cypher_manager.output_path
+            self._vector_index = ConceptVectorIndex(
+                output_path.with_name(output_path.name + ".vectors"),
+                embed_fn=get_llm_manager().embed,
+                model=config.llm.embedding_model,
+                batch_size=config.search.embed_batch_size,
+            )
+        return self._vector_index
 
-        return {
-            "concepts": existing_concepts,
-            "tags": existing_tags,
-            "nodes": existing_nodes,
-            "relationships": existing_relationships,
-            "stats": stats,
-            "cypher_manager": self._cypher_manager
-        }
+    def index_concepts(self, names: Iterable[str]) -> bool:
+        """개념 임베딩을 인덱스에 추가 (이미 있는 이름은 캐시 사용)
+
+        Returns:
+            인덱스를 사용할 수 있으면 True
+        """
+        index = self.get_vector_index()
+        if index is None:
+            return False
+
+        try:
+            if index.add(names):
+                index.flush()
+            return True
+        except (LLMError, ValueError) as e:
+            logger.warning(f"개념 임베딩 실패, 문자열 매칭으로 대체: {e}")
+            self._embedding_failed = True
+            return False
+
+    def _prepare_existing(self, existing_concepts: list[str]) -> Optional[tuple]:
+        """기존 개념을 인덱스에 한 번만 넣고 허용 행 마스크를 만들어 둠
+
+        같은 목록 객체(GraphView가 재사용하는 목록 등)로 다시 호출하면
+        인덱싱/마스크 계산 없이 캐시를 반환함.
+
+        Returns:
+            (허용 행 마스크, {canonical key: 기존 개념}), 인덱스를 쓸 수 없으면 None
+        """
+        cached = self._allowed_cache
+        if (cached is not None and cached[0] is existing_concepts
+                and cached[1] == len(existing_concepts)):
+            return cached[2:]
+
+        if not self.index_concepts(existing_concepts):
+            return None
+
+        by_canonical: dict[str, str] = {}
+        for name in existing_concepts:
+            by_canonical.setdefault(canonical_key(name), name)
+        mask = self.get_vector_index().row_mask(existing_concepts)
+        self._allowed_cache = (
+            existing_concepts,
+            len(existing_concepts),
+            mask,
+            by_canonical,
+        )
+        return mask, by_canonical
+
+    def _search_index(
+        self,
+        names: list[str],
+        k: int,
+        min_score: float,
+        allowed
+    ) -> Optional[list[list[tuple[str, float]]]]:
+        """인덱스 검색 (질의 이름은 임베딩만 하고 인덱스에 추가하지 않음, 실패하면 None)"""
+        index = self.get_vector_index()
+        if index is None:
+            return None
+        try:
+            return index.search(names, k=k, min_score=min_score, allowed=allowed)
+        except (LLMError, ValueError) as e:
+            logger.warning(f"개념 임베딩 실패, 문자열 매칭으로 대체: {e}")
+            self._embedding_failed = True
+            return None
 
     def find_similar_concepts(
         self,
         concept: str,
         existing_concepts: list[str],
-        threshold: float = 0.7
+        threshold: Optional[float] = None
     ) -> list[str]:
-        """유사한 개념 찾기 (간단한 문자열 매칭)
+        """유사한 개념 찾기
+
+        임베딩 인덱스가 있으면 코사인 유사도 top-k, 없으면 문자열 매칭.
 
         Args:
             concept: 찾을 개념
             existing_concepts: 기존 개념 목록
-            threshold: 유사도 임계값
+            threshold: 유사도 임계값 (기본: search.similar_threshold)
 
         Returns:
-            유사한 개념 목록
+            유사한 개념 목록 (가까운 순)
         """
+        search_config = get_config().search
+        if threshold is None:
+            threshold = search_config.similar_threshold
+
+        if not existing_concepts:
+            return []
+
+        prepared = self._prepare_existing(existing_concepts)
+        if prepared is not None:
+            mask, by_canonical = prepared
+            hits = self._search_index([concept], search_config.top_k, threshold, mask)
+            if hits is not None:
+                exact = by_canonical.get(canonical_key(concept))
+                return ([exact] if exact else []) + [name for name, _ in hits[0]]
+
+        return self._find_similar_lexical(concept, existing_concepts)
+
+    def search_concepts(
+        self,
+        names: list[str],
+        k: int
+    ) -> Optional[list[list[tuple[str, float]]]]:
+        """기존 개념 중 임베딩이 가까운 top-k (인덱스를 쓸 수 없으면 None)
+
+        Args:
+            names: 찾을 개념 이름
+            k: 이름당 결과 수
+
+        Returns:
+            이름별 [(기존 개념, 유사도)]
+        """
+        if self._view is None:
+            return None
+
+        existing = self._view.concepts
+        prepared = self._prepare_existing(existing) if existing else None
+        if prepared is None:
+            return None
+
+        return self._search_index(names, k, 0.0, prepared[0])
+
+    def get_candidate_finder(self) -> Optional[RelationshipCandidateFinder]:
+        """교차 관계 후보 검색기 (그래프를 로드하기 전이면 None)"""
+        if self._cypher_manager is None:
+            return None
+        return RelationshipCandidateFinder(
+            self._cypher_manager.state,
+            vector_search=self.search_concepts,
+        )
+
+    def mine_cooccurrence(
+        self,
+        new_concepts: list[dict],
+        exclude: Iterable[tuple[str, str]] = ()
+    ) -> list[CooccurrencePair]:
+        """공동 출현/PMI로 새 개념의 관계 후보 찾기 (LLM 미사용)
+
+        Args:
+            new_concepts: Research Agent의 new_concepts
+            exclude: 이미 찾은 (source, target) 쌍
+
+        Returns:
+            임계값을 넘는 쌍 (점수 높은 순, 그래프에 이미 연결된 쌍 제외)
+        """
+        if self._cypher_manager is None:
+            return []
+
+        config = get_config().analysis
+        miner = CooccurrenceMiner(
+            min_count=config.cooccurrence_min_count,
+            min_pmi=config.cooccurrence_min_pmi,
+            min_jaccard=config.cooccurrence_min_jaccard,
+        )
+        return miner.mine(self._cypher_manager.state, new_concepts, exclude)
+
+    def _find_similar_lexical(
+        self,
+        concept: str,
+        existing_concepts: list[str]
+    ) -> list[str]:
+        """유사한 개념 찾기 (간단한 문자열 매칭)"""
         similar = []
         concept_lower = concept.lower()
 
@@ -100,12 +255,61 @@ class AnalystTools:
 
         return similar
 
+    def find_near_duplicates(
+        self,
+        concepts: Iterable[str],
+        existing_concepts: list[str],
+        threshold: Optional[float] = None
+    ) -> dict[str, str]:
+        """기존 개념과 사실상 같은 새 개념 찾기 (예: "ML" ↔ "머신러닝")
+
+        Args:
+            concepts: 새 개념 이름
+            existing_concepts: 기존 개념 목록
+            threshold: 병합 임계값 (기본: search.duplicate_threshold)
+
+        Returns:
+            {새 개념 이름: 기존 개념 이름}
+        """
+        if threshold is None:
+            threshold = get_config().search.duplicate_threshold
+
+        # 표기만 다른 이름(canonical key 일치)은 임베딩 없이 기존 이름으로
+        existing_keys = {normalize_name(c) for c in existing_concepts}
+        existing_by_canonical: dict[str, str] = {}
+        for name in existing_concepts:
+            existing_by_canonical.setdefault(canonical_key(name), name)
+
+        aliases, candidates = {}, []
+        for name in dict.fromkeys(concepts):
+            if not name or normalize_name(name) in existing_keys:
+                continue
+            canonical = existing_by_canonical.get(canonical_key(name))
+            if canonical is not None:
+                aliases[name] = canonical
+            else:
+                candidates.append(name)
+        if not candidates or not existing_concepts:
+            return aliases
+
+        prepared = self._prepare_existing(existing_concepts)
+        if prepared is None:
+            return aliases
+
+        results = self._search_index(candidates, 1, threshold, prepared[0])
+        if results is None:
+            return aliases
+        aliases.update(
+            (name, hits[0][0]) for name, hits in zip(candidates, results) if hits
+        )
+        return aliases
+
     def is_duplicate_concept(
         self,
         concept: str,
         existing_concepts: list[str]
     ) -> bool:
-        """중복 개념인지 확인
+        """중복 개념인지 확인 (canonical key 기준)
 
         Args:
             concept: 확인할 개념
@@ -114,11 +318,136 @@ class AnalystTools:
         Returns:
             중복 여부
         """
-        concept_lower = concept.lower().strip()
-        for existing in existing_concepts:
-            if existing.lower().strip() == concept_lower:
-                return True
-        return False
+        manager = self._cypher_manager
+        if manager is not None and manager.state.has_concept(concept):
+            return True
+        key = canonical_key(concept)
+        return any(canonical_key(existing) == key for existing in existing_concepts)
+
+    @staticmethod
+    def document_text(doc: dict) -> str:
+        """카테고리 분류용 문서 임베딩 텍스트 (제목, 요약, 개념)"""
+        analysis = doc.get("analysis", {})
+        concepts = ", ".join(
+            c.get("name", "") for c in analysis.get("concepts", [])[:10]
+            if isinstance(c, dict)
+        )
+        return f"{doc.get('title', '')}\n{analysis.get('summary', '')}\n{concepts}"
+
+    def embed_texts(self, texts: list[str]) -> Optional[np.ndarray]:
+        """텍스트 임베딩 (실패하면 None, 이번 실행 동안 임베딩 사용 중단)"""
+        batch_size = max(1, get_config().search.embed_batch_size)
+        vectors = []
+        try:
+            for start in range(0, len(texts), batch_size):
+                vectors.extend(get_llm_manager().embed(texts[start:start + batch_size]))
+        except (LLMError, ValueError) as e:
+            logger.warning(f"문서 임베딩 실패, LLM 분류로 대체: {e}")
+            self._embedding_failed = True
+            return None
+        return np.asarray(vectors, dtype=np.float32)
+
+    def thought_id(self, doc: dict) -> Optional[str]:
+        """문서가 기록될 Thought 노드 ID (Writer와 같은 키)"""
+        if self._cypher_manager is None:
+            return None
+        manager = self._cypher_manager
+        source_key = doc.get("source_key") or doc.get("file_name", "")
+        return manager.generate_node_id("Thought", manager.thought_key(source_key))
+
+    def get_category_centroids(self) -> Optional[CategoryCentroids]:
+        """카테고리 중심 벡터 (graph.cypher.centroids, 사용할 수 없으면 None)
+
+        처음 만들 때는 기존 Thought-[:BELONGS_TO]->Category로 초기화함.
+        """
+        config = get_config()
+        if not (config.search.enabled and config.analysis.centroid_enabled):
+            return None
+        if self._embedding_failed or self._cypher_manager is None:
+            return None
+
+        if self._centroids is None:
+            output_path = self._cypher_manager.output_path
+            self._centroids = CategoryCentroids(
+                output_path.with_name(output_path.name + ".centroids"),
+                model=config.llm.embedding_model,
+            )
+            if not len(self._centroids):
+                self._bootstrap_centroids(self._centroids)
+        return self._centroids
+
+    def _bootstrap_centroids(self, centroids: CategoryCentroids):
+        """기존 그래프의 분류 결과로 중심 초기화"""
+        state = self._cypher_manager.state
+        texts, categories, thought_ids = [], [], []
+
+        for thought_id in state.get_node_ids("Thought"):
+            thought = state.nodes.get(thought_id)
+            if thought is None:
+                continue
+            for category_id in state.get_neighbors(thought_id, "out", "BELONGS_TO"):
+                category = state.nodes.get(category_id)
+                if category is None or not category.properties.get("name"):
+                    continue
+                props = thought.properties
+                texts.append(f"{props.get('title', '')}\n{props.get('content', '')}")
+                categories.append(category.properties["name"])
+                thought_ids.append(thought_id)
+
+        if not texts:
+            return
+
+        vectors = self.embed_texts(texts)
+        if vectors is None:
+            return
+
+        for name, vector, thought_id in zip(categories, vectors, thought_ids):
+            centroids.update(name, vector, key=thought_id)
+        centroids.save()
+        logger.info(f"카테고리 중심 초기화: 카테고리 {len(centroids)}개, 문서 {len(texts)}개")
+
+    def cluster_categories(
+        self,
+        proposed: Counter,
+        existing_categories: list[str]
+    ) -> dict[str, str]:
+        """동시에 제안된 새 카테고리 중 같은 것끼리 묶기
+
+        정규화 이름이 같거나 임베딩 유사도가 analysis.category_merge_threshold 이상이면 한 묶음.
+        카테고리 이름은 개념 벡터 인덱스에 넣지 않고 이번 호출에서만 임베딩함
+        (인덱스에 섞이면 개념 검색 결과에 카테고리가 나옴).
+
+        Args:
+            proposed: {제안된 카테고리: 문서 수}
+            existing_categories: 기존 카테고리
+
+        Returns:
+            {제안된 카테고리: 대표 카테고리}
+        """
+        threshold = get_config().analysis.category_merge_threshold
+        candidates = list(dict.fromkeys([*proposed, *existing_categories]))
+
+        def neighbors(names: list[str]) -> Optional[list[list[tuple[str, float]]]]:
+            if not get_config().search.enabled or self._embedding_failed:
+                return None
+            vectors = self.embed_texts(candidates)
+            if vectors is None:
+                return None
+
+            vectors = normalize_rows(vectors.astype(np.float64))
+            rows = {name: i for i, name in enumerate(candidates)}
+            scores = vectors[[rows[name] for name in names]] @ vectors.T
+            results = []
+            for i, name in enumerate(names):
+                scores[i, rows[name]] = -np.inf
+                order = np.argsort(-scores[i])[:5]
+                results.append([
+                    (candidates[j], float(scores[i, j]))
+                    for j in order if scores[i, j] >= threshold
+                ])
+            return results
+
+        return cluster_categories(proposed, existing_categories, neighbors)
 
     def suggest_category(
         self,
@@ -1,12 +1,30 @@
 """Research Agent - 문서 파싱 및 개념 추출"""
 
+from collections import Counter
 from pathlib import Path
 from typing import Optional
 
+import xxhash
+
 from src.core.base_agent import BaseAgent
 from src.core.config import get_config
 from src.agents.research_agent.tools import ResearchTools
 from src.agents.research_agent.prompts import PROMPTS
+from src.tools.analysis import (
+    DocumentFingerprintIndex,
+    PREAMBLE_KEY,
+    SectionCache,
+    available_tokens,
+    chunk_key,
+    keyword_concepts,
+    merge_concepts,
+    pack_by_budget,
+    parent_section,
+    section_units,
+    triage_document,
+)
+from src.tools.analysis.triage import DUPLICATE, TOO_SHORT
+from src.tools.parsers import ContentDefinedChunker, section_offsets
 
 
 class ResearchAgent(BaseAgent):
@@ -40,10 +58,20 @@ class ResearchAgent(BaseAgent):
 
         # 에이전트 전용 도구
         self.tools = ResearchTools()
+        self._section_stats = Counter()
+        self._triage_stats = Counter()
+        self._seen_contents: dict[str, tuple[str, dict]] = {}
 
         # 설정
         self.config = get_config()
 
+        processing = self.config.processing
+        self.chunker = ContentDefinedChunker(
+            min_size=processing.chunk_min_size,
+            avg_size=processing.chunk_avg_size,
+            max_size=processing.chunk_max_size
+        )
+
     def run(self, state: dict) -> dict:
         """에이전트 실행
 
@@ -53,7 +81,7 @@ class ResearchAgent(BaseAgent):
             state: {input_dir, ...}
 
         Returns:
-            {parsed_docs, new_concepts, metadata}
+            {parsed_docs, new_concepts, metadata, run_stats}
         """
         self.logger.info("=== Research Agent 시작 ===")
 
@@ -71,17 +99,46 @@ class ResearchAgent(BaseAgent):
         input_files = self.tools.collect_files(str(input_dir), extensions)
         self.logger.info(f"입력 파일 수: {len(input_files)}")
 
-        # 2. 각 파일 처리
+        # 2. 파싱
+        output_file = state.get("output_file", "data/output/graph.cypher")
+        docs = []
         for file_path in input_files:
-            self.logger.info(f"분석 중: {file_path.name}")
+            try:
+                # 문서 키: 입력 디렉토리 기준 상대 경로 (Thought ID와 같은 키)
+                source_key = self._source_key(file_path, input_dir)
+                docs.append(
+                    (file_path, source_key, self.tools.parse_file(str(file_path)))
+                )
+            except Exception as e:
+                self.logger.error(f"파일 파싱 실패 {file_path.name}: {e}")
+
+        # 3. 코퍼스 키워드 (문서 빈도는 실행마다 한 번 갱신)
+        keywords = self._extract_keywords(
+            {source_key: doc for _, source_key, doc in docs}, output_file
+        )
+
+        # 4. 각 문서 분석 (거의 같은 문서는 이전 분석 결과 재사용)
+        fingerprints = self.tools.open_fingerprint_index(output_file)
+        section_cache = self.tools.open_section_cache(output_file)
+        sources = Counter()
+        self._section_stats = Counter()
+        self._triage_stats = Counter()
+        self._seen_contents = {}
+
+        for file_path, source_key, doc in docs:
+            self.logger.info(f"분석 중: {source_key}")
 
             try:
-                doc_result = self._process_document(file_path)
+                doc_result, source = self._process_document(
+                    file_path, doc, fingerprints, section_cache,
+                    keywords.get(source_key, []), source_key
+                )
                 parsed_docs.append(doc_result)
+                sources[source] += 1
 
                 # 개념 수집
                 for concept in doc_result.get("analysis", {}).get("concepts", []):
-                    concept["source_file"] = doc_result["file_name"]
+                    concept["source_file"] = doc_result["source_key"]
                     all_concepts.append(concept)
 
                 # 메타데이터 수집
@@ -93,6 +150,11 @@ class ResearchAgent(BaseAgent):
                 self.logger.error(f"파일 분석 실패 {file_path.name}: {e}")
                 continue
 
+        if fingerprints is not None:
+            fingerprints.close()
+        if section_cache is not None:
+            section_cache.close()
+
         # 중복 제거
         all_metadata["dates"] = list(set(all_metadata["dates"]))
         all_metadata["tags"] = list(set(all_metadata["tags"]))
@@ -102,44 +164,406 @@ class ResearchAgent(BaseAgent):
             f"{len(all_concepts)}개 개념"
         )
 
+        run_stats = {
+            "documents": len(parsed_docs),
+            "llm": sources["llm"],
+            "keywords": sources["keywords"],
+            "triage": sources["triage"],
+            "triage_reasons": dict(self._triage_stats),
+            "cached": sources["cached"],
+            "near_duplicate": sources["near_duplicate"],
+            "sections": sources["sections"],
+            "sections_reused": self._section_stats["reused"],
+            "sections_extracted": self._section_stats["extracted"],
+            "chunks": self._section_stats["chunks"],
+        }
+        self.logger.info(f"분석 방식: {run_stats}")
+
         # 순수 함수: 새 값만 반환 (state 수정 안함)
         return {
             "parsed_docs": parsed_docs,
             "new_concepts": all_concepts,
-            "metadata": all_metadata
+            "metadata": all_metadata,
+            "run_stats": {**state.get("run_stats", {}), "research": run_stats}
         }
 
-    def _process_document(self, file_path: Path) -> dict:
-        """단일 문서 처리"""
-        # 1. 파싱
-        doc = self.tools.parse_file(str(file_path))
+    def _extract_keywords(
+        self, docs: dict, output_file: str
+    ) -> dict[str, list[tuple[str, float]]]:
+        """이번 실행 문서들의 BM25 키워드 {문서 키: [(용어, 점수)]}"""
+        index = self.tools.open_keyword_index(output_file)
+        if index is None or not docs:
+            return {}
 
-        # 2. LLM 분석
-        analysis = self._analyze_with_llm(doc.content)
+        try:
+            contents = {source_key: doc.content for source_key, doc in docs.items()}
+            index.update(contents)
+            return index.extract(contents, top_k=self.config.processing.keyword_top_k)
+        finally:
+            index.close()
+
+    @staticmethod
+    def _source_key(file_path: Path, input_dir: Path) -> str:
+        """문서 키: 입력 디렉토리 기준 상대 경로 (밖에 있으면 파일명)"""
+        try:
+            return file_path.resolve().relative_to(input_dir.resolve()).as_posix()
+        except ValueError:
+            return file_path.name
+
+    def _process_document(
+        self,
+        file_path: Path,
+        doc,
+        fingerprints: Optional[DocumentFingerprintIndex] = None,
+        section_cache: Optional[SectionCache] = None,
+        keywords: Optional[list[tuple[str, float]]] = None,
+        source_key: Optional[str] = None
+    ) -> tuple[dict, str]:
+        """단일 문서 처리
 
-        # 3. 메타데이터 추출
+        Returns:
+            (문서 결과, 분석 방식: llm | keywords | triage | cached | sections | near_duplicate)
+        """
+        # 1. 분석 (LLM이 필요 없는 문서는 로컬 분석)
+        source_key = source_key or doc.file_name
+        content_hash = xxhash.xxh3_64_hexdigest(doc.content)
+        triaged = self._triage(doc, content_hash, keywords or [])
+        if triaged is not None:
+            analysis, source, duplicate_of = triaged
+        else:
+            analysis, source, duplicate_of = self._analyze(
+                doc, fingerprints, section_cache, keywords or [], source_key
+            )
+        self._seen_contents.setdefault(content_hash, (source_key, analysis))
+
+        # 2. 메타데이터 추출
         metadata = self._extract_metadata(doc)
 
-        return {
+        result = {
             "file_name": doc.file_name,
             "file_path": str(file_path),
+            "source_key": source_key,
             "file_type": doc.file_type,
             "title": doc.title or file_path.stem,
             "content": doc.content,
             "analysis": analysis,
             "metadata": metadata
         }
+        if duplicate_of:
+            result["duplicate_of"] = duplicate_of
+        return result, source
+
+    def _triage(
+        self,
+        doc,
+        content_hash: str,
+        keywords: list[tuple[str, float]]
+    ) -> Optional[tuple[dict, str, Optional[dict]]]:
+        """LLM 분석이 필요 없는 문서의 로컬 분석
+
+        같은 실행에서 내용이 같은 파일이 이미 있으면 그 분석 결과를 쓰고,
+        빈 파일/링크 모음/헤더뿐인 CSV/짧은 메모는 카테고리 "미분류"로 둠
+        (짧은 메모만 BM25 키워드를 개념으로 사용).
+        Analyst는 analysis["triage"]가 있는 문서를 LLM 없이 분류함.
+
+        Returns:
+            (분석 결과, "triage", 원본 정보 또는 None) 또는 일반 문서면 None
+        """
+        config = self.config.processing
+        if not config.triage_enabled:
+            return None
+
+        duplicate_of = None
+        seen = self._seen_contents.get(content_hash)
+        if seen is not None and doc.content.strip():
+            reason = DUPLICATE
+            original_key, original = seen
+            analysis = {
+                **original,
+                "concepts": [dict(c) for c in original.get("concepts", [])],
+                "triage": reason,
+            }
+            duplicate_of = {
+                "source_key": original_key,
+                "similarity": 1.0,
+                "method": "exact",
+            }
+        else:
+            reason = triage_document(
+                doc, config.triage_min_chars, config.triage_max_link_ratio
+            )
+            if reason is None:
+                return None
+            analysis = {
+                "concepts": keyword_concepts(keywords) if reason == TOO_SHORT else [],
+                "category": "미분류",
+                "summary": " ".join(doc.content.split())[:100] or doc.title,
+                "triage": reason,
+            }
+
+        self.logger.info(f"로컬 분석: {doc.file_name} ({reason})")
+        self._triage_stats[reason] += 1
+        return analysis, "triage", duplicate_of
+
+    def _analyze(
+        self,
+        doc,
+        fingerprints: Optional[DocumentFingerprintIndex],
+        section_cache: Optional[SectionCache],
+        keywords: list[tuple[str, float]],
+        doc_key: Optional[str] = None
+    ) -> tuple[dict, str, Optional[dict]]:
+        """캐시를 거쳐 문서 분석
+
+        1. 내용이 그대로면 저장된 분석 결과 (cached)
+        2. 짧은 노트는 LLM 없이 BM25 키워드 (keywords)
+        3. 섹션 캐시가 있는 문서면 바뀐 섹션/청크만 추출 (sections)
+        4. 거의 같은 문서가 있으면 그 문서의 분석 결과 (near_duplicate)
+        5. 나머지는 LLM (섹션이 여럿이거나 긴 문서면 섹션/청크별로 추출해 캐시에 저장)
+
+        Returns:
+            (분석 결과, 분석 방식, {source_key, similarity} 또는 None)
+        """
+        doc_key = doc_key or doc.file_name
+        content_hash = xxhash.xxh3_64_hexdigest(doc.content)
+        signature = None
+
+        if fingerprints is not None:
+            cached = fingerprints.cached_analysis(doc_key, content_hash)
+            if cached is not None:
+                return cached, "cached", None
+            signature = fingerprints.signature(doc.content)
+
+        short_note = self.config.processing.keyword_short_note_chars
+        if keywords and len(doc.content.strip()) <= short_note:
+            return self._keyword_analysis(doc.content, keywords), "keywords", None
+
+        units = self._analysis_units(doc, use_sections=section_cache is not None)
+        stored = (
+            section_cache.load(doc_key)
+            if section_cache is not None and len(units) > 1
+            else {}
+        )
+
+        analysis, source, duplicate_of = None, "llm", None
+        use_sections = len(units) > 1
+        if stored:
+            analysis = self._analyze_sections(doc_key, units, stored, section_cache)
+            source = "sections"
+            # 섹션 추출이 실패했으면 다시 섹션별로 보내지 않고 문서 전체로 한 번만 대체
+            use_sections = False
+
+        elif signature is not None:
+            match = fingerprints.query(signature, exclude={doc_key})
+            if match is not None and fingerprints.analysis(match[0]) is not None:
+                match_key, similarity = match
+                self.logger.info(
+                    f"거의 같은 문서: {doc_key} ≈ {match_key} ({similarity:.2f}), 분석 재사용"
+                )
+                analysis = fingerprints.analysis(match_key)
+                source = "near_duplicate"
+                duplicate_of = {
+                    "source_key": match_key,
+                    "similarity": round(similarity, 3),
+                }
+
+        if analysis is None and use_sections:
+            analysis = self._analyze_sections(doc_key, units, {}, section_cache)
+        if analysis is None:
+            analysis, source = self._analyze_with_llm(doc.content, keywords), "llm"
+
+        # LLM이 실패한 폴백 결과나 일부 섹션이 빠진 결과는 저장하지 않음 (다음 실행에서 다시 시도)
+        if (
+            signature is not None
+            and not analysis.get("fallback")
+            and not analysis.get("incomplete")
+        ):
+            fingerprints.add(doc_key, content_hash, signature, analysis)
+        return analysis, source, duplicate_of
+
+    def _analysis_units(self, doc, use_sections: bool) -> list[tuple[str, str]]:
+        """분석 단위 (키, 텍스트) 목록
+
+        마크다운 섹션을 기본 단위로 하고, chunk_max_size보다 긴 섹션이나
+        섹션이 없는 긴 문서는 내용 기반 청크로 나눔 (키: "섹션 키@청크 ID").
+        단위가 하나뿐이면 문서 전체를 한 번에 분석함.
+        """
+        units = section_units(doc) if use_sections else []
+        if len(units) <= 1:
+            if len(doc.content) <= self.chunker.max_size:
+                return units
+            chunks = self.chunker.chunk(doc.content, section_offsets(doc))
+            units = [
+                (chunk_key(PREAMBLE_KEY, chunk.id), chunk.text) for chunk in chunks
+            ]
+        else:
+            expanded = []
+            for key, text in units:
+                if len(text) <= self.chunker.max_size:
+                    expanded.append((key, text))
+                    continue
+                expanded.extend(
+                    (chunk_key(key, chunk.id), chunk.text)
+                    for chunk in self.chunker.chunk(text)
+                )
+            units = expanded
+
+        limit = self.config.processing.chunk_max_per_document
+        if limit and len(units) > limit:
+            self.logger.info(
+                f"분석 단위가 너무 많음: {doc.file_name} — 앞 {limit}개만 분석 ({len(units)}개)"
+            )
+            units = units[:limit]
+        return units
+
+    def _analyze_sections(
+        self,
+        doc_key: str,
+        units: list[tuple[str, str]],
+        stored: dict[str, tuple[str, list[dict]]],
+        section_cache: Optional[SectionCache]
+    ) -> Optional[dict]:
+        """추가/수정된 섹션만 추출하고 나머지 섹션은 캐시된 개념과 합침
+
+        Returns:
+            분석 결과 (추출 실패 시 None → 문서 전체 분석으로 대체)
+        """
+        hashes = {key: xxhash.xxh3_64_hexdigest(text) for key, text in units}
+        changed = [
+            (key, text) for key, text in units
+            if stored.get(key, ("",))[0] != hashes[key]
+        ]
+
+        outline = list(dict.fromkeys(parent_section(key) for key, _ in units))
+        extracted = self._extract_sections(changed, outline)
+        if extracted is None:
+            return None
+        concepts_by_section, category, summary = extracted
+
+        previous = (
+            section_cache.document(doc_key) if section_cache is not None else None
+        )
+        if previous is not None:
+            # 카테고리는 처음 분석한 값을 유지, 요약은 바뀐 섹션이 있으면 갱신
+            category = previous[0] or category
+            summary = summary or previous[1]
+
+        changed_keys = {key for key, _ in changed}
+        # 응답에 빠진 변경 섹션은 저장하지 않음 (다음 실행에서 다시 추출)
+        missing = [key for key in changed_keys if key not in concepts_by_section]
+        sections = {
+            key: (
+                hashes[key],
+                concepts_by_section[key] if key in changed_keys else stored[key][1]
+            )
+            for key, _ in units
+            if key not in missing
+        }
+        if section_cache is not None:
+            section_cache.save(doc_key, sections, category, summary)
 
-    def _analyze_with_llm(self, content: str) -> dict:
-        """LLM으로 개념 추출"""
-        prompt = self.get_prompt("concept_extraction", content=content[:3000])
+        self._section_stats["chunks"] += sum(
+            1 for key, _ in units if parent_section(key) != key
+        )
+        self._section_stats["extracted"] += len(changed) - len(missing)
+        reused = len(units) - len(changed)
+        self._section_stats["reused"] += reused
+        if stored:
+            self.logger.info(
+                f"섹션 단위 분석: {doc_key} — 변경 {len(changed)}개, 재사용 {reused}개"
+            )
+        if missing:
+            self.logger.warning(
+                f"응답에 없는 섹션 {len(missing)}개는 다음 실행에서 다시 추출: {doc_key}"
+            )
+
+        analysis = {
+            "concepts": merge_concepts(concepts for _, concepts in sections.values()),
+            "category": category or "미분류",
+            "summary": summary,
+        }
+        if missing:
+            # 문서 단위 캐시(지문 인덱스)에도 저장하지 않도록 표시
+            analysis["incomplete"] = True
+        return analysis
+
+    def _extract_sections(
+        self,
+        sections: list[tuple[str, str]],
+        outline: list[str]
+    ) -> Optional[tuple[dict[str, list[dict]], str, str]]:
+        """섹션별 개념 추출 (num_ctx 예산에 맞춰 섹션을 묶어 요청)
+
+        Returns:
+            ({섹션 키: 개념 목록}, 카테고리, 요약) 또는 실패 시 None
+        """
+        if not sections:
+            return {}, "", ""
+
+        outline_text = "\n".join(f"- {key or '(서문)'}" for key in outline)
+        budget = available_tokens(
+            self.config.llm.num_ctx,
+            self.prompts["system"]
+            + self.prompts["section_concept_extraction"]
+            + outline_text,
+            self.config.analysis.response_reserve_tokens,
+        )
+        groups = pack_by_budget(
+            enumerate(sections),
+            lambda item: self._format_section(*item),
+            budget
+        )
+
+        concepts_by_section: dict[str, list[dict]] = {}
+        category = summary = ""
+        for group in groups:
+            prompt = self.get_prompt(
+                "section_concept_extraction",
+                outline=outline_text,
+                sections="".join(self._format_section(i, unit) for i, unit in group)
+            )
+            try:
+                result = self.invoke_llm_json(prompt)
+            except Exception as e:
+                self.logger.warning(f"섹션 분석 실패: {e}")
+                return None
+
+            keys = {i + 1: key for i, (key, _) in group}
+            for item in result.get("sections", []):
+                if not isinstance(item, dict):
+                    continue
+                try:
+                    key = keys.get(int(item.get("id")))
+                except (TypeError, ValueError):
+                    continue
+                if key is not None and isinstance(item.get("concepts"), list):
+                    concepts_by_section[key] = item["concepts"]
+
+            category = category or result.get("category", "")
+            summary = summary or result.get("summary", "")
+
+        return concepts_by_section, category, summary
+
+    def _format_section(self, index: int, unit: tuple[str, str]) -> str:
+        """섹션 프롬프트 항목 (id는 1부터)"""
+        return f"### id: {index + 1}\n{unit[1][:self.chunker.max_size]}\n\n"
+
+    def _analyze_with_llm(
+        self,
+        content: str,
+        keywords: Optional[list[tuple[str, float]]] = None
+    ) -> dict:
+        """LLM으로 개념 추출 (실패하면 키워드 폴백)"""
+        prompt = self.get_prompt(
+            "concept_extraction", content=content[:self.chunker.max_size]
+        )
 
         try:
             result = self.invoke_llm_json(prompt)
             return result
         except Exception as e:
             self.logger.warning(f"LLM 분석 실패: {e}")
-            return self._fallback_analysis(content)
+            return self._fallback_analysis(content, keywords)
 
     def _extract_metadata(self, doc) -> dict:
         """메타데이터 추출"""
@@ -158,10 +582,31 @@ class ResearchAgent(BaseAgent):
             "links": doc.metadata.get("links", []) if hasattr(doc, 'metadata') else []
         }
 
-    def _fallback_analysis(self, content: str) -> dict:
-        """폴백 분석 (LLM 실패 시)"""
+    @staticmethod
+    def _keyword_analysis(content: str, keywords: list[tuple[str, float]]) -> dict:
+        """BM25 키워드 기반 로컬 분석 (카테고리는 Analyst가 결정)"""
+        return {
+            "concepts": keyword_concepts(keywords),
+            "category": "",
+            "summary": " ".join(content.split())[:100],
+        }
+
+    def _fallback_analysis(
+        self,
+        content: str,
+        keywords: Optional[list[tuple[str, float]]] = None
+    ) -> dict:
+        """폴백 분석 (LLM 실패 시, 코퍼스 키워드가 없으면 단어 빈도)"""
         import re
 
+        if keywords:
+            return {
+                "concepts": keyword_concepts(keywords),
+                "category": "미분류",
+                "summary": content[:100],
+                "fallback": True
+            }
+
         # 간단한 키워드 추출
         words = re.findall(r'[가-힣]{2,}|[a-zA-Z]{4,}', content)
         word_freq = {}
@@ -182,5 +627,6 @@ class ResearchAgent(BaseAgent):
                 for word, freq in top_words if freq >= 2
             ],
             "category": "미분류",
-            "summary": content[:100]
+            "summary": content[:100],
+            "fallback": True
         }
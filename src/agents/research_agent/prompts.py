@@ -26,6 +26,37 @@ PROMPTS = {
   "category": "적절한 카테고리 (예: 프로그래밍, AI, 비즈니스)",
   "summary": "문서 요약 (1-2문장)"
 }}
+```""",
+
+    "section_concept_extraction": """다음 문서의 섹션별 핵심 개념을 추출하세요.
+
+## 문서 목차
+{outline}
+
+## 분석할 섹션
+{sections}
+## 추출 기준
+1. 개념 (Concept): 섹션의 핵심 아이디어, 주제, 키워드
+2. 타입 분류:
+   - keyword: 단순 키워드 (예: Python, API)
+   - idea: 추상적 개념 (예: 마이크로서비스 아키텍처)
+   - entity: 구체적 엔티티 (예: OpenAI, LangChain)
+
+## 응답 형식 (JSON)
+모든 섹션 id에 대해 하나씩 응답하세요. 요약은 목차를 참고해 문서 전체에 대해 작성하세요.
+```json
+{{
+  "sections": [
+    {{
+      "id": 1,
+      "concepts": [
+        {{"name": "개념명", "type": "keyword|idea|entity", "confidence": 0.8}}
+      ]
+    }}
+  ],
+  "category": "적절한 카테고리 (예: 프로그래밍, AI, 비즈니스)",
+  "summary": "문서 요약 (1-2문장)"
+}}
 ```""",
 
     "metadata_extraction": """다음 문서에서 메타데이터를 추출하세요.
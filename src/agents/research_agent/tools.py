@@ -3,6 +3,8 @@
 from pathlib import Path
 from typing import Optional
 
+from src.core.config import get_config
+from src.tools.analysis import DocumentFingerprintIndex, KeywordIndex, SectionCache
 from src.tools.parsers import DocumentParserTool, ParsedDocument
 
 
@@ -48,6 +50,56 @@ class ResearchTools:
 
         return sorted(files)
 
+    def open_fingerprint_index(
+        self, output_file: str
+    ) -> Optional[DocumentFingerprintIndex]:
+        """문서 지문 인덱스 열기 (출력 파일 옆 .fingerprints.db, 비활성화면 None)
+
+        Args:
+            output_file: 출력 Cypher 파일 경로
+        """
+        config = get_config().dedup
+        if not config.enabled:
+            return None
+
+        output_path = Path(output_file)
+        return DocumentFingerprintIndex(
+            output_path.with_name(output_path.name + ".fingerprints.db"),
+            threshold=config.threshold,
+            num_perm=config.num_perm,
+            bands=config.bands,
+            shingle_size=config.shingle_size,
+        )
+
+    def open_section_cache(self, output_file: str) -> Optional[SectionCache]:
+        """섹션 캐시 열기 (출력 파일 옆 .sections.db, 비활성화면 None)
+
+        Args:
+            output_file: 출력 Cypher 파일 경로
+        """
+        if not get_config().processing.incremental_sections:
+            return None
+
+        output_path = Path(output_file)
+        return SectionCache(output_path.with_name(output_path.name + ".sections.db"))
+
+    def open_keyword_index(self, output_file: str) -> Optional[KeywordIndex]:
+        """키워드 인덱스 열기 (출력 파일 옆 .keywords.db, 비활성화면 None)
+
+        Args:
+            output_file: 출력 Cypher 파일 경로
+        """
+        config = get_config().processing
+        if not config.keyword_index:
+            return None
+
+        output_path = Path(output_file)
+        return KeywordIndex(
+            output_path.with_name(output_path.name + ".keywords.db"),
+            k1=config.bm25_k1,
+            b=config.bm25_b,
+        )
+
     def parse_file(self, file_path: str) -> ParsedDocument:
         """파일 파싱
 
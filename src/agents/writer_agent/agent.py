@@ -3,7 +3,8 @@
 from typing import Optional
 
 from src.core.base_agent import BaseAgent
-from src.tools.cypher import CypherManager
+from src.core.exceptions import ExportError
+from src.tools.cypher import CypherManager, GraphNode, GraphRelationship
 from src.agents.writer_agent.tools import WriterTools
 from src.agents.writer_agent.prompts import PROMPTS
 
@@ -61,47 +62,65 @@ class WriterAgent(BaseAgent):
         if not cypher_manager:
             cypher_manager = self.tools.get_cypher_manager(output_file)
 
-        existing_concepts = existing_graph.get("concepts", [])
-
         queries = []
-        new_node_count = 0
-        new_rel_count = 0
+        new_nodes = []
+        new_rels = []
 
         # 1. 문서별 노드/관계 생성
         for doc in categorized_docs:
             doc_queries, nodes, rels = self._process_document(
-                doc, existing_concepts, metadata, cypher_manager
+                doc, metadata, cypher_manager
             )
             queries.extend(doc_queries)
-            new_node_count += nodes
-            new_rel_count += rels
-
-            # 기존 개념 목록 업데이트
-            for concept in doc.get("analysis", {}).get("concepts", []):
-                name = concept.get("name", "")
-                if name and name not in existing_concepts:
-                    existing_concepts.append(name)
+            new_nodes.extend(nodes)
+            new_rels.extend(rels)
 
         # 2. 분석된 관계 쿼리 생성
-        rel_queries = self._process_relationships(
+        rel_queries, rels = self._process_relationships(
             relationships, cypher_manager
         )
         queries.extend(rel_queries)
-        new_rel_count += len(rel_queries)
+        new_rels.extend(rels)
 
         # 3. 쿼리 저장
+        # graph.cypher/스냅샷은 다음 실행의 로컬 상태이므로 항상 기록하고,
+        # 설정의 neo4j.sink.mode가 bolt/both면 같은 노드/관계를 Neo4j에도 기록
+        sink_mode = self.tools.get_sink_mode()
+        bolt_stats = None
+        bolt_error = None
+
         if queries:
             self.tools.append_queries(queries, cypher_manager)
             self.logger.info(f"쿼리 저장 완료: {len(queries)}개")
 
+            # 다음 실행에서 재파싱을 건너뛰도록 스냅샷 갱신
+            try:
+                self.tools.save_snapshot(cypher_manager)
+            except Exception as e:
+                self.logger.warning(f"스냅샷 저장 실패: {e}")
+
+        if queries and sink_mode in ("bolt", "both"):
+            try:
+                bolt_stats = self.tools.write_to_neo4j(
+                    new_nodes, new_rels, cypher_manager
+                )
+            except ExportError as e:
+                bolt_error = str(e)
+                self.logger.error(f"Neo4j 기록 실패: {e}")
+
         result = {
-            "success": True,
+            "success": bolt_error is None,
             "output_file": str(cypher_manager.output_path),
+            "sink": sink_mode,
             "processed_docs": len(categorized_docs),
-            "new_nodes": new_node_count,
-            "new_relationships": new_rel_count,
+            "new_nodes": len(new_nodes),
+            "new_relationships": len(new_rels),
             "total_queries": len(queries)
         }
+        if bolt_stats is not None:
+            result["bolt"] = bolt_stats
+        if bolt_error is not None:
+            result["error"] = bolt_error
 
         self.logger.info(f"완료: {result}")
 
@@ -113,27 +132,60 @@ class WriterAgent(BaseAgent):
     def _process_document(
         self,
         doc: dict,
-        existing_concepts: list[str],
         metadata: dict,
         manager: CypherManager
-    ) -> tuple[list[str], int, int]:
-        """단일 문서 처리"""
+    ) -> tuple[list[str], list[GraphNode], list[GraphRelationship]]:
+        """단일 문서 처리
+
+        Returns:
+            (쿼리, 새 노드, 새 관계) — 쿼리와 같은 내용의 객체를 함께 반환
+        """
         queries = []
-        node_count = 0
-        rel_count = 0
+        nodes = []
+        rels = []
 
         analysis = doc.get("analysis", {})
 
-        # 1. Thought 노드
+        # 1. Thought 노드 (입력 디렉토리 기준 상대 경로로 식별)
+        source_key = doc.get("source_key") or doc.get("file_name", "")
         thought_node, thought_query = self.tools.create_thought_node(
             title=doc.get("title", "Untitled"),
-            content=doc.get("content", "")[:500],
-            source_file=doc.get("file_name", ""),
+            content=doc.get("content", ""),
+            source_file=source_key,
             manager=manager
         )
+
+        # 같은 ID의 Thought가 내용까지 같으면 변경 없음 → 건너뜀
+        if not thought_query:
+            self.logger.info(f"변경 없음, 건너뜀: {source_key}")
+            return queries, nodes, rels
+
         queries.append(thought_query)
         manager.state.add_node(thought_node)
-        node_count += 1
+        nodes.append(thought_node)
+
+        # 거의 같은 문서면 원본 Thought와 SIMILAR_TO 관계
+        duplicate_of = doc.get("duplicate_of")
+        if duplicate_of:
+            original_key = (
+                duplicate_of.get("source_key") or duplicate_of.get("file_name", "")
+            )
+            original_id = manager.generate_node_id(
+                "Thought", manager.thought_key(original_key)
+            )
+            if manager.state.has_node(original_id):
+                rel, rel_query = self.tools.create_relationship(
+                    thought_node.id, original_id, "SIMILAR_TO",
+                    {
+                        "similarity": duplicate_of.get("similarity", 0.0),
+                        "method": duplicate_of.get("method", "minhash")
+                    },
+                    manager
+                )
+                if rel_query:
+                    manager.state.add_relationship(rel)
+                    queries.append(rel_query)
+                    rels.append(rel)
 
         # 2. Category 노드 및 BELONGS_TO 관계
         category = doc.get("final_category", "")
@@ -144,13 +196,15 @@ class WriterAgent(BaseAgent):
             if cat_query:
                 queries.append(cat_query)
                 manager.state.add_node(cat_node)
-                node_count += 1
+                nodes.append(cat_node)
 
-            _, rel_query = self.tools.create_relationship(
+            rel, rel_query = self.tools.create_relationship(
                 thought_node.id, cat_node.id, "BELONGS_TO", {}, manager
             )
-            queries.append(rel_query)
-            rel_count += 1
+            if rel_query:
+                manager.state.add_relationship(rel)
+                queries.append(rel_query)
+                rels.append(rel)
 
         # 3. Date 노드 및 CREATED_ON 관계
         dates = metadata.get("dates", []) or doc.get("metadata", {}).get("dates", [])
@@ -160,13 +214,15 @@ class WriterAgent(BaseAgent):
             if date_query:
                 queries.append(date_query)
                 manager.state.add_node(date_node)
-                node_count += 1
+                nodes.append(date_node)
 
-            _, rel_query = self.tools.create_relationship(
+            rel, rel_query = self.tools.create_relationship(
                 thought_node.id, date_node.id, "CREATED_ON", {}, manager
             )
-            queries.append(rel_query)
-            rel_count += 1
+            if rel_query:
+                manager.state.add_relationship(rel)
+                queries.append(rel_query)
+                rels.append(rel)
 
         # 4. Tag 노드 및 HAS_TAG 관계
         tags = metadata.get("tags", []) or doc.get("metadata", {}).get("tags", [])
@@ -175,13 +231,15 @@ class WriterAgent(BaseAgent):
             if tag_query:
                 queries.append(tag_query)
                 manager.state.add_node(tag_node)
-                node_count += 1
+                nodes.append(tag_node)
 
-            _, rel_query = self.tools.create_relationship(
+            rel, rel_query = self.tools.create_relationship(
                 thought_node.id, tag_node.id, "HAS_TAG", {}, manager
             )
-            queries.append(rel_query)
-            rel_count += 1
+            if rel_query:
+                manager.state.add_relationship(rel)
+                queries.append(rel_query)
+                rels.append(rel)
 
         # 5. Concept 노드 및 MENTIONS 관계
         for concept in analysis.get("concepts", []):
@@ -190,9 +248,8 @@ class WriterAgent(BaseAgent):
                 continue
 
             concept_type = concept.get("type", "keyword")
-            is_new = not self.tools.is_concept_exists(
-                concept_name, existing_concepts
-            )
+            # 그래프 상태 인덱스로 중복 확인 (대소문자 무시)
+            is_new = not manager.state.has_concept(concept_name)
 
             concept_node, concept_query = self.tools.create_concept_node(
                 concept_name, concept_type, manager
@@ -201,26 +258,33 @@ class WriterAgent(BaseAgent):
             if concept_query and is_new:
                 queries.append(concept_query)
                 manager.state.add_node(concept_node)
-                node_count += 1
+                nodes.append(concept_node)
 
             # MENTIONS 관계 (GRAPH_SCHEMA.md 스펙)
-            _, rel_query = self.tools.create_relationship(
+            rel, rel_query = self.tools.create_relationship(
                 thought_node.id, concept_node.id, "MENTIONS",
                 {"confidence": concept.get("confidence", 0.8)},
                 manager
             )
-            queries.append(rel_query)
-            rel_count += 1
+            if rel_query:
+                manager.state.add_relationship(rel)
+                queries.append(rel_query)
+                rels.append(rel)
 
-        return queries, node_count, rel_count
+        return queries, nodes, rels
 
     def _process_relationships(
         self,
         relationships: list[dict],
         manager: CypherManager
-    ) -> list[str]:
-        """분석된 관계 처리"""
+    ) -> tuple[list[str], list[GraphRelationship]]:
+        """분석된 관계 처리
+
+        Returns:
+            (쿼리, 새 관계)
+        """
         queries = []
+        rels = []
 
         for rel in relationships:
             source = rel.get("source", "")
@@ -235,11 +299,14 @@ class WriterAgent(BaseAgent):
             target_id = manager.state.get_concept_id(target)
 
             if source_id and target_id:
-                _, query = self.tools.create_relationship(
+                graph_rel, query = self.tools.create_relationship(
                     source_id, target_id, rel_type,
                     {"reason": rel.get("reason", "")},
                     manager
                 )
-                queries.append(query)
+                if query:
+                    manager.state.add_relationship(graph_rel)
+                    queries.append(query)
+                    rels.append(graph_rel)
 
-        return queries
+        return queries, rels
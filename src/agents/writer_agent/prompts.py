@@ -17,15 +17,15 @@ PROMPTS = {
 
 ## 생성 규칙
 1. MERGE 사용 (중복 방지)
-2. 노드 ID는 label_name_timestamp 형식
+2. 노드 ID는 label_해시 형식 (라벨 + 정규화된 이름 기반, 실행마다 동일)
 3. 관계: Thought-[:BELONGS_TO]->Category, Thought-[:MENTIONS]->Concept
 
 ## 응답 형식 (JSON)
 ```json
 {{
   "queries": [
-    "MERGE (n:Thought {{...}})",
-    "MERGE (n:Concept {{...}})",
+    "MERGE (n:Thought {{id: \"...\"}}) SET n += {{...}}",
+    "MERGE (n:Concept {{id: \"...\"}}) SET n += {{...}}",
     "MATCH ... MERGE ...-[:BELONGS_TO]->..."
   ],
   "new_concepts": ["새로 추가된 개념"],
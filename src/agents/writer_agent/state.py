@@ -1,5 +1,6 @@
 """Writer Agent 전용 상태 정의"""
 
+from collections.abc import Mapping
 from typing import TypedDict
 from dataclasses import dataclass, field
 
@@ -29,7 +30,7 @@ class WriterState(TypedDict, total=False):
     # 입력
     categorized_docs: list[dict]
     relationships: list[dict]
-    existing_graph: dict
+    existing_graph: Mapping  # GraphView
 
     # 처리 중
     current_doc: dict
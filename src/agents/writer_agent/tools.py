@@ -3,6 +3,7 @@
 from typing import Optional
 from datetime import datetime
 
+from src.core.config import get_config
 from src.tools.cypher import CypherManager, GraphNode, GraphRelationship
 
 
@@ -27,10 +28,11 @@ class WriterTools:
         title: str,
         content: str,
         source_file: str,
-        manager: CypherManager
+        manager: CypherManager,
+        section: str = ""
     ) -> tuple[GraphNode, str]:
-        """Thought 노드 생성"""
-        return manager.create_thought_node(title, content, source_file)
+        """Thought 노드 생성 (내용이 같으면 빈 쿼리)"""
+        return manager.create_thought_node(title, content, source_file, section)
 
     def create_concept_node(
         self,
@@ -86,17 +88,40 @@ class WriterTools:
         """쿼리 저장"""
         manager.append_queries(queries)
 
+    def save_snapshot(self, manager: CypherManager):
+        """그래프 스냅샷 저장"""
+        manager.save_snapshot()
+
+    def get_sink_mode(self) -> str:
+        """출력 대상 (file / bolt / both)"""
+        return get_config().neo4j.sink_mode
+
+    def write_to_neo4j(
+        self,
+        nodes: list[GraphNode],
+        relationships: list[GraphRelationship],
+        manager: CypherManager
+    ) -> dict:
+        """생성한 노드/관계를 Bolt로 Neo4j에 직접 기록
+
+        Raises:
+            ExportError: neo4j 패키지 없음 / 재시도 후에도 실패
+        """
+        from src.tools.cypher import Neo4jBoltSink
+
+        sink = Neo4jBoltSink.from_config(get_config().neo4j)
+        try:
+            return sink.write(nodes, relationships, manager.state)
+        finally:
+            sink.close()
+
     def is_concept_exists(
         self,
         concept_name: str,
-        existing_concepts: list[str]
+        manager: CypherManager
     ) -> bool:
-        """개념 존재 여부 확인"""
-        concept_lower = concept_name.lower().strip()
-        for existing in existing_concepts:
-            if existing.lower().strip() == concept_lower:
-                return True
-        return False
+        """개념 존재 여부 확인 (그래프 상태의 이름/canonical key 인덱스로 O(1) 조회)"""
+        return manager.state.get_concept_id(concept_name) is not None
 
     def get_today_date(self) -> str:
         """오늘 날짜 반환"""
@@ -19,6 +19,11 @@ from src.core.config import (
     Neo4jConfig,
     PathsConfig,
     ProcessingConfig,
+    GraphConfig,
+    SearchConfig,
+    AnalysisConfig,
+    DedupConfig,
+    ConceptConfig,
     LoggingConfig,
     load_config,
     load_prompts,
@@ -58,6 +63,11 @@ __all__ = [
     "Neo4jConfig",
     "PathsConfig",
     "ProcessingConfig",
+    "GraphConfig",
+    "SearchConfig",
+    "AnalysisConfig",
+    "DedupConfig",
+    "ConceptConfig",
     "LoggingConfig",
     "load_config",
     "load_prompts",
@@ -15,6 +15,7 @@ class LLMConfig:
     default_model: str = "qwen2.5:7b"
     coding_model: str = "qwen2.5-coder:7b"
     fast_model: str = "phi3:mini"
+    embedding_model: str = "bge-m3"
     base_url: str = "http://localhost:11434"
     temperature: float = 0.7
     max_tokens: int = 2048
@@ -31,6 +32,11 @@ class Neo4jConfig:
     database: str = "neo4j"
     export_formats: list[str] = field(default_factory=lambda: ["cypher", "csv", "markdown"])
     output_dir: str = "data/output/neo4j"
+    export_batch_size: int = 1000
+    # Writer 출력 대상: file (graph.cypher만) / bolt (Neo4j에도 기록) / both (bolt와 같음)
+    sink_mode: str = "file"
+    sink_max_in_flight: int = 4
+    sink_max_retries: int = 3
 
 
 @dataclass
@@ -52,6 +58,91 @@ class ProcessingConfig:
     max_concurrent: int = 3
     max_retry_attempts: int = 3
     retry_delay_seconds: int = 1
+    # 마크다운 문서가 수정되면 바뀐 섹션만 다시 분석 (graph.cypher.sections.db)
+    incremental_sections: bool = True
+    # 긴 문서/섹션은 내용 기반 경계로 나눠 청크 단위로 분석 (문자 수)
+    chunk_min_size: int = 1000
+    chunk_avg_size: int = 2000
+    chunk_max_size: int = 3000
+    chunk_max_per_document: int = 50
+    # 코퍼스 BM25 키워드 (graph.cypher.keywords.db): LLM 실패 시 폴백,
+    # 이 길이 이하의 짧은 노트는 LLM 없이 키워드로 분석 (0이면 사용 안 함)
+    keyword_index: bool = True
+    keyword_top_k: int = 10
+    keyword_short_note_chars: int = 300
+    bm25_k1: float = 1.5
+    bm25_b: float = 0.75
+    # 빈 파일/한 줄 메모/링크 모음/헤더뿐인 CSV/같은 내용의 파일은 LLM 없이 로컬 분석
+    triage_enabled: bool = True
+    triage_min_chars: int = 20
+    triage_max_link_ratio: float = 0.8
+
+
+@dataclass
+class SearchConfig:
+    """임베딩 기반 개념 검색 설정"""
+    enabled: bool = True
+    top_k: int = 10
+    # find_similar_concepts 기본 임계값
+    similar_threshold: float = 0.75
+    # 이 이상이면 새 개념을 기존 개념과 같은 것으로 보고 병합
+    duplicate_threshold: float = 0.92
+    embed_batch_size: int = 64
+
+
+@dataclass
+class GraphConfig:
+    """그래프 상태 저장소 설정"""
+    # memory: 프로세스 메모리 (GraphState) / sqlite: 디스크 (SQLiteGraphState)
+    backend: str = "memory"
+    # 비어 있으면 출력 파일 옆 graph.cypher.db
+    sqlite_path: str = ""
+
+
+@dataclass
+class DedupConfig:
+    """거의 같은 문서 감지 설정 (MinHash + LSH)"""
+    enabled: bool = True
+    # 추정 Jaccard 유사도가 이 이상이면 가장 비슷한 문서의 분석 결과를 재사용
+    threshold: float = 0.9
+    num_perm: int = 128
+    bands: int = 16
+    shingle_size: int = 5
+
+
+@dataclass
+class ConceptConfig:
+    """개념 이름 정규화 설정"""
+    # 전각/대소문자/공백/구분 기호 차이만 있는 이름을 같은 개념으로 연결
+    canonicalize: bool = True
+    # 대표 이름: [별칭, ...] (한/영 표기 등)
+    aliases: dict = field(default_factory=dict)
+
+
+@dataclass
+class AnalysisConfig:
+    """Analyst Agent 분석 설정"""
+    # 교차 관계 분석 시 새 개념당 LLM에 보낼 기존 개념 후보 수
+    relationship_candidates: int = 8
+    # 교차 관계 분석 프롬프트 최대 개수 (num_ctx에 맞춰 후보를 묶음)
+    max_relationship_prompts: int = 4
+    # 프롬프트를 나눌 때 응답용으로 남겨 둘 토큰 수
+    response_reserve_tokens: int = 1024
+    # 공동 출현(PMI) 관계: 세 조건을 모두 넘는 쌍만 후보
+    cooccurrence_min_count: int = 2
+    cooccurrence_min_pmi: float = 1.0
+    cooccurrence_min_jaccard: float = 0.1
+    # 상위 N쌍만 LLM으로 관계 타입 확인 (나머지는 RELATED_TO, 0이면 LLM 미사용)
+    cooccurrence_verify_top: int = 30
+    # 동시에 제안된 새 카테고리끼리 같은 것으로 볼 임베딩 유사도
+    category_merge_threshold: float = 0.85
+    # 카테고리 중심 벡터 분류: 아래 조건을 모두 만족하면 LLM 없이 할당
+    centroid_enabled: bool = True
+    centroid_min_score: float = 0.6
+    centroid_margin: float = 0.05
+    centroid_min_documents: int = 3
+    # categorization_batch 프롬프트 하나에 넣을 최대 문서 수 (실제 크기는 num_ctx 예산으로 결정)
+    categorization_batch_size: int = 10
 
 
 @dataclass
@@ -69,6 +160,11 @@ class Config:
     neo4j: Neo4jConfig = field(default_factory=Neo4jConfig)
     paths: PathsConfig = field(default_factory=PathsConfig)
     processing: ProcessingConfig = field(default_factory=ProcessingConfig)
+    graph: GraphConfig = field(default_factory=GraphConfig)
+    search: SearchConfig = field(default_factory=SearchConfig)
+    analysis: AnalysisConfig = field(default_factory=AnalysisConfig)
+    dedup: DedupConfig = field(default_factory=DedupConfig)
+    concepts: ConceptConfig = field(default_factory=ConceptConfig)
     logging: LoggingConfig = field(default_factory=LoggingConfig)
 
 
@@ -83,6 +179,36 @@ def _dict_to_dataclass(data: dict, cls: type) -> Any:
     return cls(**filtered_data)
 
 
+def _flatten_neo4j(data: Optional[dict]) -> Optional[dict]:
+    """neo4j.export / neo4j.sink 하위 설정을 Neo4jConfig 필드명으로 평탄화"""
+    if not data:
+        return data
+
+    flat = {k: v for k, v in data.items() if k not in ('export', 'sink')}
+
+    export = data.get('export')
+    if isinstance(export, dict):
+        if 'formats' in export:
+            flat['export_formats'] = export['formats']
+        if 'output_dir' in export:
+            flat['output_dir'] = export['output_dir']
+        if 'batch_size' in export:
+            flat['export_batch_size'] = export['batch_size']
+
+    sink = data.get('sink')
+    if isinstance(sink, dict):
+        if 'mode' in sink:
+            flat['sink_mode'] = sink['mode']
+        if 'max_in_flight' in sink:
+            flat['sink_max_in_flight'] = sink['max_in_flight']
+        if 'max_retries' in sink:
+            flat['sink_max_retries'] = sink['max_retries']
+    elif isinstance(sink, str):
+        flat['sink_mode'] = sink
+
+    return flat
+
+
 def load_config(config_path: Optional[str] = None) -> Config:
     """설정 파일 로드"""
     if config_path is None:
@@ -103,9 +229,14 @@ def load_config(config_path: Optional[str] = None) -> Config:
 
     config = Config(
         llm=_dict_to_dataclass(data.get('llm'), LLMConfig),
-        neo4j=_dict_to_dataclass(data.get('neo4j'), Neo4jConfig),
+        neo4j=_dict_to_dataclass(_flatten_neo4j(data.get('neo4j')), Neo4jConfig),
         paths=_dict_to_dataclass(data.get('paths'), PathsConfig),
         processing=_dict_to_dataclass(data.get('processing'), ProcessingConfig),
+        graph=_dict_to_dataclass(data.get('graph'), GraphConfig),
+        search=_dict_to_dataclass(data.get('search'), SearchConfig),
+        analysis=_dict_to_dataclass(data.get('analysis'), AnalysisConfig),
+        dedup=_dict_to_dataclass(data.get('dedup'), DedupConfig),
+        concepts=_dict_to_dataclass(data.get('concepts'), ConceptConfig),
         logging=_dict_to_dataclass(data.get('logging'), LoggingConfig),
     )
 
@@ -19,6 +19,7 @@ class LLMManager:
     def __init__(self, config: Optional[LLMConfig] = None):
         self.config = config or get_config().llm
         self._models: dict[str, ChatOllama] = {}
+        self._embedders: dict = {}
 
     def get_model(
         self,
@@ -59,6 +60,28 @@ class LLMManager:
         """빠른 모델 가져오기"""
         return self.get_model(self.config.fast_model)
 
+    def embed(
+        self,
+        texts: list[str],
+        model_name: Optional[str] = None
+    ) -> list[list[float]]:
+        """텍스트 임베딩 (Ollama 임베딩 모델)"""
+        from langchain_ollama import OllamaEmbeddings
+
+        if model_name is None:
+            model_name = self.config.embedding_model
+
+        if model_name not in self._embedders:
+            self._embedders[model_name] = OllamaEmbeddings(
+                model=model_name,
+                base_url=self.config.base_url
+            )
+
+        try:
+            return self._embedders[model_name].embed_documents(texts)
+        except Exception as e:
+            raise LLMConnectionError(f"임베딩 실패 ({model_name}): {e}")
+
     def invoke(
         self,
         prompt: str,
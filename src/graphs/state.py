@@ -1,5 +1,6 @@
 """전역 워크플로우 상태 정의"""
 
+from collections.abc import Mapping
 from typing import TypedDict, Any, Optional
 
 
@@ -20,7 +21,7 @@ class WorkflowState(TypedDict, total=False):
     metadata: dict               # 추출된 메타데이터 (날짜, 태그 등)
 
     # === Analyst Agent 출력 ===
-    existing_graph: dict         # 기존 그래프 상태
+    existing_graph: Mapping      # 기존 그래프 읽기 전용 뷰 (GraphView, 복사본 아님)
     categorized_docs: list[dict] # 카테고리가 할당된 문서들
     relationships: list[dict]    # 분석된 관계들
 
@@ -29,6 +30,7 @@ class WorkflowState(TypedDict, total=False):
     result: dict            # 최종 결과 정보
 
     # === 공통 ===
+    run_stats: dict         # 단계별 처리 통계 (로컬 처리/LLM 호출 수 등)
     errors: list[str]       # 에러 메시지들
     current_step: str       # 현재 실행 중인 단계
 
@@ -57,6 +59,7 @@ def create_initial_state(
         relationships=[],
         queries=[],
         result={},
+        run_stats={},
         errors=[],
         current_step="initialized"
     )
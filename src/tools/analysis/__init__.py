@@ -0,0 +1,52 @@
+"""분석 도구"""
+
+from src.tools.analysis.categories import cluster_categories
+from src.tools.analysis.cooccurrence import (
+    CooccurrencePair,
+    CooccurrenceMiner,
+    cooccurrence_pairs,
+)
+from src.tools.analysis.fingerprint import DocumentFingerprintIndex, MinHasher
+from src.tools.analysis.keywords import KeywordIndex, keyword_concepts, tokenize
+from src.tools.analysis.prompt_budget import (
+    estimate_tokens,
+    available_tokens,
+    pack_by_budget,
+)
+from src.tools.analysis.sections import (
+    PREAMBLE_KEY,
+    SectionCache,
+    chunk_key,
+    merge_concepts,
+    parent_section,
+    section_units,
+)
+from src.tools.analysis.triage import triage_document
+from src.tools.analysis.relationship_finder import (
+    LexicalIndex,
+    RelationshipCandidateFinder,
+)
+
+__all__ = [
+    "cluster_categories",
+    "CooccurrencePair",
+    "CooccurrenceMiner",
+    "cooccurrence_pairs",
+    "DocumentFingerprintIndex",
+    "MinHasher",
+    "KeywordIndex",
+    "keyword_concepts",
+    "tokenize",
+    "estimate_tokens",
+    "available_tokens",
+    "pack_by_budget",
+    "LexicalIndex",
+    "RelationshipCandidateFinder",
+    "PREAMBLE_KEY",
+    "SectionCache",
+    "chunk_key",
+    "merge_concepts",
+    "parent_section",
+    "section_units",
+    "triage_document",
+]
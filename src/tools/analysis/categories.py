@@ -0,0 +1,84 @@
+"""카테고리 이름 정리
+
+문서별로 동시에 제안된 새 카테고리 중 사실상 같은 것
+("AI" / "ai" / "인공지능")을 하나로 묶음.
+"""
+
+from collections import Counter
+from typing import Callable, Iterable, Optional
+
+from src.tools.cypher.manager import normalize_name
+
+
+# (이름 목록) → 이름별 [(가까운 이름, 점수)]
+NeighborFn = Callable[[list[str]], Optional[list[list[tuple[str, float]]]]]
+
+
+class _UnionFind:
+    def __init__(self):
+        self.parent: dict[str, str] = {}
+
+    def find(self, key: str) -> str:
+        self.parent.setdefault(key, key)
+        while self.parent[key] != key:
+            self.parent[key] = self.parent[self.parent[key]]
+            key = self.parent[key]
+        return key
+
+    def union(self, a: str, b: str):
+        self.parent[self.find(a)] = self.find(b)
+
+
+def cluster_categories(
+    proposed: Counter,
+    existing: Iterable[str],
+    neighbors: Optional[NeighborFn] = None
+) -> dict[str, str]:
+    """제안된 카테고리를 묶어 대표 이름으로 매핑
+
+    정규화 이름이 같거나 neighbors가 가깝다고 한 이름끼리 한 묶음.
+    대표는 묶음 안의 기존 카테고리, 없으면 가장 많이 제안된 이름(동률이면 짧은 것).
+
+    Args:
+        proposed: {제안된 카테고리: 제안한 문서 수}
+        existing: 기존 카테고리
+        neighbors: 임베딩 등으로 가까운 이름을 찾는 함수 (없으면 정규화 비교만)
+
+    Returns:
+        {제안된 카테고리: 대표 카테고리}
+    """
+    existing_by_key = {normalize_name(name): name for name in existing}
+    names = [name for name in proposed if name]
+    if not names:
+        return {}
+
+    groups = _UnionFind()
+    if neighbors is not None:
+        hits = neighbors(names)
+        if hits:
+            for name, near in zip(names, hits):
+                for other, _ in near:
+                    groups.union(normalize_name(name), normalize_name(other))
+
+    members: dict[str, list[str]] = {}
+    for name in names:
+        members.setdefault(groups.find(normalize_name(name)), []).append(name)
+    for key, name in existing_by_key.items():
+        root = groups.find(key)
+        if root in members:
+            members[root].append(name)
+
+    mapping = {}
+    for group in members.values():
+        known = [name for name in group if normalize_name(name) in existing_by_key]
+        if known:
+            representative = existing_by_key[normalize_name(known[0])]
+        else:
+            representative = min(
+                group, key=lambda name: (-proposed[name], len(name), name)
+            )
+        for name in group:
+            if name in proposed:
+                mapping[name] = representative
+
+    return mapping
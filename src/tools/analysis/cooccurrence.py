@@ -0,0 +1,230 @@
+"""공동 출현 기반 개념 관계 추출 (LLM 없이)
+
+개념 × 문서 출현 행렬(기존 Thought-[:MENTIONS]->Concept + 이번 실행의 new_concepts)에서
+개념 쌍의 공동 출현 수, PMI, Jaccard를 NumPy로 계산함.
+
+    PMI(a, b)     = log(n_ab · N / (n_a · n_b))
+    Jaccard(a, b) = n_ab / (n_a + n_b − n_ab)
+
+쌍은 문서별 개념 인덱스를 정렬한 뒤 (a, b) → a·C + b 로 인코딩해
+np.unique 한 번으로 셈 (밀집 C×C 행렬을 만들지 않음).
+"""
+
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+import numpy as np
+
+from src.tools.cypher.manager import normalize_name
+
+
+@dataclass
+class CooccurrencePair:
+    """공동 출현 개념 쌍"""
+    source: str
+    target: str
+    count: int
+    pmi: float
+    jaccard: float
+
+    def reason(self) -> str:
+        return f"공동 출현 {self.count}회 (PMI {self.pmi:.2f}, Jaccard {self.jaccard:.2f})"
+
+
+def cooccurrence_pairs(
+    doc_index: np.ndarray,
+    concept_index: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """출현 목록 (문서, 개념)에서 개념 쌍별 공동 출현 수
+
+    Args:
+        doc_index: 출현별 문서 인덱스
+        concept_index: 출현별 개념 인덱스
+
+    Returns:
+        (a, b, count) — a < b
+    """
+    if doc_index.size == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty, empty
+
+    # (문서, 개념) 중복 제거 + 문서 → 개념 순 정렬
+    num_concepts = int(concept_index.max()) + 1
+    entries = np.unique(doc_index.astype(np.int64) * num_concepts + concept_index)
+    docs = entries // num_concepts
+    concepts = entries % num_concepts
+
+    # 각 출현 위치 p에 대해 같은 문서의 뒤쪽 출현 p+1..end-1 과 짝지음
+    _, sizes = np.unique(docs, return_counts=True)
+    ends = np.repeat(np.cumsum(sizes), sizes)
+    positions = np.arange(docs.size)
+    partners = ends - positions - 1
+
+    total = int(partners.sum())
+    if total == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty, empty
+
+    left = np.repeat(positions, partners)
+    starts = np.repeat(np.cumsum(partners) - partners, partners)
+    right = left + 1 + (np.arange(total) - starts)
+
+    codes, counts = np.unique(
+        concepts[left] * num_concepts + concepts[right], return_counts=True
+    )
+    return codes // num_concepts, codes % num_concepts, counts
+
+
+class CooccurrenceMiner:
+    """공동 출현 / PMI 관계 후보 추출
+
+    사용법:
+        miner = CooccurrenceMiner(min_count=2, min_pmi=1.0)
+        pairs = miner.mine(state, new_concepts)
+    """
+
+    def __init__(
+        self,
+        min_count: int = 2,
+        min_pmi: float = 1.0,
+        min_jaccard: float = 0.1
+    ):
+        self.min_count = min_count
+        self.min_pmi = min_pmi
+        self.min_jaccard = min_jaccard
+
+    def build_incidence(
+        self,
+        state,
+        new_concepts: list[dict]
+    ) -> tuple[list[str], np.ndarray, np.ndarray, int]:
+        """개념 × 문서 출현 목록
+
+        이번 실행에서 다시 처리한 파일의 기존 Thought는 새 문서로 대체함.
+
+        Returns:
+            (개념 이름, 문서 인덱스, 개념 인덱스, 문서 수)
+        """
+        names: list[str] = []
+        concept_ids: dict[str, int] = {}
+        docs: list[int] = []
+        concepts: list[int] = []
+
+        def concept_index(name: str) -> int:
+            key = normalize_name(name)
+            if key not in concept_ids:
+                concept_ids[key] = len(names)
+                names.append(name)
+            return concept_ids[key]
+
+        new_docs: dict[str, int] = {}
+        for concept in new_concepts:
+            name = concept.get("name", "")
+            if not name:
+                continue
+            source = concept.get("source_file", "")
+            doc = new_docs.setdefault(source, len(new_docs))
+            docs.append(doc)
+            concepts.append(concept_index(name))
+
+        num_docs = len(new_docs)
+        for thought_id in state.get_node_ids("Thought"):
+            node = state.nodes.get(thought_id)
+            if node is None or node.properties.get("source") in new_docs:
+                continue
+
+            mentioned = state.get_neighbors(thought_id, "out", "MENTIONS")
+            added = False
+            for concept_id in mentioned:
+                concept_node = state.nodes.get(concept_id)
+                if concept_node is None or concept_node.label != "Concept":
+                    continue
+                docs.append(num_docs)
+                concepts.append(concept_index(concept_node.properties.get("name", "")))
+                added = True
+            if added:
+                num_docs += 1
+
+        return (
+            names,
+            np.asarray(docs, dtype=np.int64),
+            np.asarray(concepts, dtype=np.int64),
+            num_docs,
+        )
+
+    def mine(
+        self,
+        state,
+        new_concepts: list[dict],
+        exclude: Optional[Iterable[tuple[str, str]]] = None
+    ) -> list[CooccurrencePair]:
+        """새 개념이 포함된 쌍 중 임계값을 넘는 것 (점수 높은 순)
+
+        Args:
+            state: GraphState / SQLiteGraphState
+            new_concepts: Research Agent의 new_concepts
+            exclude: 이미 찾은 (source, target) 쌍 (방향 무관)
+
+        Returns:
+            CooccurrencePair 목록 (PMI × Jaccard 내림차순)
+        """
+        names, doc_index, concept_index, num_docs = self.build_incidence(
+            state, new_concepts
+        )
+        left, right, counts = cooccurrence_pairs(doc_index, concept_index)
+        if counts.size == 0:
+            return []
+
+        # 개념별 문서 빈도
+        entries = np.unique(doc_index * len(names) + concept_index)
+        df = np.bincount(entries % len(names), minlength=len(names))
+
+        pmi = np.log(counts * num_docs / (df[left] * df[right]))
+        jaccard = counts / (df[left] + df[right] - counts)
+
+        new_keys = {normalize_name(c.get("name", "")) for c in new_concepts}
+        is_new = np.array([normalize_name(name) in new_keys for name in names])
+
+        keep = (
+            (counts >= self.min_count)
+            & (pmi >= self.min_pmi)
+            & (jaccard >= self.min_jaccard)
+            & (is_new[left] | is_new[right])
+        )
+        order = np.flatnonzero(keep)
+        order = order[np.argsort(-(pmi[order] * jaccard[order]), kind="stable")]
+
+        seen = {
+            frozenset((normalize_name(a), normalize_name(b)))
+            for a, b in (exclude or [])
+        }
+
+        pairs = []
+        for i in order:
+            source, target = names[left[i]], names[right[i]]
+            if not is_new[left[i]]:
+                source, target = target, source
+            if frozenset((normalize_name(source), normalize_name(target))) in seen:
+                continue
+            if self._linked(state, source, target):
+                continue
+            pairs.append(CooccurrencePair(
+                source=source,
+                target=target,
+                count=int(counts[i]),
+                pmi=float(pmi[i]),
+                jaccard=float(jaccard[i]),
+            ))
+        return pairs
+
+    @staticmethod
+    def _linked(state, source: str, target: str) -> bool:
+        """그래프에 이미 두 개념 사이 관계가 있는지"""
+        source_id = state.get_concept_id(source)
+        target_id = state.get_concept_id(target)
+        if source_id is None or target_id is None:
+            return False
+        return (
+            target_id in state.get_neighbors(source_id, "out")
+            or source_id in state.get_neighbors(target_id, "out")
+        )
@@ -0,0 +1,260 @@
+"""문서 지문 (MinHash + LSH)
+
+거의 같은 문서(복사한 템플릿, 한 줄만 바뀐 데일리 노트 등)를 찾아
+이전 분석 결과를 재사용하기 위한 인덱스.
+
+    - 지문: 정규화한 본문의 문자 k-shingle → 32bit 해시 → MinHash 서명 (num_perm개)
+    - 유사도: 서명이 일치하는 비율 ≈ shingle 집합의 Jaccard 유사도
+    - LSH: 서명을 bands개 구간으로 나눠 구간 해시가 하나라도 같은 문서만 후보로 비교
+
+인덱스는 SQLite 파일 하나에 문서별 서명/분석 결과와 LSH 버킷을 저장하므로
+실행 간에 유지됨 (graph.cypher.fingerprints.db).
+"""
+
+import sqlite3
+import unicodedata
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+import numpy as np
+import orjson
+import xxhash
+
+
+# 2^31 − 1 (a·x + b 가 uint64 안에서 넘치지 않도록 31bit 범위 사용)
+_PRIME = (1 << 31) - 1
+_CHUNK = 4096
+
+
+class MinHasher:
+    """문자 shingle MinHash
+
+    사용법:
+        hasher = MinHasher(num_perm=128, shingle_size=5)
+        similarity = MinHasher.similarity(hasher.signature(a), hasher.signature(b))
+    """
+
+    def __init__(self, num_perm: int = 128, shingle_size: int = 5, seed: int = 1):
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.seed = seed
+
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, _PRIME, num_perm, dtype=np.uint64)[:, None]
+        self._b = rng.integers(0, _PRIME, num_perm, dtype=np.uint64)[:, None]
+
+    def shingle_hashes(self, text: str) -> np.ndarray:
+        """정규화한 본문의 문자 shingle 해시 (중복 제거)"""
+        normalized = " ".join(unicodedata.normalize("NFKC", text).casefold().split())
+        k = self.shingle_size
+        if len(normalized) <= k:
+            shingles = {normalized}
+        else:
+            shingles = {normalized[i:i + k] for i in range(len(normalized) - k + 1)}
+
+        return np.fromiter(
+            (xxhash.xxh32_intdigest(shingle) for shingle in shingles),
+            dtype=np.uint64,
+            count=len(shingles)
+        ) % _PRIME
+
+    def signature(self, text: str) -> np.ndarray:
+        """MinHash 서명 (uint32[num_perm])"""
+        hashes = self.shingle_hashes(text)
+        signature = np.full(self.num_perm, _PRIME, dtype=np.uint64)
+        for start in range(0, hashes.size, _CHUNK):
+            chunk = hashes[None, start:start + _CHUNK]
+            permuted = (self._a * chunk + self._b) % _PRIME
+            np.minimum(signature, permuted.min(axis=1), out=signature)
+        return signature.astype(np.uint32)
+
+    @staticmethod
+    def similarity(a: np.ndarray, b: np.ndarray) -> float:
+        """추정 Jaccard 유사도"""
+        return float(np.mean(a == b))
+
+
+class DocumentFingerprintIndex:
+    """문서 지문 + 분석 결과 캐시 (SQLite)
+
+    사용법:
+        index = DocumentFingerprintIndex("data/output/graph.cypher.fingerprints.db")
+        signature = index.signature(content)
+        match = index.query(signature, exclude={"note.md"})   # (문서 키, 유사도) 또는 None
+        index.add("note.md", content_hash, signature, analysis)
+        index.close()
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        threshold: float = 0.9,
+        num_perm: int = 128,
+        bands: int = 16,
+        shingle_size: int = 5
+    ):
+        """초기화
+
+        Args:
+            path: SQLite 파일 경로
+            threshold: 이 유사도 이상이면 거의 같은 문서
+            num_perm: MinHash 서명 길이 (bands로 나누어떨어져야 함)
+            bands: LSH 구간 수 (많을수록 낮은 유사도까지 후보로 잡힘)
+            shingle_size: 문자 shingle 길이
+        """
+        if num_perm % bands:
+            raise ValueError(f"num_perm({num_perm})은 bands({bands})로 나누어떨어져야 합니다")
+
+        self.path = Path(path)
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.hasher = MinHasher(num_perm=num_perm, shingle_size=shingle_size)
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS documents (
+                doc_key TEXT PRIMARY KEY,
+                content_hash TEXT NOT NULL,
+                signature BLOB NOT NULL,
+                analysis BLOB NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS bands (
+                band INTEGER NOT NULL,
+                bucket INTEGER NOT NULL,
+                doc_key TEXT NOT NULL,
+                PRIMARY KEY (band, bucket, doc_key)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS bands_doc_key ON bands (doc_key);
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+        """)
+        self._check_params()
+
+    def _check_params(self):
+        """서명 파라미터가 바뀌면 기존 지문은 비교할 수 없으므로 비움"""
+        hasher = self.hasher
+        params = f"{hasher.num_perm}/{self.bands}/{hasher.shingle_size}/{hasher.seed}"
+        row = self._conn.execute(
+            "SELECT value FROM meta WHERE key = 'params'"
+        ).fetchone()
+        if row is not None and row[0] == params:
+            return
+
+        with self._conn:
+            self._conn.execute("DELETE FROM documents")
+            self._conn.execute("DELETE FROM bands")
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('params', ?)",
+                (params,),
+            )
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+
+    def close(self):
+        self._conn.commit()
+        self._conn.close()
+
+    def signature(self, text: str) -> np.ndarray:
+        return self.hasher.signature(text)
+
+    def _band_keys(self, signature: np.ndarray) -> list[int]:
+        """구간별 버킷 키 (SQLite 정수 범위에 맞게 63bit)"""
+        return [
+            xxhash.xxh64_intdigest(signature[start:start + self.rows].tobytes()) >> 1
+            for start in range(0, self.bands * self.rows, self.rows)
+        ]
+
+    def cached_analysis(self, doc_key: str, content_hash: str) -> Optional[dict]:
+        """같은 문서가 내용까지 같으면 저장된 분석 결과"""
+        row = self._conn.execute(
+            "SELECT content_hash, analysis FROM documents WHERE doc_key = ?", (doc_key,)
+        ).fetchone()
+        if row is None or row[0] != content_hash:
+            return None
+        return orjson.loads(row[1])
+
+    def analysis(self, doc_key: str) -> Optional[dict]:
+        """저장된 분석 결과"""
+        row = self._conn.execute(
+            "SELECT analysis FROM documents WHERE doc_key = ?", (doc_key,)
+        ).fetchone()
+        return orjson.loads(row[0]) if row is not None else None
+
+    def query(
+        self,
+        signature: np.ndarray,
+        exclude: Iterable[str] = ()
+    ) -> Optional[tuple[str, float]]:
+        """가장 비슷한 문서 (임계값 미만이면 None)
+
+        Args:
+            signature: MinHash 서명
+            exclude: 제외할 문서 키 (보통 자기 자신)
+
+        Returns:
+            (문서 키, 추정 유사도) 또는 None
+        """
+        excluded = set(exclude)
+        candidates = set()
+        for band, bucket in enumerate(self._band_keys(signature)):
+            rows = self._conn.execute(
+                "SELECT doc_key FROM bands WHERE band = ? AND bucket = ?",
+                (band, bucket),
+            )
+            candidates.update(key for (key,) in rows if key not in excluded)
+
+        if not candidates:
+            return None
+
+        keys = sorted(candidates)
+        signatures = []
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            rows = dict(self._conn.execute(
+                f"SELECT doc_key, signature FROM documents "
+                f"WHERE doc_key IN ({','.join('?' * len(chunk))})",
+                chunk
+            ).fetchall())
+            signatures.extend(
+                np.frombuffer(rows[key], dtype=np.uint32) for key in chunk
+            )
+
+        scores = (np.stack(signatures) == signature[None, :]).mean(axis=1)
+        best = int(np.argmax(scores))
+        if scores[best] < self.threshold:
+            return None
+        return keys[best], float(scores[best])
+
+    def add(
+        self,
+        doc_key: str,
+        content_hash: str,
+        signature: np.ndarray,
+        analysis: dict
+    ):
+        """문서 지문/분석 결과 저장 (같은 키는 교체)"""
+        with self._conn:
+            self._conn.execute("DELETE FROM bands WHERE doc_key = ?", (doc_key,))
+            self._conn.execute(
+                "INSERT OR REPLACE INTO documents "
+                "(doc_key, content_hash, signature, analysis) VALUES (?, ?, ?, ?)",
+                (
+                    doc_key,
+                    content_hash,
+                    signature.astype(np.uint32).tobytes(),
+                    orjson.dumps(analysis),
+                ),
+            )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO bands (band, bucket, doc_key) VALUES (?, ?, ?)",
+                [
+                    (band, bucket, doc_key)
+                    for band, bucket in enumerate(self._band_keys(signature))
+                ],
+            )
@@ -0,0 +1,224 @@
+"""코퍼스 키워드 추출 (BM25)
+
+문서 하나의 단어 빈도만 보면 "오늘", "그리고" 같은 흔한 단어가 위로 올라옴.
+여기서는 코퍼스 전체의 문서 빈도(df)를 유지하고 BM25로 점수를 매김.
+
+    score(t, d) = idf(t) · tf·(k1 + 1) / (tf + k1·(1 − b + b·|d|/avgdl))
+    idf(t)      = ln(1 + (N − df + 0.5) / (df + 0.5))
+
+문서별 용어 집합과 길이를 SQLite에 저장하므로 증분 실행에서도 df가 유지되고,
+다시 들어온 문서는 이전 기여분을 빼고 새로 반영함 (graph.cypher.keywords.db).
+점수 계산은 실행 단위로 모든 문서의 (문서, 용어, tf) 배열을 만들어 한 번에 처리함.
+"""
+
+import re
+import sqlite3
+from pathlib import Path
+from typing import Union
+
+import numpy as np
+
+
+_TOKEN = re.compile(r'[가-힣]{2,}|[a-zA-Z]{4,}')
+
+# 명사 뒤에 자주 붙는 조사 (긴 것부터 검사)
+_JOSA = sorted(
+    ["으로", "에서", "에게", "까지", "부터", "처럼", "보다", "이다", "하고",
+     "은", "는", "이", "가", "을", "를", "의", "에", "와", "과", "로", "도", "만"],
+    key=len,
+    reverse=True
+)
+
+# 서술어 어미 (개념이 아니므로 제외)
+_VERB_ENDINGS = ("했다", "었다", "았다", "였다", "한다", "된다", "하다", "있다", "없다", "니다", "해서", "하는")
+
+# 문서 내 최고 점수의 이 비율 미만인 키워드는 버림 (모든 문서에 나오는 "오늘" 등)
+_MIN_SCORE_RATIO = 0.25
+
+
+def tokenize(text: str) -> list[str]:
+    """키워드 후보 토큰 (한글 2자 이상, 영문 4자 이상, 조사 제거, 서술어 제외, 소문자)"""
+    tokens = []
+    for word in _TOKEN.findall(text):
+        if "가" <= word[0] <= "힣":
+            if word.endswith(_VERB_ENDINGS):
+                continue
+            for josa in _JOSA:
+                if word.endswith(josa) and len(word) - len(josa) >= 2:
+                    word = word[:-len(josa)]
+                    break
+        tokens.append(word.lower())
+    return tokens
+
+
+class KeywordIndex:
+    """문서 빈도 저장 + BM25 키워드 추출
+
+    사용법:
+        index = KeywordIndex("data/output/graph.cypher.keywords.db")
+        index.update({"note.md": content, ...})       # df 갱신 (실행마다 한 번)
+        keywords = index.extract({"note.md": content, ...}, top_k=10)
+        # {"note.md": [("langgraph", 3.2), ...]}
+        index.close()
+    """
+
+    def __init__(self, path: Union[str, Path], k1: float = 1.5, b: float = 0.75):
+        self.path = Path(path)
+        self.k1 = k1
+        self.b = b
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS documents (
+                doc_key TEXT PRIMARY KEY,
+                length INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS terms (
+                doc_key TEXT NOT NULL,
+                term TEXT NOT NULL,
+                PRIMARY KEY (doc_key, term)
+            ) WITHOUT ROWID;
+        """)
+
+        self._df: dict[str, int] = dict(
+            self._conn.execute("SELECT term, COUNT(*) FROM terms GROUP BY term")
+        )
+        self._documents, self._total_length = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(length), 0) FROM documents"
+        ).fetchone()
+
+    def __len__(self) -> int:
+        return self._documents
+
+    def close(self):
+        self._conn.commit()
+        self._conn.close()
+
+    def document_frequency(self, term: str) -> int:
+        return self._df.get(term, 0)
+
+    def update(self, documents: dict[str, str]):
+        """문서 빈도 갱신 (같은 키는 이전 기여분을 빼고 교체)
+
+        Args:
+            documents: {문서 키: 본문}
+        """
+        if not documents:
+            return
+
+        with self._conn:
+            for doc_key, text in documents.items():
+                tokens = tokenize(text)
+                terms = set(tokens)
+
+                row = self._conn.execute(
+                    "SELECT length FROM documents WHERE doc_key = ?", (doc_key,)
+                ).fetchone()
+                if row is not None:
+                    self._documents -= 1
+                    self._total_length -= row[0]
+                    for (term,) in self._conn.execute(
+                        "SELECT term FROM terms WHERE doc_key = ?", (doc_key,)
+                    ).fetchall():
+                        self._df[term] -= 1
+                        if self._df[term] <= 0:
+                            del self._df[term]
+                    self._conn.execute(
+                        "DELETE FROM terms WHERE doc_key = ?", (doc_key,)
+                    )
+
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO documents (doc_key, length) VALUES (?, ?)",
+                    (doc_key, len(tokens))
+                )
+                self._conn.executemany(
+                    "INSERT INTO terms (doc_key, term) VALUES (?, ?)",
+                    [(doc_key, term) for term in terms]
+                )
+                self._documents += 1
+                self._total_length += len(tokens)
+                for term in terms:
+                    self._df[term] = self._df.get(term, 0) + 1
+
+    def extract(
+        self,
+        documents: dict[str, str],
+        top_k: int = 10
+    ) -> dict[str, list[tuple[str, float]]]:
+        """문서별 상위 키워드
+
+        Args:
+            documents: {문서 키: 본문}
+            top_k: 문서당 키워드 수
+
+        Returns:
+            {문서 키: [(용어, BM25 점수)]} (점수 내림차순)
+        """
+        keys = list(documents)
+        if not keys:
+            return {}
+
+        # (문서 번호, 용어 번호) 배열
+        vocab: dict[str, int] = {}
+        doc_ids, term_ids = [], []
+        for i, key in enumerate(keys):
+            for token in tokenize(documents[key]):
+                doc_ids.append(i)
+                term_ids.append(vocab.setdefault(token, len(vocab)))
+
+        result = {key: [] for key in keys}
+        if not vocab:
+            return result
+
+        terms = list(vocab)
+        doc_ids = np.asarray(doc_ids, dtype=np.int64)
+        term_ids = np.asarray(term_ids, dtype=np.int64)
+
+        # (문서, 용어)별 tf
+        pairs, tf = np.unique(doc_ids * len(terms) + term_ids, return_counts=True)
+        pair_doc = pairs // len(terms)
+        pair_term = pairs % len(terms)
+
+        lengths = np.bincount(doc_ids, minlength=len(keys)).astype(np.float64)
+        total = max(self._documents, 1)
+        avgdl = (
+            self._total_length / self._documents if self._documents else lengths.mean()
+        )
+        avgdl = avgdl or 1.0
+
+        df = np.array([self._df.get(term, 1) for term in terms], dtype=np.float64)
+        idf = np.log1p((total - df + 0.5) / (df + 0.5))
+
+        norm = self.k1 * (1 - self.b + self.b * lengths[pair_doc] / avgdl)
+        scores = idf[pair_term] * tf * (self.k1 + 1) / (tf + norm)
+
+        # 문서 번호 오름차순, 점수 내림차순 (동점은 용어 순)
+        order = np.lexsort((pair_term, -scores, pair_doc))
+        starts = np.searchsorted(pair_doc[order], np.arange(len(keys)))
+        ends = np.append(starts[1:], order.size)
+        for i, key in enumerate(keys):
+            top = order[starts[i]:min(ends[i], starts[i] + top_k)]
+            result[key] = [
+                (terms[t], round(float(s), 4))
+                for t, s in zip(pair_term[top], scores[top])
+                if s > 0
+            ]
+        return result
+
+
+def keyword_concepts(keywords: list[tuple[str, float]]) -> list[dict]:
+    """키워드를 개념 목록 형식으로 (confidence는 문서 내 최고 점수 대비 0.3~0.7)"""
+    if not keywords:
+        return []
+    best = keywords[0][1] or 1.0
+    return [
+        {
+            "name": term,
+            "type": "keyword",
+            "confidence": round(0.3 + 0.4 * score / best, 2),
+        }
+        for term, score in keywords
+        if score >= best * _MIN_SCORE_RATIO
+    ]
@@ -0,0 +1,60 @@
+"""프롬프트 컨텍스트 예산
+
+Ollama 모델의 num_ctx 안에 들어가도록 항목을 프롬프트 여러 개로 나눌 때 사용.
+토크나이저 없이 UTF-8 바이트 수로 토큰 수를 보수적으로 추정함
+(영문 약 4바이트/토큰, 한글 3바이트/글자 ≈ 1~2토큰).
+"""
+
+from typing import Callable, Iterable, TypeVar
+
+
+T = TypeVar("T")
+
+# 바이트 → 토큰 환산 (작을수록 보수적)
+BYTES_PER_TOKEN = 2.5
+
+
+def estimate_tokens(text: str) -> int:
+    """텍스트의 대략적인 토큰 수"""
+    return int(len(text.encode("utf-8")) / BYTES_PER_TOKEN) + 1
+
+
+def available_tokens(num_ctx: int, template: str, reserve: int) -> int:
+    """템플릿과 응답 예약분을 뺀 입력 항목용 토큰 수"""
+    return max(0, num_ctx - estimate_tokens(template) - reserve)
+
+
+def pack_by_budget(
+    items: Iterable[T],
+    render: Callable[[T], str],
+    budget_tokens: int,
+    max_items: int = 0,
+    item_overhead: int = 0
+) -> list[list[T]]:
+    """렌더링 결과의 토큰 합이 예산을 넘지 않도록 항목을 묶음
+
+    예산보다 큰 항목은 단독 묶음이 됨.
+
+    Args:
+        items: 항목
+        render: 항목 → 프롬프트에 들어갈 텍스트
+        budget_tokens: 묶음당 토큰 예산
+        max_items: 묶음당 최대 항목 수 (0이면 제한 없음)
+        item_overhead: 항목당 추가 토큰 (예: 항목별 응답 길이)
+    """
+    groups: list[list[T]] = []
+    current: list[T] = []
+    used = 0
+
+    for item in items:
+        cost = estimate_tokens(render(item)) + item_overhead
+        full = max_items and len(current) >= max_items
+        if current and (used + cost > budget_tokens or full):
+            groups.append(current)
+            current, used = [], 0
+        current.append(item)
+        used += cost
+
+    if current:
+        groups.append(current)
+    return groups
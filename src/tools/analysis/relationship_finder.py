@@ -0,0 +1,208 @@
+"""교차 관계 후보 검색
+
+새 개념마다 관련 있을 가능성이 높은 기존 개념 top-k를 찾아
+LLM에는 (새 개념, 후보 목록)만 보내도록 함.
+
+신호:
+    - 문자 n-gram: 이름의 문자 3-gram 역색인, Jaccard 유사도
+    - 공동 출현: 같은 문서에 나온 기존 개념 + 그 개념과 같은 Thought에 언급된 개념
+    - 임베딩: 코사인 유사도 (ConceptVectorIndex, 사용 가능할 때만)
+
+신호별 순위는 RRF(reciprocal rank fusion)로 합침.
+"""
+
+from collections import Counter, defaultdict
+from typing import Callable, Optional
+
+from src.tools.cypher.manager import normalize_name
+
+
+# (이름 목록, k) → 이름별 [(기존 개념, 점수)]
+VectorSearchFn = Callable[[list[str], int], Optional[list[list[tuple[str, float]]]]]
+
+_RRF_K = 60
+
+
+def char_ngrams(name: str, n: int = 3) -> set[str]:
+    """정규화된 이름의 문자 n-gram (공백 제거, 짧은 이름은 그대로)"""
+    text = normalize_name(name).replace(" ", "")
+    if len(text) <= n:
+        return {text} if text else set()
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+class LexicalIndex:
+    """개념 이름 문자 n-gram 역색인"""
+
+    def __init__(self, names: list[str], n: int = 3, max_postings: int = 5000):
+        """초기화
+
+        Args:
+            names: 색인할 이름
+            n: n-gram 길이
+            max_postings: 이보다 흔한 n-gram은 검색에 쓰지 않음
+        """
+        self.n = n
+        self.max_postings = max_postings
+        self.names = names
+        self._grams = [char_ngrams(name, n) for name in names]
+        self._postings: dict[str, list[int]] = defaultdict(list)
+        for index, grams in enumerate(self._grams):
+            for gram in grams:
+                self._postings[gram].append(index)
+
+    def search(self, name: str, k: int = 10) -> list[tuple[str, float]]:
+        """Jaccard 유사도 top-k"""
+        query = char_ngrams(name, self.n)
+        if not query:
+            return []
+
+        shared: Counter = Counter()
+        for gram in query:
+            postings = self._postings.get(gram, ())
+            if len(postings) <= self.max_postings:
+                shared.update(postings)
+
+        key = normalize_name(name)
+        scored = []
+        for index, count in shared.items():
+            if normalize_name(self.names[index]) == key:
+                continue
+            union = len(query) + len(self._grams[index]) - count
+            scored.append((self.names[index], count / union))
+
+        scored.sort(key=lambda item: item[1], reverse=True)
+        return scored[:k]
+
+
+class RelationshipCandidateFinder:
+    """새 개념별 기존 개념 후보 검색
+
+    사용법:
+        finder = RelationshipCandidateFinder(state, vector_search=tools.search_concepts)
+        candidates = finder.find(new_concepts, k=8)
+        # {"LangGraph": ["LangChain", "에이전트", ...], ...}
+    """
+
+    def __init__(
+        self,
+        state,
+        vector_search: Optional[VectorSearchFn] = None,
+        max_thoughts_per_concept: int = 50
+    ):
+        """초기화
+
+        Args:
+            state: GraphState / SQLiteGraphState
+            vector_search: 임베딩 검색 함수 (없으면 문자/공동 출현 신호만 사용)
+            max_thoughts_per_concept: 공동 출현 확장 시 개념당 살펴볼 Thought 수
+        """
+        self.state = state
+        self.vector_search = vector_search
+        self.max_thoughts_per_concept = max_thoughts_per_concept
+        self._lexical: Optional[LexicalIndex] = None
+
+    @property
+    def lexical(self) -> LexicalIndex:
+        if self._lexical is None:
+            self._lexical = LexicalIndex(self.state.get_all_concepts())
+        return self._lexical
+
+    def find(self, new_concepts: list[dict], k: int = 8) -> dict[str, list[str]]:
+        """새 개념별 후보 기존 개념 top-k
+
+        Args:
+            new_concepts: Research Agent의 new_concepts ({name, source_file, ...})
+            k: 개념당 후보 수
+
+        Returns:
+            {새 개념 이름: [기존 개념 이름]}
+        """
+        names: list[str] = []
+        doc_concepts: dict[str, list[str]] = defaultdict(list)
+        sources: dict[str, set[str]] = defaultdict(set)
+
+        for concept in new_concepts:
+            name = concept.get("name", "")
+            if not name:
+                continue
+            if name not in sources:
+                names.append(name)
+            source = concept.get("source_file", "")
+            sources[name].add(source)
+            doc_concepts[source].append(name)
+
+        if not names or not self.state.count("Concept"):
+            return {}
+
+        embedding_hits = None
+        if self.vector_search is not None:
+            embedding_hits = self.vector_search(names, k * 2)
+
+        candidates = {}
+        for i, name in enumerate(names):
+            rankings = [
+                [hit for hit, _ in self.lexical.search(name, k * 2)],
+                self._cooccurring(name, sources[name], doc_concepts, k * 2),
+            ]
+            if embedding_hits:
+                rankings.append([hit for hit, _ in embedding_hits[i]])
+
+            fused = self._fuse(rankings, exclude=normalize_name(name))
+            if fused:
+                candidates[name] = fused[:k]
+
+        return candidates
+
+    def _cooccurring(
+        self,
+        name: str,
+        sources: set[str],
+        doc_concepts: dict[str, list[str]],
+        k: int
+    ) -> list[str]:
+        """같은 문서/같은 Thought에 함께 나온 기존 개념"""
+        scores: Counter = Counter()
+
+        for source in sources:
+            for other in doc_concepts.get(source, []):
+                if other == name:
+                    continue
+                seed = self.state.get_concept_id(other)
+                if seed is None:
+                    continue
+
+                # 같은 문서에 함께 나온 기존 개념
+                scores[seed] += 2
+
+                # 그 개념을 언급한 다른 Thought들이 언급한 개념
+                thoughts = self.state.get_neighbors(seed, "in", "MENTIONS")
+                for thought_id in thoughts[:self.max_thoughts_per_concept]:
+                    for neighbor in self.state.get_neighbors(
+                        thought_id, "out", "MENTIONS"
+                    ):
+                        if neighbor != seed:
+                            scores[neighbor] += 1
+
+        result = []
+        for node_id, _ in scores.most_common(k):
+            node = self.state.nodes.get(node_id)
+            if node is not None and node.label == "Concept":
+                result.append(node.properties.get("name", ""))
+        return [name for name in result if name]
+
+    def _fuse(self, rankings: list[list[str]], exclude: str) -> list[str]:
+        """RRF로 순위 합치기"""
+        scores: dict[str, float] = {}
+        display: dict[str, str] = {}
+
+        for ranking in rankings:
+            for rank, name in enumerate(ranking):
+                key = normalize_name(name)
+                if key == exclude:
+                    continue
+                display.setdefault(key, name)
+                scores[key] = scores.get(key, 0.0) + 1.0 / (_RRF_K + rank + 1)
+
+        ordered = sorted(scores, key=scores.get, reverse=True)
+        return [display[key] for key in ordered]
@@ -0,0 +1,164 @@
+"""섹션 단위 분석 캐시
+
+마크다운 문서를 제목(#) 기준 섹션으로 나누고 섹션별 내용 해시와 추출된 개념을 저장함.
+문서가 수정되면 해시가 바뀐 섹션만 다시 추출하고, 나머지는 캐시된 개념을 합침.
+
+긴 섹션(또는 섹션이 없는 긴 문서)은 내용 기반 청크로 더 나누며,
+청크의 섹션 키는 "섹션 키@청크 ID" 형태임.
+
+    graph.cypher.sections.db
+        sections  (doc_key, section_key, content_hash, concepts)
+        documents (doc_key, category, summary)
+"""
+
+import re
+import sqlite3
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+import orjson
+
+from src.tools.cypher.manager import normalize_name
+
+
+_FRONTMATTER = re.compile(r'^---\n.*?\n---\n', re.DOTALL)
+_HEADING = re.compile(r'^#{1,6}\s', re.MULTILINE)
+
+_CHUNK_SUFFIX = re.compile(r'@[0-9a-f]{16}$')
+
+# 제목 앞 본문(서문)의 섹션 키
+PREAMBLE_KEY = ""
+
+
+def chunk_key(section_key: str, chunk_id: str) -> str:
+    """청크의 섹션 키"""
+    return f"{section_key}@{chunk_id}"
+
+
+def parent_section(key: str) -> str:
+    """청크 키에서 원래 섹션 키 (청크가 아니면 그대로)"""
+    return _CHUNK_SUFFIX.sub("", key)
+
+
+def section_units(doc) -> list[tuple[str, str]]:
+    """문서의 섹션 (키, 텍스트) 목록
+
+    마크다운만 섹션으로 나누며, 첫 제목 앞의 서문도 한 섹션으로 포함함.
+    같은 제목이 반복되면 키에 순번을 붙임.
+
+    Args:
+        doc: ParsedDocument
+
+    Returns:
+        [(섹션 키, 섹션 텍스트)] (섹션으로 나눌 수 없으면 빈 목록)
+    """
+    if doc.file_type != "markdown" or not doc.sections:
+        return []
+
+    units = []
+    raw = _FRONTMATTER.sub("", doc.raw_content or "", count=1)
+    preamble = _HEADING.split(raw, maxsplit=1)[0].strip()
+    if preamble:
+        units.append((PREAMBLE_KEY, preamble))
+
+    seen: dict[str, int] = {}
+    for section in doc.sections:
+        title = section.get("title", "")
+        count = seen.get(title, 0)
+        seen[title] = count + 1
+        key = f"{title}#{count}" if count else title
+        units.append((key or "#", f"{title}\n{section.get('content', '')}".strip()))
+
+    return units
+
+
+def merge_concepts(concept_lists: Iterable[list[dict]]) -> list[dict]:
+    """섹션별 개념 합치기 (정규화 이름 기준, confidence가 높은 것 유지)"""
+    merged: dict[str, dict] = {}
+    for concepts in concept_lists:
+        for concept in concepts:
+            if not isinstance(concept, dict) or not concept.get("name"):
+                continue
+            key = normalize_name(concept["name"])
+            current = merged.get(key)
+            confidence = concept.get("confidence", 0)
+            if current is None or confidence > current.get("confidence", 0):
+                merged[key] = concept
+    return list(merged.values())
+
+
+class SectionCache:
+    """섹션별 해시/개념 캐시 (SQLite)
+
+    사용법:
+        cache = SectionCache("data/output/graph.cypher.sections.db")
+        stored = cache.load("log.md")          # {섹션 키: (해시, 개념 목록)}
+        cache.save("log.md", sections, category, summary)
+        cache.close()
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS sections (
+                doc_key TEXT NOT NULL,
+                section_key TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                concepts BLOB NOT NULL,
+                PRIMARY KEY (doc_key, section_key)
+            );
+            CREATE TABLE IF NOT EXISTS documents (
+                doc_key TEXT PRIMARY KEY,
+                category TEXT NOT NULL,
+                summary TEXT NOT NULL
+            );
+        """)
+
+    def close(self):
+        self._conn.commit()
+        self._conn.close()
+
+    def load(self, doc_key: str) -> dict[str, tuple[str, list[dict]]]:
+        """문서의 저장된 섹션 {섹션 키: (내용 해시, 개념 목록)}"""
+        rows = self._conn.execute(
+            "SELECT section_key, content_hash, concepts FROM sections "
+            "WHERE doc_key = ?",
+            (doc_key,),
+        )
+        return {
+            key: (content_hash, orjson.loads(concepts))
+            for key, content_hash, concepts in rows
+        }
+
+    def document(self, doc_key: str) -> Optional[tuple[str, str]]:
+        """문서 단위 (카테고리, 요약)"""
+        return self._conn.execute(
+            "SELECT category, summary FROM documents WHERE doc_key = ?", (doc_key,)
+        ).fetchone()
+
+    def save(
+        self,
+        doc_key: str,
+        sections: dict[str, tuple[str, list[dict]]],
+        category: str,
+        summary: str
+    ):
+        """문서의 섹션 캐시 교체 (없어진 섹션은 삭제)"""
+        with self._conn:
+            self._conn.execute("DELETE FROM sections WHERE doc_key = ?", (doc_key,))
+            self._conn.executemany(
+                "INSERT INTO sections (doc_key, section_key, content_hash, concepts) "
+                "VALUES (?, ?, ?, ?)",
+                [
+                    (doc_key, key, content_hash, orjson.dumps(concepts))
+                    for key, (content_hash, concepts) in sections.items()
+                ]
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO documents (doc_key, category, summary) "
+                "VALUES (?, ?, ?)",
+                (doc_key, category, summary),
+            )
@@ -0,0 +1,56 @@
+"""분석 전 문서 분류 (triage)
+
+빈 파일, 한 줄 메모, 링크만 모아 둔 노트, 헤더뿐인 CSV처럼
+LLM에 보내도 얻을 것이 없는 문서를 골라 로컬 분석으로 돌림.
+"""
+
+import re
+from typing import Optional
+
+
+_WIKILINK = re.compile(r'\[\[[^\]]*\]\]')
+_MD_LINK = re.compile(r'!?\[[^\]]*\]\([^)]*\)')
+_URL = re.compile(r'https?://\S+')
+_NON_TEXT = re.compile(r'[\W_]+')
+
+# triage 사유
+EMPTY = "empty"
+CSV_HEADER = "csv_header"
+LINKS_ONLY = "links_only"
+TOO_SHORT = "too_short"
+DUPLICATE = "duplicate"
+
+
+def _text_length(text: str) -> int:
+    """공백/기호를 뺀 글자 수"""
+    return len(_NON_TEXT.sub("", text))
+
+
+def triage_document(
+    doc, min_chars: int = 20, max_link_ratio: float = 0.8
+) -> Optional[str]:
+    """LLM 분석이 필요 없는 문서면 그 사유
+
+    Args:
+        doc: ParsedDocument
+        min_chars: 링크를 뺀 본문이 이 글자 수 미만이면 too_short
+        max_link_ratio: 본문 중 링크가 차지하는 비율이 이 이상이면 links_only
+
+    Returns:
+        empty | csv_header | links_only | too_short 또는 None (일반 문서)
+    """
+    text = (doc.content or "").strip()
+    total = _text_length(text)
+    if total == 0:
+        return EMPTY
+
+    if doc.file_type == "csv" and not (doc.metadata or {}).get("row_count"):
+        return CSV_HEADER
+
+    rest = _text_length(_URL.sub(" ", _MD_LINK.sub(" ", _WIKILINK.sub(" ", text))))
+    if rest < total and 1 - rest / total >= max_link_ratio:
+        return LINKS_ONLY
+
+    if rest < min_chars:
+        return TOO_SHORT
+    return None
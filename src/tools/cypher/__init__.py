@@ -5,11 +5,37 @@ from src.tools.cypher.manager import (
     GraphRelationship,
     GraphState,
     CypherManager,
+    normalize_name,
 )
+from src.tools.cypher.canonical import ConceptCanonicalizer, canonical_key, fold_name
+from src.tools.cypher.view import GraphView
+from src.tools.cypher.loader import CypherStreamLoader, parse_statement
+from src.tools.cypher.writer import CypherFileWriter
+from src.tools.cypher.snapshot import GraphSnapshot
+from src.tools.cypher.batch_export import BatchCypherExporter
+from src.tools.cypher.csv_export import Neo4jCSVExporter
+from src.tools.cypher.params_export import ParameterizedExporter, ParameterizedLoader
+from src.tools.cypher.compact import compact_cypher_file
+from src.tools.cypher.bolt_sink import Neo4jBoltSink
 
 __all__ = [
     "GraphNode",
     "GraphRelationship",
     "GraphState",
     "CypherManager",
+    "normalize_name",
+    "ConceptCanonicalizer",
+    "canonical_key",
+    "fold_name",
+    "GraphView",
+    "CypherStreamLoader",
+    "parse_statement",
+    "CypherFileWriter",
+    "GraphSnapshot",
+    "BatchCypherExporter",
+    "Neo4jCSVExporter",
+    "ParameterizedExporter",
+    "ParameterizedLoader",
+    "compact_cypher_file",
+    "Neo4jBoltSink",
 ]
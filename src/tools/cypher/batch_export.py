@@ -0,0 +1,188 @@
+"""배치 UNWIND Cypher 내보내기
+
+노드는 라벨별, 관계는 (타입, 시작 라벨, 끝 라벨)별로 묶어
+고정된 파라미터 템플릿 + 행 배치 형태로 내보냄.
+라벨이 지정된 MATCH와 id 유니크 제약을 함께 생성하므로
+cypher-shell 재생 시 인덱스를 사용함.
+
+출력 예시 (cypher-shell):
+    CREATE CONSTRAINT concept_id IF NOT EXISTS FOR (n:Concept) REQUIRE n.id IS UNIQUE;
+    :param rows => [{id: "concept_...", props: {name: "LangGraph"}}]
+    UNWIND $rows AS row MERGE (n:Concept {id: row.id}) SET n += row.props;
+"""
+
+import re
+from pathlib import Path
+from typing import Iterator, Optional, Union
+
+from src.tools.cypher.manager import GraphState, format_value
+
+
+# 이름으로 조회하는 라벨별 인덱스 대상 프로퍼티
+INDEXED_PROPERTIES = {
+    "Concept": "name",
+    "Category": "name",
+    "Tag": "name",
+    "Date": "date",
+    "Thought": "source",
+}
+
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+RelationshipGroup = tuple[str, Optional[str], Optional[str]]
+
+
+def _key(name: str) -> str:
+    """맵 키 (식별자가 아니면 백틱)"""
+    if _IDENTIFIER.match(name):
+        return name
+    return "`" + name.replace("`", "``") + "`"
+
+
+def format_literal(value) -> str:
+    """리스트/맵을 포함한 Cypher 리터럴"""
+    if isinstance(value, dict):
+        return "{" + ", ".join(
+            f"{_key(str(k))}: {format_literal(v)}" for k, v in value.items()
+        ) + "}"
+    if isinstance(value, (list, tuple)):
+        return "[" + ", ".join(format_literal(v) for v in value) + "]"
+    return format_value(value)
+
+
+def node_template(label: str) -> str:
+    """라벨별 노드 MERGE 템플릿"""
+    return f"UNWIND $rows AS row MERGE (n:{label} {{id: row.id}}) SET n += row.props"
+
+
+def relationship_template(
+    rel_type: str,
+    source_label: Optional[str] = None,
+    target_label: Optional[str] = None
+) -> str:
+    """(타입, 라벨)별 관계 MERGE 템플릿"""
+    source = f"a:{source_label}" if source_label else "a"
+    target = f"b:{target_label}" if target_label else "b"
+    return (
+        f"UNWIND $rows AS row "
+        f"MATCH ({source} {{id: row.source}}) "
+        f"MATCH ({target} {{id: row.target}}) "
+        f"MERGE (a)-[r:{rel_type}]->(b) SET r += row.props"
+    )
+
+
+def schema_statements(labels: list[str]) -> list[str]:
+    """id 유니크 제약 + 조회용 인덱스"""
+    statements = []
+    for label in labels:
+        name = label.lower()
+        statements.append(
+            f"CREATE CONSTRAINT {name}_id IF NOT EXISTS "
+            f"FOR (n:{label}) REQUIRE n.id IS UNIQUE"
+        )
+        prop = INDEXED_PROPERTIES.get(label)
+        if prop:
+            statements.append(
+                f"CREATE INDEX {name}_{prop} IF NOT EXISTS "
+                f"FOR (n:{label}) ON (n.{prop})"
+            )
+    return statements
+
+
+def iter_node_batches(
+    state: GraphState,
+    batch_size: int
+) -> Iterator[tuple[str, list[dict]]]:
+    """라벨별 노드 행 배치"""
+    groups: dict[str, list[dict]] = {}
+    for node in state.nodes.values():
+        rows = groups.setdefault(node.label, [])
+        rows.append({"id": node.id, "props": node.properties})
+        if len(rows) >= batch_size:
+            yield node.label, rows
+            groups[node.label] = []
+
+    for label, rows in groups.items():
+        if rows:
+            yield label, rows
+
+
+def iter_relationship_batches(
+    state: GraphState,
+    batch_size: int
+) -> Iterator[tuple[RelationshipGroup, list[dict]]]:
+    """(타입, 시작 라벨, 끝 라벨)별 관계 행 배치"""
+    groups: dict[RelationshipGroup, list[dict]] = {}
+    for rel in state.relationships:
+        source = state.nodes.get(rel.source_id)
+        target = state.nodes.get(rel.target_id)
+        group = (
+            rel.rel_type,
+            source.label if source else None,
+            target.label if target else None,
+        )
+        rows = groups.setdefault(group, [])
+        rows.append({
+            "source": rel.source_id,
+            "target": rel.target_id,
+            "props": rel.properties,
+        })
+        if len(rows) >= batch_size:
+            yield group, rows
+            groups[group] = []
+
+    for group, rows in groups.items():
+        if rows:
+            yield group, rows
+
+
+class BatchCypherExporter:
+    """배치 UNWIND Cypher 내보내기
+
+    사용법:
+        exporter = BatchCypherExporter(batch_size=1000)
+        stats = exporter.export(state, "data/output/neo4j/graph_batched.cypher")
+    """
+
+    def __init__(self, batch_size: int = 1000):
+        self.batch_size = max(1, batch_size)
+
+    def export(self, state: GraphState, output_path: Union[str, Path]) -> dict:
+        """cypher-shell로 재생 가능한 배치 스크립트 저장
+
+        Returns:
+            {output_file, nodes, relationships, batches}
+        """
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        stats = {
+            "output_file": str(output_path),
+            "nodes": 0,
+            "relationships": 0,
+            "batches": 0,
+        }
+
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write("// === Schema ===\n")
+            for statement in schema_statements(state.get_labels()):
+                f.write(statement + ";\n")
+
+            f.write("\n// === Nodes ===\n")
+            for label, rows in iter_node_batches(state, self.batch_size):
+                self._write_batch(f, node_template(label), rows)
+                stats["nodes"] += len(rows)
+                stats["batches"] += 1
+
+            f.write("\n// === Relationships ===\n")
+            for group, rows in iter_relationship_batches(state, self.batch_size):
+                self._write_batch(f, relationship_template(*group), rows)
+                stats["relationships"] += len(rows)
+                stats["batches"] += 1
+
+        return stats
+
+    def _write_batch(self, f, template: str, rows: list[dict]):
+        """:param 설정 + 템플릿 실행"""
+        f.write(f":param rows => {format_literal(rows)}\n")
+        f.write(template + ";\n")
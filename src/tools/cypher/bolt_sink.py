@@ -0,0 +1,246 @@
+"""Neo4j Bolt 직접 쓰기
+
+Writer Agent가 만든 노드/관계를 텍스트 파일을 거치지 않고
+라벨/관계 그룹별 UNWIND 템플릿으로 묶어 Neo4j에 바로 기록함.
+
+    - 배치 하나 = 쓰기 트랜잭션 하나
+    - 동시에 진행 중인 배치 수를 max_in_flight로 제한
+    - 일시적 오류(TransientError, ServiceUnavailable 등)는 지수 백오프로 재시도
+    - 노드 배치가 모두 끝난 뒤 관계 배치 실행 (MATCH 대상 보장)
+
+드라이버는 neo4j.GraphDatabase.driver 또는 테스트용 인메모리 드라이버
+(tests/fake_driver.py) 등 session(database=...) / execute_write를 제공하는 객체면 됨.
+"""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Iterable, Optional
+
+from src.core.exceptions import ExportError
+from src.core.logger import get_logger
+from src.tools.cypher.batch_export import (
+    node_template,
+    relationship_template,
+    schema_statements,
+)
+from src.tools.cypher.manager import GraphNode, GraphRelationship, GraphState
+
+
+logger = get_logger(__name__)
+
+_TRANSIENT_ERRORS = {"TransientError", "ServiceUnavailable", "SessionExpired"}
+
+
+def is_transient(error: Exception) -> bool:
+    """재시도 가능한 오류인지 (neo4j 5의 is_retryable 우선)"""
+    check = getattr(error, "is_retryable", None)
+    if callable(check):
+        try:
+            return bool(check())
+        except Exception:
+            return False
+    return type(error).__name__ in _TRANSIENT_ERRORS
+
+
+def _run_batch(tx, template: str, rows: list[dict]):
+    tx.run(template, rows=rows).consume()
+
+
+class Neo4jBoltSink:
+    """Neo4j Bolt 배치 writer
+
+    사용법:
+        sink = Neo4jBoltSink.from_config(get_config().neo4j)
+        stats = sink.write(nodes, relationships, state)
+        sink.close()
+    """
+
+    def __init__(
+        self,
+        driver,
+        database: str = "neo4j",
+        batch_size: int = 1000,
+        max_in_flight: int = 4,
+        max_retries: int = 3,
+        retry_backoff: float = 0.5
+    ):
+        """초기화
+
+        Args:
+            driver: Neo4j 드라이버
+            database: 대상 데이터베이스
+            batch_size: 트랜잭션당 행 수
+            max_in_flight: 동시에 진행 중인 배치 수 상한
+            max_retries: 일시적 오류 재시도 횟수
+            retry_backoff: 첫 재시도 대기 시간 (초, 이후 2배씩 증가)
+        """
+        self.driver = driver
+        self.database = database
+        self.batch_size = max(1, batch_size)
+        self.max_in_flight = max(1, max_in_flight)
+        self.max_retries = max(0, max_retries)
+        self.retry_backoff = retry_backoff
+        self._schema_labels: set[str] = set()
+
+    @classmethod
+    def from_config(cls, config) -> "Neo4jBoltSink":
+        """Neo4jConfig로 드라이버 생성"""
+        try:
+            from neo4j import GraphDatabase
+        except ImportError:
+            raise ExportError(
+                "Bolt 쓰기에는 neo4j 패키지가 필요합니다 (pip install -e .[neo4j])"
+            )
+
+        driver = GraphDatabase.driver(
+            config.uri, auth=(config.username, config.password)
+        )
+        return cls(
+            driver,
+            database=config.database,
+            batch_size=config.export_batch_size,
+            max_in_flight=config.sink_max_in_flight,
+            max_retries=config.sink_max_retries,
+        )
+
+    def close(self):
+        self.driver.close()
+
+    def write(
+        self,
+        nodes: Iterable[GraphNode],
+        relationships: Iterable[GraphRelationship],
+        state: Optional[GraphState] = None
+    ) -> dict:
+        """노드 → 관계 순서로 배치 기록
+
+        Args:
+            nodes: 기록할 노드
+            relationships: 기록할 관계
+            state: 관계 끝점 라벨 조회용 (없으면 이번 노드 목록만 사용)
+
+        Returns:
+            {nodes, relationships, batches, retries, seconds, rows_per_second}
+
+        Raises:
+            ExportError: 재시도 후에도 실패한 배치가 있음
+        """
+        nodes = list(nodes)
+        labels = {node.id: node.label for node in nodes}
+
+        def label_of(node_id: str) -> Optional[str]:
+            if node_id in labels:
+                return labels[node_id]
+            node = state.nodes.get(node_id) if state is not None else None
+            return node.label if node else None
+
+        node_batches: dict[str, list[dict]] = {}
+        for node in nodes:
+            node_batches.setdefault(node.label, []).append(
+                {"id": node.id, "props": node.properties}
+            )
+
+        rel_batches: dict[tuple, list[dict]] = {}
+        for rel in relationships:
+            group = (rel.rel_type, label_of(rel.source_id), label_of(rel.target_id))
+            rel_batches.setdefault(group, []).append({
+                "source": rel.source_id,
+                "target": rel.target_id,
+                "props": rel.properties,
+            })
+
+        stats = {"nodes": 0, "relationships": 0, "batches": 0, "retries": 0}
+        started = time.perf_counter()
+
+        self._ensure_schema(node_batches.keys())
+
+        with ThreadPoolExecutor(max_workers=self.max_in_flight) as executor:
+            # 1. 노드 (모두 끝난 뒤 관계 진행)
+            jobs = (
+                (node_template(label), rows)
+                for label, rows in node_batches.items()
+            )
+            self._run_window(executor, jobs, stats, "nodes")
+
+            # 2. 관계
+            jobs = (
+                (relationship_template(*group), rows)
+                for group, rows in rel_batches.items()
+            )
+            self._run_window(executor, jobs, stats, "relationships")
+
+        elapsed = time.perf_counter() - started
+        rows = stats["nodes"] + stats["relationships"]
+        stats["seconds"] = round(elapsed, 3)
+        stats["rows_per_second"] = round(rows / elapsed, 1) if elapsed else 0.0
+
+        logger.info(
+            f"Bolt 기록: 노드 {stats['nodes']}개, 관계 {stats['relationships']}개, "
+            f"배치 {stats['batches']}개, {stats['seconds']}초 "
+            f"({stats['rows_per_second']} rows/s, 재시도 {stats['retries']}회)"
+        )
+        return stats
+
+    def _ensure_schema(self, labels: Iterable[str]):
+        """처음 보는 라벨의 id 제약/인덱스 생성"""
+        new_labels = sorted(set(labels) - self._schema_labels)
+        if not new_labels:
+            return
+
+        with self.driver.session(database=self.database) as session:
+            for statement in schema_statements(new_labels):
+                session.run(statement).consume()
+        self._schema_labels.update(new_labels)
+
+    def _run_window(
+        self,
+        executor: ThreadPoolExecutor,
+        jobs: Iterable[tuple[str, list[dict]]],
+        stats: dict,
+        kind: str
+    ):
+        """진행 중인 배치를 max_in_flight개 이하로 유지하며 실행"""
+        pending: set[Future] = set()
+
+        def collect(done: set[Future]):
+            for future in done:
+                count, retries = future.result()
+                stats[kind] += count
+                stats["batches"] += 1
+                stats["retries"] += retries
+
+        try:
+            for template, rows in jobs:
+                for start in range(0, len(rows), self.batch_size):
+                    if len(pending) >= self.max_in_flight:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        collect(done)
+                    batch = rows[start:start + self.batch_size]
+                    pending.add(executor.submit(self._write_batch, template, batch))
+
+            done, pending = wait(pending)
+            collect(done)
+        except Exception:
+            for future in pending:
+                future.cancel()
+            raise
+
+    def _write_batch(self, template: str, rows: list[dict]) -> tuple[int, int]:
+        """배치 하나를 트랜잭션으로 실행 (일시적 오류 재시도)
+
+        Returns:
+            (행 수, 재시도 횟수)
+        """
+        attempt = 0
+        while True:
+            try:
+                with self.driver.session(database=self.database) as session:
+                    session.execute_write(_run_batch, template, rows)
+                return len(rows), attempt
+            except Exception as e:
+                if not is_transient(e) or attempt >= self.max_retries:
+                    raise ExportError(
+                        f"Bolt 배치 기록 실패 ({len(rows)}행, 시도 {attempt + 1}회): {e}"
+                    ) from e
+                time.sleep(self.retry_backoff * (2 ** attempt))
+                attempt += 1
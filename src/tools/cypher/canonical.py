@@ -0,0 +1,156 @@
+"""개념 이름 정규화 (canonical key)
+
+"LangGraph", "langgraph ", "Lang Graph", "lang-graph", "ＬａｎｇＧｒａｐｈ"를
+같은 개념으로 보기 위한 키.
+
+    1. NFKC: 전각/호환 문자를 일반 문자로, 분해된 한글(NFD, macOS 파일명 등)을
+       완성형으로 합침. 호환 자모로 입력된 "ㅎㅏㄴ"은 NFKC만으로는 "하ᄂ"
+       (받침이 초성 자모로 남음)이 되므로, 음절 뒤의 초성 자모(뒤에 모음이 없는 것)를
+       종성/겹받침으로 바꿔 직접 합침 ("ㄱㅏㅂㅅ" → "값")
+    2. casefold
+    3. 공백/구분 기호 제거 (-, _, ., ·, /, 괄호, 따옴표 등; "C#", "C++"의 #/+는 유지)
+    4. 별칭 테이블 (concepts.aliases: "랭그래프" → "LangGraph" 등 한/영 표기)
+
+노드 ID는 기존과 같이 normalize_name으로 만들므로 이미 있는 개념의 ID는 바뀌지 않음.
+GraphState/SQLiteGraphState는 이 키로 개념 인덱스를 하나 더 두고,
+이름이 정확히 일치하는 개념이 없을 때 같은 키의 기존 개념으로 연결함.
+"""
+
+import unicodedata
+from functools import lru_cache
+from typing import Optional
+
+import xxhash
+
+
+# 키 규칙이 바뀌면 올려서 저장된 키(SQLite 저장소)를 다시 계산하게 함
+_VERSION = 2
+
+# 구분 용도의 일반 구두점 (Po 중 이것만 제거, 나머지는 이름의 일부로 유지)
+_SEPARATORS = frozenset(".,·‧・:;'\"!?/\\…*~")
+
+
+# 한글 음절/자모 (유니코드 조합 규칙: 음절 = 0xAC00 + (L·21 + V)·28 + T)
+_SYLLABLE_BASE = 0xAC00
+_SYLLABLE_LAST = 0xD7A3
+_L_BASE = 0x1100
+_V_FIRST, _V_LAST = 0x1161, 0x1175
+# 초성 → 종성 번호 (ㄸ, ㅃ, ㅉ은 받침이 없어 0)
+_L_TO_T = (1, 2, 4, 7, 0, 8, 16, 17, 0, 19, 20, 21, 22, 0, 23, 24, 25, 26, 27)
+# (종성, 뒤 종성) → 겹받침 (ㄳ ㄵ ㄶ ㄺ ㄻ ㄼ ㄽ ㄾ ㄿ ㅀ ㅄ)
+_COMPOUND_FINALS = {
+    (1, 19): 3,
+    (4, 22): 5,
+    (4, 27): 6,
+    (8, 1): 9,
+    (8, 16): 10,
+    (8, 17): 11,
+    (8, 19): 12,
+    (8, 25): 13,
+    (8, 26): 14,
+    (8, 27): 15,
+    (17, 19): 18,
+}
+
+
+def _compose_finals(text: str) -> str:
+    """음절 뒤의 초성 자모(뒤에 모음 자모가 없음)를 받침/겹받침으로 합침"""
+    result = []
+    i = 0
+    while i < len(text):
+        code = ord(text[i])
+        i += 1
+        if _SYLLABLE_BASE <= code <= _SYLLABLE_LAST:
+            while i < len(text):
+                lead = ord(text[i]) - _L_BASE
+                following = ord(text[i + 1]) if i + 1 < len(text) else 0
+                if not 0 <= lead < len(_L_TO_T) or _V_FIRST <= following <= _V_LAST:
+                    break
+                final = (code - _SYLLABLE_BASE) % 28
+                merged = (
+                    _COMPOUND_FINALS.get((final, _L_TO_T[lead]))
+                    if final
+                    else _L_TO_T[lead]
+                )
+                if not merged:
+                    break
+                code += merged - final
+                i += 1
+        result.append(chr(code))
+    return "".join(result)
+
+
+def _is_separator(ch: str) -> bool:
+    category = unicodedata.category(ch)
+    return (
+        category[0] in "ZC"
+        or category in ("Pd", "Pc", "Ps", "Pe", "Pi", "Pf")
+        or ch in _SEPARATORS
+    )
+
+
+@lru_cache(maxsize=65536)
+def fold_name(name: str) -> str:
+    """별칭을 적용하기 전의 정규화 키"""
+    text = unicodedata.normalize("NFKC", str(name)).casefold()
+    text = _compose_finals(text)
+    folded = "".join(ch for ch in text if not _is_separator(ch))
+    # 기호만으로 된 이름은 그대로 구분
+    return folded or " ".join(text.split())
+
+
+class ConceptCanonicalizer:
+    """개념 이름 → canonical key
+
+    사용법:
+        canonicalizer = ConceptCanonicalizer({"LangGraph": ["랭그래프"]})
+        canonicalizer.key("Lang Graph") == canonicalizer.key("랭그래프")   # True
+    """
+
+    def __init__(self, aliases: Optional[dict] = None, enabled: bool = True):
+        """초기화
+
+        Args:
+            aliases: {대표 이름: [별칭, ...]} (별칭 하나면 문자열도 가능)
+            enabled: False면 normalize_name과 같은 키 (대소문자/공백만 무시)
+        """
+        self.enabled = enabled
+        self._aliases: dict[str, str] = {}
+        for canonical, variants in (aliases or {}).items():
+            if isinstance(variants, str):
+                variants = [variants]
+            target = fold_name(canonical)
+            for variant in variants or []:
+                self._aliases[fold_name(variant)] = target
+
+        rules = sorted(self._aliases.items()) if enabled else []
+        self.version = xxhash.xxh64_hexdigest(repr((_VERSION, enabled, rules)))
+
+    def key(self, name: str) -> str:
+        if not self.enabled:
+            return " ".join(str(name).split()).casefold()
+        folded = fold_name(name)
+        return self._aliases.get(folded, folded)
+
+
+_canonicalizer: Optional[ConceptCanonicalizer] = None
+_canonicalizer_config = None
+
+
+def get_canonicalizer() -> ConceptCanonicalizer:
+    """설정(concepts)의 정규화기 (설정이 다시 로드되면 새로 만듦)"""
+    from src.core.config import get_config
+
+    global _canonicalizer, _canonicalizer_config
+    config = get_config()
+    if _canonicalizer is None or _canonicalizer_config is not config:
+        _canonicalizer = ConceptCanonicalizer(
+            config.concepts.aliases, enabled=config.concepts.canonicalize
+        )
+        _canonicalizer_config = config
+    return _canonicalizer
+
+
+def canonical_key(name: str) -> str:
+    """개념 이름의 canonical key (설정의 별칭 테이블 적용)"""
+    return get_canonicalizer().key(name)
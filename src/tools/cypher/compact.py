@@ -0,0 +1,131 @@
+"""Cypher 파일 압축 (compaction)
+
+append_queries로 누적된 graph.cypher를 스트리밍으로 읽어
+중복 MERGE와 덮어쓰인 프로퍼티를 제거한 정규 형태로 다시 쓰고,
+임시 파일 → os.replace로 원자적으로 교체함.
+교체 중 다른 프로세스의 append가 끼어들지 않도록 writer와 같은 잠금을 사용.
+
+정규 형태:
+    - 노드: 라벨 순서대로, 노드당 MERGE 1개 (마지막 프로퍼티 기준)
+    - 관계: 타입 순서대로, (source, target, type)당 1개
+"""
+
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Union
+
+from src.core.exceptions import ExportError
+from src.tools.cypher.loader import CypherStreamLoader
+from src.tools.cypher.manager import GraphNode, GraphState
+from src.tools.cypher.writer import CypherFileWriter
+
+
+def write_canonical(state: GraphState, f) -> int:
+    """정규 형태로 노드/관계 문장 기록
+
+    Returns:
+        기록한 문장 수
+    """
+    count = 0
+    for label in state.get_labels():
+        f.write(f"\n// --- {label} ---\n")
+        for node_id in state.get_node_ids(label):
+            f.write(state.nodes[node_id].to_cypher() + "\n")
+            count += 1
+
+    by_type: dict[str, list[int]] = {}
+    for index, rel in enumerate(state.relationships):
+        by_type.setdefault(rel.rel_type, []).append(index)
+
+    for rel_type, indexes in by_type.items():
+        f.write(f"\n// --- {rel_type} ---\n")
+        for index in indexes:
+            rel = state.relationships[index]
+            source_label = state.get_label(rel.source_id)
+            target_label = state.get_label(rel.target_id)
+            f.write(rel.to_cypher(source_label, target_label) + "\n")
+            count += 1
+
+    return count
+
+
+def compact_cypher_file(
+    path: Union[str, Path],
+    batched_output: Optional[Union[str, Path]] = None,
+    batch_size: int = 1000,
+    force: bool = False
+) -> dict:
+    """Cypher 파일 압축
+
+    Args:
+        path: graph.cypher 경로
+        batched_output: 지정하면 배치 UNWIND 스크립트도 함께 저장
+        batch_size: 배치 크기
+        force: 인식할 수 없는 줄/손상된 배치가 있어도 진행 (해당 줄은 제거됨)
+
+    Returns:
+        {output_file, statements_before, statements_after, bytes_before,
+         bytes_after, bytes_saved, saved_ratio, nodes, relationships}
+    """
+    path = Path(path)
+
+    with CypherFileWriter(path).lock():
+        bytes_before = path.stat().st_size
+
+        # 1. 스트리밍 파싱 (중복은 GraphState 인덱스에서 병합)
+        state = GraphState()
+        loader = CypherStreamLoader()
+        statements_before = 0
+        for statement, _ in loader.iter_statements(loader.iter_lines(path)):
+            statements_before += 1
+            if isinstance(statement, GraphNode):
+                state.add_node(statement)
+            else:
+                state.add_relationship(statement)
+
+        if (loader.skipped or loader.rejected_batches) and not force:
+            raise ExportError(
+                f"인식할 수 없는 문장 {loader.skipped}개, 손상된 배치 "
+                f"{loader.rejected_batches}개가 있어 압축을 중단합니다 "
+                f"(force 옵션으로 해당 줄을 제거하고 진행 가능)"
+            )
+
+        # 2. 임시 파일에 정규 형태 기록 후 원자적 교체
+        tmp_path = path.with_name(f".{path.name}.compact.tmp")
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with open(tmp_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+            f.write(f"// === Compacted: {timestamp} ===\n")
+            statements_after = write_canonical(state, f)
+            f.flush()
+            os.fsync(f.fileno())
+
+        os.replace(tmp_path, path)
+        bytes_after = path.stat().st_size
+
+        # 3. 기존 스냅샷은 오프셋이 맞지 않으므로 새로 저장
+        from src.tools.cypher.snapshot import GraphSnapshot
+        GraphSnapshot.save(state, path.with_name(path.name + ".snap"), path)
+
+    stats = {
+        "output_file": str(path),
+        "nodes": len(state.nodes),
+        "relationships": len(state.relationships),
+        "statements_before": statements_before,
+        "statements_after": statements_after,
+        "skipped_lines": loader.skipped,
+        "rejected_batches": loader.rejected_batches,
+        "bytes_before": bytes_before,
+        "bytes_after": bytes_after,
+        "bytes_saved": bytes_before - bytes_after,
+        "saved_ratio": (
+            round(1 - bytes_after / bytes_before, 4) if bytes_before else 0.0
+        ),
+    }
+
+    if batched_output:
+        from src.tools.cypher.batch_export import BatchCypherExporter
+        batch_stats = BatchCypherExporter(batch_size).export(state, batched_output)
+        stats["batched_output"] = batch_stats["output_file"]
+
+    return stats
@@ -0,0 +1,223 @@
+"""neo4j-admin 벌크 임포트용 CSV 내보내기
+
+라벨별 노드 파일과 타입별 관계 파일을 생성하며,
+`neo4j-admin database import`가 요구하는 헤더를 사용함:
+
+    nodes_Concept.csv        id:ID,name,type,:LABEL
+    relationships_MENTIONS.csv  :START_ID,:END_ID,:TYPE,confidence:double
+
+끝점 노드가 내보내지 않은(상태에 없는) 관계는 제외함
+(neo4j-admin은 없는 :START_ID/:END_ID를 만나면 임포트 전체가 실패함).
+
+행은 스트리밍으로 기록되며 zstd 압축(.csv.zst)을 선택할 수 있음.
+neo4j-admin은 gzip/zip만 직접 읽으므로 zstd 파일은 전송/보관용이며
+임포트 전에 `zstd -d`로 해제해야 함.
+"""
+
+import csv
+import io
+import re
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Union
+
+from src.core.exceptions import ExportError
+from src.tools.cypher.manager import GraphState
+
+
+_SAFE_NAME = re.compile(r"[^A-Za-z0-9_가-힣-]")
+
+
+def _column_type(values: Iterable) -> str:
+    """값 목록으로 neo4j-admin 컬럼 타입 결정"""
+    kinds = set()
+    for value in values:
+        if value is None:
+            continue
+        if isinstance(value, bool):
+            kinds.add("boolean")
+        elif isinstance(value, int):
+            kinds.add("long")
+        elif isinstance(value, float):
+            kinds.add("double")
+        else:
+            kinds.add("string")
+
+    if kinds == {"boolean"}:
+        return "boolean"
+    if kinds == {"long"}:
+        return "long"
+    if kinds and kinds <= {"long", "double"}:
+        return "double"
+    return "string"
+
+
+def _header(name: str, col_type: str) -> str:
+    return name if col_type == "string" else f"{name}:{col_type}"
+
+
+def _cell(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+class Neo4jCSVExporter:
+    """neo4j-admin 벌크 임포트 CSV 내보내기
+
+    사용법:
+        exporter = Neo4jCSVExporter(compress="zstd")
+        stats = exporter.export(state, "data/output/neo4j")
+        print(stats["import_command"])
+    """
+
+    def __init__(self, compress: Optional[str] = None, zstd_level: int = 3):
+        """초기화
+
+        Args:
+            compress: None 또는 "zstd"
+            zstd_level: zstd 압축 레벨
+        """
+        if compress not in (None, "zstd"):
+            raise ExportError(f"지원하지 않는 압축 형식: {compress}")
+        self.compress = compress
+        self.zstd_level = zstd_level
+
+    def export(self, state: GraphState, output_dir: Union[str, Path]) -> dict:
+        """CSV 파일 생성
+
+        Returns:
+            {output_dir, node_files, relationship_files, nodes, relationships,
+             skipped_relationships, import_command}
+        """
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        stats = {
+            "output_dir": str(output_dir),
+            "node_files": [],
+            "relationship_files": [],
+            "nodes": 0,
+            "relationships": 0,
+            "skipped_relationships": 0,
+        }
+
+        # 1. 노드 (라벨별)
+        for label in state.get_labels():
+            node_ids = state.get_node_ids(label)
+
+            columns = self._columns(
+                state.nodes[node_id].properties for node_id in node_ids
+            )
+            header = ["id:ID"] + [_header(k, t) for k, t in columns] + [":LABEL"]
+            rows = (
+                [node_id]
+                + [_cell(state.nodes[node_id].properties.get(k)) for k, _ in columns]
+                + [label]
+                for node_id in node_ids
+            )
+
+            path = output_dir / self._file_name("nodes", label)
+            stats["nodes"] += self._write(path, header, rows)
+            stats["node_files"].append(str(path))
+
+        # 2. 관계 (타입별, 끝점이 내보낸 노드에 없으면 제외)
+        by_type: dict[str, list[int]] = {}
+        for index, rel in enumerate(state.relationships):
+            if rel.source_id not in state.nodes or rel.target_id not in state.nodes:
+                stats["skipped_relationships"] += 1
+                continue
+            by_type.setdefault(rel.rel_type, []).append(index)
+
+        for rel_type, indexes in by_type.items():
+            rels = state.relationships
+            columns = self._columns(rels[i].properties for i in indexes)
+            header = (
+                [":START_ID", ":END_ID", ":TYPE"]
+                + [_header(k, t) for k, t in columns]
+            )
+            rows = (
+                [rels[i].source_id, rels[i].target_id, rel_type]
+                + [_cell(rels[i].properties.get(k)) for k, _ in columns]
+                for i in indexes
+            )
+
+            path = output_dir / self._file_name("relationships", rel_type)
+            stats["relationships"] += self._write(path, header, rows)
+            stats["relationship_files"].append(str(path))
+
+        stats["import_command"] = self.import_command(
+            stats["node_files"], stats["relationship_files"]
+        )
+        return stats
+
+    def import_command(
+        self,
+        node_files: list[str],
+        relationship_files: list[str],
+        database: str = "neo4j"
+    ) -> str:
+        """neo4j-admin 임포트 명령 (압축 해제된 파일 기준)"""
+        def plain(path: str) -> str:
+            return path[:-4] if path.endswith(".zst") else path
+
+        args = [f"--nodes={plain(p)}" for p in node_files]
+        args += [f"--relationships={plain(p)}" for p in relationship_files]
+        return " ".join(
+            ["neo4j-admin", "database", "import", "full",
+             "--multiline-fields=true", *args, database]
+        )
+
+    def _columns(self, property_dicts: Iterable[dict]) -> list[tuple[str, str]]:
+        """프로퍼티 키별 컬럼 (키, 타입) 목록"""
+        values: dict[str, list] = {}
+        for props in property_dicts:
+            for key, value in props.items():
+                if key == "id" or isinstance(value, (list, dict)):
+                    continue
+                values.setdefault(key, []).append(value)
+
+        return [(key, _column_type(vals)) for key, vals in values.items()]
+
+    def _file_name(self, prefix: str, name: str) -> str:
+        suffix = ".csv.zst" if self.compress == "zstd" else ".csv"
+        return f"{prefix}_{_SAFE_NAME.sub('_', name)}{suffix}"
+
+    def _write(
+        self,
+        path: Path,
+        header: list[str],
+        rows: Iterator[list[str]]
+    ) -> int:
+        """헤더 + 행 스트리밍 기록"""
+        count = 0
+        with self._open(path) as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            for row in rows:
+                writer.writerow(row)
+                count += 1
+        return count
+
+    @contextmanager
+    def _open(self, path: Path):
+        """텍스트 스트림 열기 (zstd 선택)"""
+        if self.compress != "zstd":
+            with open(path, "w", encoding="utf-8", newline="") as f:
+                yield f
+            return
+
+        try:
+            import zstandard
+        except ImportError:
+            raise ExportError("zstd 압축에는 zstandard 패키지가 필요합니다")
+
+        with open(path, "wb") as raw:
+            compressor = zstandard.ZstdCompressor(level=self.zstd_level)
+            with compressor.stream_writer(raw) as stream:
+                text = io.TextIOWrapper(stream, encoding="utf-8", newline="")
+                yield text
+                text.flush()
+                text.detach()
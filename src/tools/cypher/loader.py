@@ -0,0 +1,321 @@
+"""Cypher 파일 스트리밍 로더
+
+GraphNode.to_cypher / GraphRelationship.to_cypher가 생성하는 형태만
+인식하는 경량 토크나이저. 모든 패턴은 시작 위치에 고정되고 각 문자가
+한 가지 방식으로만 매칭되어 백트래킹이 선형으로 제한됨.
+파일은 버퍼 단위로 한 줄씩 읽어 메모리 사용량이 일정함.
+
+인식하는 문장:
+    MERGE (n:Label {id: "..."}) SET n += {key: "value", num: 0.8}
+    MERGE (n:Label {id: "...", key: "value", num: 0.8})        (이전 형식)
+    MATCH (a:Label {id: "..."}), (b:Label {id: "..."}) MERGE (a)-[:TYPE {k: "v"}]->(b)
+    MATCH (a {id: "..."}), (b {id: "..."}) MERGE (a)-[:TYPE]->(b)   (라벨 없는 형식)
+
+CypherFileWriter가 기록한 배치(// @batch begin ... // @batch end)는
+끝 마커의 문장 수와 xxh64 체크섬이 맞을 때만 반영하며,
+끝 마커 없이 끊긴 배치는 버림. 마커 밖의 문장은 그대로 반영.
+여러 줄에 걸친 문자열은 마커 밖의 (이전 형식) 문장에서만 이어 붙이며,
+배치 헤더/마커 줄이 나오면 이어 붙이던 문장은 버림.
+"""
+
+import re
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Union
+
+import xxhash
+
+from src.tools.cypher.manager import GraphNode, GraphRelationship, GraphState
+from src.tools.cypher.writer import parse_batch_marker
+
+
+_ESCAPES = {"n": "\n", "r": "\r", "t": "\t"}
+_ESCAPE_PATTERN = re.compile(r'\\(.)', re.DOTALL)
+
+_BAREWORDS = {
+    "true": True,
+    "false": False,
+    "null": None,
+}
+
+# 이스케이프를 허용하는 문자열 리터럴 (unrolled loop 형태라 백트래킹 없음)
+_STRING = r'"([^"\\]*(?:\\.[^"\\]*)*)"'
+_MAP_BODY = r'((?:[^"}]|"[^"\\]*(?:\\.[^"\\]*)*")*)'
+
+_NODE_PATTERN = re.compile(
+    r'MERGE\s*\(\w*:(\w+)\s*\{' + _MAP_BODY + r'\}\s*\)'
+    r'(?:\s*SET\s+\w+\s*\+=\s*\{' + _MAP_BODY + r'\})?\s*;?\s*$',
+    re.DOTALL
+)
+_REL_PATTERN = re.compile(
+    r'MATCH\s*\(\w*(?::\w+)?\s*\{\s*id:\s*' + _STRING + r'\s*\}\s*\)\s*,'
+    r'\s*\(\w*(?::\w+)?\s*\{\s*id:\s*' + _STRING + r'\s*\}\s*\)\s*'
+    r'MERGE\s*\(\w*\)-\[\w*:(\w+)\s*(?:\{' + _MAP_BODY + r'\})?\s*\]->\(\w*\)\s*;?\s*$',
+    re.DOTALL
+)
+_PROPERTY_PATTERN = re.compile(
+    r'\s*(\w+)\s*:\s*(?:' + _STRING + r'|([^,"}]*[^,"}\s]))\s*,?',
+    re.DOTALL
+)
+_QUOTE_PATTERN = re.compile(r'\\.|"', re.DOTALL)
+
+Statement = Union[GraphNode, GraphRelationship]
+
+# 이어 붙이던 문장을 끊는 줄 (CypherFileWriter의 배치 헤더/마커)
+_BOUNDARY_PREFIXES = ("// @batch", "// === Added")
+
+
+class _Incomplete(Exception):
+    """문자열이 줄 끝에서 닫히지 않음 (다음 줄과 이어서 파싱 필요)"""
+    pass
+
+
+def _unescape(raw: str) -> str:
+    """백슬래시 이스케이프 해제"""
+    if "\\" not in raw:
+        return raw
+    return _ESCAPE_PATTERN.sub(lambda m: _ESCAPES.get(m.group(1), m.group(1)), raw)
+
+
+def _parse_scalar(token: str):
+    """따옴표 없는 값 파싱 (숫자, true/false/null)"""
+    lowered = token.lower()
+    if lowered in _BAREWORDS:
+        return _BAREWORDS[lowered]
+    try:
+        return int(token)
+    except ValueError:
+        pass
+    try:
+        return float(token)
+    except ValueError:
+        return token
+
+
+def _parse_map(body: Optional[str]) -> dict:
+    """프로퍼티 맵 내용 파싱"""
+    props = {}
+    if not body:
+        return props
+
+    for match in _PROPERTY_PATTERN.finditer(body):
+        key, string_value, scalar = match.groups()
+        if string_value is not None:
+            props[key] = _unescape(string_value)
+        else:
+            props[key] = _parse_scalar(scalar)
+    return props
+
+
+def _has_open_string(text: str) -> bool:
+    """이스케이프되지 않은 따옴표 수가 홀수인지 (문자열이 열린 채 끝남)"""
+    if '"' not in text:
+        return False
+    return sum(1 for m in _QUOTE_PATTERN.finditer(text) if m.group() == '"') % 2 == 1
+
+
+def parse_statement(text: str) -> Optional[Statement]:
+    """단일 Cypher 문장 파싱
+
+    Returns:
+        GraphNode / GraphRelationship, 인식할 수 없으면 None
+
+    Raises:
+        _Incomplete: 문자열이 닫히지 않음 (여러 줄에 걸친 문장)
+    """
+    text = text.strip()
+    if not text or text.startswith("//"):
+        return None
+
+    if text.startswith("MERGE"):
+        match = _NODE_PATTERN.match(text)
+        if match:
+            label, body, set_body = match.groups()
+            props = _parse_map(body)
+            props.update(_parse_map(set_body))
+            node_id = props.pop("id", None)
+            if node_id is None:
+                return None
+            return GraphNode(id=str(node_id), label=label, properties=props)
+
+    elif text.startswith("MATCH"):
+        match = _REL_PATTERN.match(text)
+        if match:
+            source_id, target_id, rel_type, body = match.groups()
+            return GraphRelationship(
+                source_id=_unescape(source_id),
+                target_id=_unescape(target_id),
+                rel_type=rel_type,
+                properties=_parse_map(body)
+            )
+
+    else:
+        return None
+
+    if _has_open_string(text):
+        raise _Incomplete()
+    return None
+
+
+class CypherStreamLoader:
+    """Cypher 파일 스트리밍 로더
+
+    사용법:
+        loader = CypherStreamLoader()
+        end_offset = loader.load_into(state, "data/output/graph.cypher")
+    """
+
+    def __init__(self, buffer_size: int = 1 << 20, max_statement_bytes: int = 1 << 24):
+        """초기화
+
+        Args:
+            buffer_size: 파일 읽기 버퍼 크기
+            max_statement_bytes: 여러 줄 문장을 이어 붙일 최대 크기
+        """
+        self.buffer_size = buffer_size
+        self.max_statement_bytes = max_statement_bytes
+        self.skipped = 0
+        self.rejected_batches = 0
+
+    def iter_lines(
+        self,
+        path: Union[str, Path],
+        start_offset: int = 0
+    ) -> Iterator[tuple[str, int]]:
+        """파일을 줄 단위로 읽기
+
+        Yields:
+            (줄 문자열, 해당 줄 끝의 바이트 오프셋)
+            개행으로 끝나지 않은 마지막 줄은 오프셋 -1로 전달
+        """
+        offset = start_offset
+        with open(path, "rb", buffering=self.buffer_size) as f:
+            if start_offset:
+                f.seek(start_offset)
+            for raw in f:
+                offset += len(raw)
+                complete = raw.endswith(b"\n")
+                line = raw.decode("utf-8", errors="replace")
+                yield line, (offset if complete else -1)
+
+    def iter_statements(
+        self,
+        lines: Iterable[tuple[str, int]]
+    ) -> Iterator[tuple[Statement, int]]:
+        """줄 스트림에서 문장 파싱
+
+        Yields:
+            (노드/관계, 문장이 끝난 바이트 오프셋)
+        """
+        pending: Optional[str] = None
+        batch: Optional[dict] = None
+
+        for line, offset in lines:
+            if line.startswith(_BOUNDARY_PREFIXES):
+                if pending is not None:
+                    # 문자열이 닫히기 전에 다음 배치가 시작됨 (끊긴 문장은 버림)
+                    self.skipped += 1
+                    pending = None
+
+            if line.startswith("// @batch"):
+                marker = parse_batch_marker(line.rstrip("\n"))
+                if marker and marker[0] == "begin":
+                    if batch is not None:
+                        # 끝 마커 없이 다음 배치가 시작됨 (끊긴 배치)
+                        self.rejected_batches += 1
+                    batch = {
+                        "id": marker[1],
+                        "hasher": xxhash.xxh64(),
+                        "statements": [],
+                        "count": 0,
+                    }
+                    continue
+                if marker and batch is not None:
+                    _, batch_id, count, checksum = marker
+                    if (
+                        batch_id == batch["id"]
+                        and count == batch["count"]
+                        and checksum == batch["hasher"].hexdigest()
+                    ):
+                        # 배치 안의 문장은 끝 마커 오프셋에서 함께 반영됨
+                        statements = batch["statements"]
+                        last = len(statements) - 1
+                        for index, statement in enumerate(statements):
+                            yield statement, (offset if index == last else -1)
+                    else:
+                        self.rejected_batches += 1
+                    batch = None
+                    continue
+
+            if batch is not None:
+                batch["hasher"].update(line.encode("utf-8"))
+
+            text = line if pending is None else pending + line
+            try:
+                statement = parse_statement(text)
+            except _Incomplete:
+                if batch is not None:
+                    # writer는 문장을 한 줄로 기록하므로 배치 안에서는 잇지 않음
+                    # (끊긴 문장이며 배치는 끝 마커 검증에서 버려짐)
+                    self.skipped += 1
+                    pending = None
+                    continue
+                if len(text) > self.max_statement_bytes:
+                    self.skipped += 1
+                    pending = None
+                else:
+                    pending = text
+                continue
+
+            pending = None
+            if batch is not None and text.strip():
+                batch["count"] += 1
+            if statement is not None:
+                if batch is not None:
+                    batch["statements"].append(statement)
+                else:
+                    yield statement, offset
+            elif text.strip() and not text.lstrip().startswith("//"):
+                self.skipped += 1
+
+        if pending is not None:
+            self.skipped += 1
+        if batch is not None:
+            self.rejected_batches += 1
+
+    def load_into(
+        self,
+        state: GraphState,
+        path: Union[str, Path],
+        start_offset: int = 0
+    ) -> int:
+        """파일을 읽어 GraphState에 반영
+
+        Args:
+            state: 대상 그래프 상태
+            path: Cypher 파일 경로
+            start_offset: 읽기 시작할 바이트 오프셋
+
+        Returns:
+            완전히 반영된 마지막 줄 끝의 바이트 오프셋
+        """
+        end_offset = start_offset
+        for statement, offset in self.iter_statements(
+            self.iter_lines(path, start_offset)
+        ):
+            if isinstance(statement, GraphNode):
+                state.add_node(statement)
+            else:
+                state.add_relationship(statement)
+            if offset >= 0:
+                end_offset = offset
+
+        return end_offset
+
+    def load_text(self, state: GraphState, content: str):
+        """문자열에서 상태 로드"""
+        lines = ((line + "\n", -1) for line in content.split("\n"))
+        for statement, _ in self.iter_statements(lines):
+            if isinstance(statement, GraphNode):
+                state.add_node(statement)
+            else:
+                state.add_relationship(statement)
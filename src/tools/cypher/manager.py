@@ -6,6 +6,39 @@ from dataclasses import dataclass, field
 from typing import Optional
 from datetime import datetime
 
+import xxhash
+
+from src.core.logger import get_logger
+from src.tools.cypher.canonical import canonical_key
+
+
+logger = get_logger(__name__)
+
+
+def format_value(value) -> str:
+    """프로퍼티 값을 Cypher 리터럴로 변환 (문자열 이스케이프 포함)"""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if value is None:
+        return "null"
+    if isinstance(value, (int, float)):
+        return repr(value)
+
+    escaped = (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace('"', '\\"')
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+        .replace("\t", "\\t")
+    )
+    return f'"{escaped}"'
+
+
+def format_properties(properties: dict) -> str:
+    """프로퍼티 딕셔너리를 Cypher 맵 내용으로 변환"""
+    return ", ".join(f"{k}: {format_value(v)}" for k, v in properties.items())
+
 
 @dataclass
 class GraphNode:
@@ -18,12 +51,15 @@ class GraphNode:
     properties: dict = field(default_factory=dict)
 
     def to_cypher(self) -> str:
-        """Cypher MERGE 쿼리 생성"""
-        props = ", ".join(
-            f'{k}: "{v}"' if isinstance(v, str) else f'{k}: {v}'
-            for k, v in self.properties.items()
-        )
-        return f'MERGE (n:{self.label} {{id: "{self.id}", {props}}})'
+        """Cypher MERGE 쿼리 생성 (id로 MERGE 후 프로퍼티 갱신)
+
+        프로퍼티를 MERGE 패턴에 넣으면 내용이 바뀐 노드가 Neo4j에서
+        새 노드로 생성되므로 id만으로 매칭함.
+        """
+        merge = f'MERGE (n:{self.label} {{id: {format_value(self.id)}}})'
+        if not self.properties:
+            return merge
+        return f'{merge} SET n += {{{format_properties(self.properties)}}}'
 
 
 @dataclass
@@ -43,185 +79,554 @@ class GraphRelationship:
     rel_type: str
     properties: dict = field(default_factory=dict)
 
-    def to_cypher(self) -> str:
-        """Cypher MERGE 쿼리 생성"""
+    def to_cypher(
+        self,
+        source_label: Optional[str] = None,
+        target_label: Optional[str] = None
+    ) -> str:
+        """Cypher MERGE 쿼리 생성
+
+        끝점 라벨을 알면 MATCH에 라벨을 붙여 id 제약/인덱스로 조회되게 함
+        (라벨 없는 MATCH는 관계마다 전체 노드를 스캔함).
+        """
         props = ""
         if self.properties:
-            props_str = ", ".join(
-                f'{k}: "{v}"' if isinstance(v, str) else f'{k}: {v}'
-                for k, v in self.properties.items()
-            )
-            props = f" {{{props_str}}}"
+            props = f" {{{format_properties(self.properties)}}}"
 
-        return (f'MATCH (a {{id: "{self.source_id}"}}), (b {{id: "{self.target_id}"}}) '
+        source = format_value(self.source_id)
+        target = format_value(self.target_id)
+        a = f"a:{source_label}" if source_label else "a"
+        b = f"b:{target_label}" if target_label else "b"
+        return (f'MATCH ({a} {{id: {source}}}), ({b} {{id: {target}}}) '
                 f'MERGE (a)-[:{self.rel_type}{props}]->(b)')
 
 
+def normalize_name(name: str) -> str:
+    """이름 정규화 (대소문자 무시, 공백 정리)
+
+    인덱스 키로 사용되므로 조회 시에도 같은 함수를 거쳐야 함.
+    """
+    return " ".join(str(name).split()).casefold()
+
+
 @dataclass
 class GraphState:
-    """현재 그래프 상태"""
+    """현재 그래프 상태
+
+    노드 추가 시 보조 인덱스를 함께 갱신하여
+    라벨/이름 기반 조회를 O(1)로 처리함.
+    """
     nodes: dict[str, GraphNode] = field(default_factory=dict)
     relationships: list[GraphRelationship] = field(default_factory=list)
 
+    # 보조 인덱스: label → {id: None} (삽입 순서 유지)
+    _label_index: dict[str, dict[str, None]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    # 보조 인덱스: label → {정규화된 이름: id}
+    _name_index: dict[str, dict[str, str]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    # 개념 인덱스: canonical key → id (표기만 다른 개념 연결)
+    _canonical_index: dict[str, str] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    # 관계 인덱스: (source, target, type) → relationships 내 위치
+    _rel_index: dict[tuple[str, str, str], int] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    # 인접 인덱스: node id → 관계 위치 목록
+    _out_edges: dict[str, list[int]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _in_edges: dict[str, list[int]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    def __post_init__(self):
+        initial_nodes = list(self.nodes.values())
+        self.nodes = {}
+        for node in initial_nodes:
+            self.add_node(node)
+
+        initial_rels = self.relationships
+        self.relationships = []
+        for rel in initial_rels:
+            self.add_relationship(rel)
+
     def has_node(self, node_id: str) -> bool:
         """노드 존재 여부"""
         return node_id in self.nodes
 
+    def find_node_id(self, label: str, name: str) -> Optional[str]:
+        """라벨 + 이름으로 노드 ID 찾기 (대소문자 무시)"""
+        return self._name_index.get(label, {}).get(normalize_name(name))
+
+    def get_labels(self) -> list[str]:
+        """노드가 있는 라벨 목록"""
+        return [label for label, ids in self._label_index.items() if ids]
+
+    def get_label(self, node_id: str) -> Optional[str]:
+        """노드 라벨 (없는 노드면 None)"""
+        node = self.nodes.get(node_id)
+        return node.label if node is not None else None
+
+    def get_node_ids(self, label: str) -> list[str]:
+        """라벨별 노드 ID 목록"""
+        return list(self._label_index.get(label, {}))
+
+    def get_names(self, label: str) -> list[str]:
+        """라벨별 노드 이름 목록"""
+        return [
+            self.nodes[node_id].properties.get("name", "")
+            for node_id in self._label_index.get(label, {})
+        ]
+
+    def count(self, label: str) -> int:
+        """라벨별 노드 수"""
+        return len(self._label_index.get(label, {}))
+
+    def stats(self) -> dict:
+        """노드/관계 수 (인덱스 크기로 계산하므로 그래프 크기와 무관)"""
+        return {
+            "total_nodes": len(self.nodes),
+            "total_relationships": len(self.relationships),
+            "concept_count": self.count("Concept"),
+            "tag_count": self.count("Tag"),
+            "thought_count": self.count("Thought"),
+            "category_count": self.count("Category"),
+        }
+
     def has_concept(self, concept_name: str) -> bool:
         """개념 존재 여부 (이름으로 검색)"""
-        for node in self.nodes.values():
-            if node.label == "Concept" and node.properties.get("name") == concept_name:
-                return True
-        return False
+        return self.get_concept_id(concept_name) is not None
 
     def get_concept_id(self, concept_name: str) -> Optional[str]:
-        """개념 ID 찾기"""
-        for node_id, node in self.nodes.items():
-            if node.label == "Concept" and node.properties.get("name") == concept_name:
-                return node_id
-        return None
+        """개념 ID 찾기 (이름이 같은 개념이 없으면 canonical key가 같은 개념)"""
+        return (
+            self.find_node_id("Concept", concept_name)
+            or self._canonical_index.get(canonical_key(concept_name))
+        )
+
+    def get_category_id(self, category_name: str) -> Optional[str]:
+        """카테고리 ID 찾기"""
+        return self.find_node_id("Category", category_name)
+
+    def get_tag_id(self, tag_name: str) -> Optional[str]:
+        """태그 ID 찾기"""
+        return self.find_node_id("Tag", tag_name)
 
     def get_all_concepts(self) -> list[str]:
         """모든 개념 이름 목록"""
-        return [
-            node.properties.get("name", "")
-            for node in self.nodes.values()
-            if node.label == "Concept"
-        ]
+        return self.get_names("Concept")
+
+    def get_all_categories(self) -> list[str]:
+        """모든 카테고리 이름 목록"""
+        return self.get_names("Category")
 
     def get_all_tags(self) -> list[str]:
         """모든 태그 이름 목록"""
-        return [
-            node.properties.get("name", "")
-            for node in self.nodes.values()
-            if node.label == "Tag"
-        ]
+        return self.get_names("Tag")
 
     def add_node(self, node: GraphNode):
-        """노드 추가"""
+        """노드 추가 (인덱스 갱신)"""
+        previous = self.nodes.get(node.id)
+        if previous is not None and (
+            previous.label != node.label
+            or previous.properties.get("name") != node.properties.get("name")
+        ):
+            self._unindex_node(previous)
+
         self.nodes[node.id] = node
+        self._label_index.setdefault(node.label, {})[node.id] = None
+
+        name = node.properties.get("name")
+        if name:
+            # 같은 이름이 이미 있으면 먼저 추가된 노드 유지
+            self._name_index.setdefault(node.label, {}).setdefault(
+                normalize_name(name), node.id
+            )
+            if node.label == "Concept":
+                self._canonical_index.setdefault(canonical_key(name), node.id)
+
+    def _unindex_node(self, node: GraphNode):
+        """기존 노드의 인덱스 항목 제거
+
+        이름 인덱스가 이 노드를 가리키고 있었으면 같은 이름(키)의
+        다른 노드 중 먼저 추가된 것으로 대체함.
+        """
+        self._label_index.get(node.label, {}).pop(node.id, None)
+
+        name = node.properties.get("name")
+        if not name:
+            return
+
+        names = self._name_index.get(node.label, {})
+        key = normalize_name(name)
+        if names.get(key) == node.id:
+            del names[key]
+            survivor = self._find_by_key(node.label, normalize_name, key)
+            if survivor is not None:
+                names[key] = survivor
+
+        if node.label == "Concept":
+            key = canonical_key(name)
+            if self._canonical_index.get(key) == node.id:
+                del self._canonical_index[key]
+                survivor = self._find_by_key("Concept", canonical_key, key)
+                if survivor is not None:
+                    self._canonical_index[key] = survivor
+
+    def _find_by_key(self, label: str, key_of, key: str) -> Optional[str]:
+        """라벨의 노드 중 이름 키가 같은 첫 노드 (인덱스 대체용, 선형 탐색)"""
+        for node_id in self._label_index.get(label, {}):
+            name = self.nodes[node_id].properties.get("name")
+            if name and key_of(name) == key:
+                return node_id
+        return None
+
+    def has_relationship(self, source_id: str, target_id: str, rel_type: str) -> bool:
+        """관계 존재 여부 (source, target, type 기준)"""
+        return (source_id, target_id, rel_type) in self._rel_index
 
-    def add_relationship(self, rel: GraphRelationship):
-        """관계 추가"""
+    def get_relationship(
+        self,
+        source_id: str,
+        target_id: str,
+        rel_type: str
+    ) -> Optional[GraphRelationship]:
+        """관계 찾기"""
+        index = self._rel_index.get((source_id, target_id, rel_type))
+        return self.relationships[index] if index is not None else None
+
+    def get_relationships(
+        self,
+        node_id: str,
+        direction: str = "out",
+        rel_type: Optional[str] = None
+    ) -> list[GraphRelationship]:
+        """노드에 연결된 관계 목록
+
+        Args:
+            node_id: 노드 ID
+            direction: "out" | "in" | "both"
+            rel_type: 관계 타입 필터 (None이면 전체)
+        """
+        indexes = []
+        if direction in ("out", "both"):
+            indexes.extend(self._out_edges.get(node_id, []))
+        if direction in ("in", "both"):
+            indexes.extend(self._in_edges.get(node_id, []))
+
+        rels = (self.relationships[i] for i in indexes)
+        if rel_type is None:
+            return list(rels)
+        return [rel for rel in rels if rel.rel_type == rel_type]
+
+    def get_neighbors(
+        self,
+        node_id: str,
+        direction: str = "out",
+        rel_type: Optional[str] = None
+    ) -> list[str]:
+        """인접 노드 ID 목록"""
+        neighbors = []
+        for rel in self.get_relationships(node_id, direction, rel_type):
+            neighbors.append(
+                rel.target_id if rel.source_id == node_id else rel.source_id
+            )
+        return neighbors
+
+    def add_relationship(self, rel: GraphRelationship) -> bool:
+        """관계 추가 (중복이면 프로퍼티만 갱신)
+
+        Returns:
+            새로 추가되었으면 True
+        """
+        key = (rel.source_id, rel.target_id, rel.rel_type)
+        index = self._rel_index.get(key)
+        if index is not None:
+            existing = self.relationships[index]
+            if rel.properties and existing is not rel:
+                existing.properties.update(rel.properties)
+            return False
+
+        index = len(self.relationships)
         self.relationships.append(rel)
+        self._rel_index[key] = index
+        self._out_edges.setdefault(rel.source_id, []).append(index)
+        self._in_edges.setdefault(rel.target_id, []).append(index)
+        return True
 
 
 class CypherManager:
-    """Cypher 파일 관리"""
+    """Cypher 파일 관리
+
+    그래프 상태 저장소는 설정의 graph.backend로 선택:
+        memory: GraphState (기본, 스냅샷 사이드카 사용)
+        sqlite: SQLiteGraphState (graph.cypher.db, 메모리보다 큰 그래프용)
+    """
 
-    def __init__(self, output_path: str = "data/output/graph.cypher"):
+    def __init__(
+        self,
+        output_path: str = "data/output/graph.cypher",
+        use_snapshot: bool = True,
+        backend: Optional[str] = None,
+        sqlite_path: Optional[str] = None
+    ):
         self.output_path = Path(output_path)
-        self.state = GraphState()
+        self.use_snapshot = use_snapshot
+
+        if backend is None:
+            from src.core.config import get_config
+            graph_config = get_config().graph
+            backend = graph_config.backend
+            sqlite_path = sqlite_path or graph_config.sqlite_path or None
+
+        if backend not in ("memory", "sqlite"):
+            from src.core.exceptions import ConfigError
+            raise ConfigError(f"지원하지 않는 그래프 저장소: {backend}")
+
+        self.backend = backend
+        self.sqlite_path = (
+            Path(sqlite_path) if sqlite_path
+            else self.output_path.with_name(self.output_path.name + ".db")
+        )
+        self.state = self._new_state()
+        # state에 반영된 Cypher 파일의 바이트 오프셋과 그 직전 구간의 지문
+        self.loaded_offset = 0
+        self._loaded_fingerprint = None
+
+    @property
+    def snapshot_path(self) -> Path:
+        """바이너리 스냅샷 경로 (graph.cypher.snap)"""
+        return self.output_path.with_name(self.output_path.name + ".snap")
+
+    def _new_state(self):
+        """빈 그래프 상태 (sqlite는 기존 데이터베이스를 비워서 재사용)"""
+        if self.backend != "sqlite":
+            return GraphState()
+
+        from src.tools.cypher.sqlite_state import SQLiteGraphState
+
+        state = getattr(self, "state", None)
+        if isinstance(state, SQLiteGraphState):
+            state.clear()
+            return state
+        return SQLiteGraphState(self.sqlite_path)
 
     def load_existing(self) -> GraphState:
-        """기존 Cypher 파일에서 상태 로드"""
+        """기존 Cypher 파일에서 상태 로드
+
+        스냅샷(sqlite는 데이터베이스에 기록된 오프셋)이 유효하면
+        그 이후에 추가된 Cypher만 파싱.
+        """
+        from src.tools.cypher.snapshot import GraphSnapshot
+
+        if self.backend == "sqlite":
+            return self._load_sqlite()
+
         if not self.output_path.exists():
             return self.state
 
-        content = self.output_path.read_text(encoding='utf-8')
-        self._parse_cypher(content)
+        start_offset = 0
+        if self.use_snapshot:
+            try:
+                start_offset = GraphSnapshot.load_into(
+                    self.state, self.snapshot_path, self.output_path
+                ) or 0
+            except Exception:
+                # 손상된 스냅샷은 무시하고 전체 파싱
+                self.state = GraphState()
+                start_offset = 0
+
+        self._load_from(start_offset)
 
         return self.state
 
-    def _parse_cypher(self, content: str):
-        """Cypher 쿼리 파싱하여 노드/관계 추출"""
-        lines = content.split('\n')
+    def _load_sqlite(self):
+        """SQLite 저장소를 Cypher 파일과 맞춤"""
+        from src.tools.cypher.snapshot import cypher_fingerprint
 
-        for line in lines:
-            line = line.strip()
-            if not line or line.startswith('//'):
-                continue
+        if not self.output_path.exists():
+            self.state = self._new_state()
+            self._set_loaded_offset(0)
+            return self.state
 
-            # MERGE (n:Label {id: "...", ...}) 패턴
-            node_match = re.search(
-                r'MERGE\s+\((\w+):(\w+)\s+\{([^}]+)\}\)',
-                line, re.IGNORECASE
-            )
-            if node_match:
-                var_name, label, props_str = node_match.groups()
-                props = self._parse_properties(props_str)
-
-                if 'id' in props:
-                    node = GraphNode(
-                        id=props['id'],
-                        label=label,
-                        properties={k: v for k, v in props.items() if k != 'id'}
-                    )
-                    self.state.add_node(node)
-                continue
-
-            # MATCH ... MERGE (a)-[:REL]->(b) 패턴
-            rel_match = re.search(
-                r'MATCH.*\{id:\s*"([^"]+)"\}.*\{id:\s*"([^"]+)"\}.*'
-                r'MERGE.*\[:(\w+)(?:\s*\{([^}]*)\})?\]',
-                line, re.IGNORECASE
+        offset = self.state.get_meta("cypher_offset")
+        fingerprint = self.state.get_meta("cypher_fingerprint")
+        start_offset = 0
+        if offset is not None and fingerprint is not None:
+            offset = int(offset)
+            if (
+                offset <= self.output_path.stat().st_size
+                and str(cypher_fingerprint(self.output_path, offset)) == fingerprint
+            ):
+                start_offset = offset
+
+        if start_offset == 0:
+            # 기록된 오프셋이 파일과 맞지 않음: 처음부터 다시 구성
+            self.state = self._new_state()
+
+        self._load_from(start_offset)
+        self.state.commit()
+        return self.state
+
+    def _load_from(self, start_offset: int):
+        """start_offset 이후의 Cypher를 state에 반영"""
+        from src.tools.cypher.loader import CypherStreamLoader
+
+        loader = CypherStreamLoader()
+        self._set_loaded_offset(
+            loader.load_into(self.state, self.output_path, start_offset)
+        )
+        if loader.rejected_batches:
+            logger.warning(
+                f"체크섬이 맞지 않거나 중간에 끊긴 배치 {loader.rejected_batches}개를 "
+                f"건너뜀: {self.output_path}"
             )
-            if rel_match:
-                source_id, target_id, rel_type = rel_match.groups()[:3]
-                props_str = rel_match.groups()[3] if len(rel_match.groups()) > 3 else None
 
-                rel = GraphRelationship(
-                    source_id=source_id,
-                    target_id=target_id,
-                    rel_type=rel_type,
-                    properties=self._parse_properties(props_str) if props_str else {}
-                )
-                self.state.add_relationship(rel)
+    def _set_loaded_offset(self, offset: int):
+        """반영 오프셋과 지문 갱신"""
+        from src.tools.cypher.snapshot import cypher_fingerprint
+
+        self.loaded_offset = offset
+        self._loaded_fingerprint = (
+            cypher_fingerprint(self.output_path, offset) if offset else None
+        )
+
+    def _is_replaced(self, size: int) -> bool:
+        """반영한 구간이 더 이상 파일과 맞지 않는지 (압축/교체 등)"""
+        from src.tools.cypher.snapshot import cypher_fingerprint
+
+        if size < self.loaded_offset:
+            return True
+        if not self.loaded_offset:
+            return False
+        return (
+            cypher_fingerprint(self.output_path, self.loaded_offset)
+            != self._loaded_fingerprint
+        )
+
+    def save_snapshot(self):
+        """현재 상태를 스냅샷으로 저장 (loaded_offset까지 반영된 상태 기준)
 
-    def _parse_properties(self, props_str: str) -> dict:
-        """프로퍼티 문자열 파싱"""
-        props = {}
-        if not props_str:
-            return props
+        sqlite 저장소는 반영된 오프셋을 데이터베이스에 기록하고 커밋.
+        """
+        from src.tools.cypher.snapshot import GraphSnapshot, cypher_fingerprint
 
-        pattern = r'(\w+):\s*(?:"([^"]*)"|(\d+(?:\.\d+)?)|(\w+))'
-        for match in re.finditer(pattern, props_str):
-            key = match.group(1)
-            value = match.group(2) or match.group(3) or match.group(4)
+        if not self.output_path.exists():
+            return
+
+        if self.backend == "sqlite":
+            self.state.set_meta("cypher_offset", str(self.loaded_offset))
+            self.state.set_meta(
+                "cypher_fingerprint",
+                str(cypher_fingerprint(self.output_path, self.loaded_offset))
+            )
+            self.state.commit()
+            return
 
-            if match.group(3):
-                value = float(value) if '.' in value else int(value)
+        if not self.use_snapshot:
+            return
 
-            props[key] = value
+        GraphSnapshot.save(
+            self.state, self.snapshot_path, self.output_path,
+            cypher_offset=self.loaded_offset
+        )
 
-        return props
+    def _parse_cypher(self, content: str):
+        """Cypher 쿼리 파싱하여 노드/관계 추출"""
+        from src.tools.cypher.loader import CypherStreamLoader
+
+        CypherStreamLoader().load_text(self.state, content)
 
     def generate_node_id(self, label: str, name: str) -> str:
-        """노드 ID 생성"""
-        clean_name = re.sub(r'[^a-zA-Z0-9가-힣]', '_', name)[:30]
-        timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-        return f"{label.lower()}_{clean_name}_{timestamp}"
+        """노드 ID 생성 (내용 기반, 실행마다 동일)
 
-    def append_queries(self, queries: list[str]):
-        """쿼리들을 파일에 추가"""
-        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        라벨과 정규화된 키의 해시로 만들어지므로 같은 개념/문서는
+        항상 같은 ID를 가지며, MERGE가 Neo4j 쪽에서 중복을 제거함.
+        """
+        digest = xxhash.xxh3_64_hexdigest(f"{label}\x00{normalize_name(name)}")
+        return f"{label.lower()}_{digest}"
+
+    def thought_key(self, source_file: str, section: str = "") -> str:
+        """Thought 노드 키 (출처 경로 + 섹션)"""
+        return f"{source_file}#{section}" if section else source_file
 
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        header = f"\n// === Added: {timestamp} ===\n"
+    def append_queries(self, queries: list[str]):
+        """쿼리들을 파일에 추가 (staging → 잠금 → append, 배치 체크섬 포함)
+
+        잠금을 잡은 뒤 다른 프로세스가 그 사이 추가한 내용을 먼저 state에
+        반영하고, 이번 배치도 state에 반영하므로 loaded_offset은 항상
+        state가 다루는 파일 구간과 일치함 (노드/관계 추가는 id/키 기준이라
+        호출자가 이미 반영한 문장을 다시 반영해도 같음).
+        """
+        from src.tools.cypher.loader import parse_statement
+        from src.tools.cypher.writer import CypherFileWriter
+
+        if not queries:
+            return
+
+        writer = CypherFileWriter(self.output_path)
+        staged = writer.stage(queries)
+
+        with writer.lock():
+            size = self.output_path.stat().st_size if self.output_path.exists() else 0
+            if self._is_replaced(size):
+                # 압축 등으로 파일이 교체됨 (크기가 같거나 커도 지문이 다름): 다시 로드
+                self.state = self._new_state()
+                self._load_from(0)
+            elif size > self.loaded_offset:
+                self._load_from(self.loaded_offset)
 
-        with open(self.output_path, 'a', encoding='utf-8') as f:
-            f.write(header)
             for query in queries:
-                f.write(query + '\n')
+                statement = parse_statement(query)
+                if isinstance(statement, GraphNode):
+                    self.state.add_node(statement)
+                elif statement is not None:
+                    self.state.add_relationship(statement)
+
+            self._set_loaded_offset(writer.commit(staged))
 
     def create_thought_node(
         self,
         title: str,
         content: str,
-        source_file: str
+        source_file: str,
+        section: str = ""
     ) -> tuple[GraphNode, str]:
-        """Thought 노드 생성"""
-        node_id = self.generate_node_id("Thought", title)
+        """Thought 노드 생성
+
+        같은 출처/섹션의 노드가 이미 있고 내용이 같으면 빈 쿼리 반환.
+        """
+        node_id = self.generate_node_id(
+            "Thought", self.thought_key(source_file, section)
+        )
+        content_hash = xxhash.xxh3_64_hexdigest(content)
+
+        existing = self.state.nodes.get(node_id)
+        if (existing is not None
+                and existing.properties.get("content_hash") == content_hash
+                and existing.properties.get("title") == title):
+            return existing, ""
+
+        properties = {
+            "title": title,
+            "content": content[:500],
+            "content_hash": content_hash,
+            "source": source_file,
+        }
+        if section:
+            properties["section"] = section
+        properties["created_at"] = (
+            existing.properties.get("created_at") if existing is not None else None
+        ) or datetime.now().isoformat()
 
         node = GraphNode(
             id=node_id,
             label="Thought",
-            properties={
-                "title": title,
-                "content": content[:500],
-                "source": source_file,
-                "created_at": datetime.now().isoformat()
-            }
+            properties=properties
         )
 
         return node, node.to_cypher()
@@ -301,7 +706,11 @@ class CypherManager:
         rel_type: str,
         properties: dict = None
     ) -> tuple[GraphRelationship, str]:
-        """관계 생성"""
+        """관계 생성 (이미 있으면 빈 쿼리)"""
+        existing = self.state.get_relationship(source_id, target_id, rel_type)
+        if existing is not None:
+            return existing, ""
+
         rel = GraphRelationship(
             source_id=source_id,
             target_id=target_id,
@@ -309,4 +718,6 @@ class CypherManager:
             properties=properties or {}
         )
 
-        return rel, rel.to_cypher()
+        return rel, rel.to_cypher(
+            self.state.get_label(source_id), self.state.get_label(target_id)
+        )
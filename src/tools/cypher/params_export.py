@@ -0,0 +1,252 @@
+"""파라미터 템플릿 + JSON Lines 내보내기
+
+쿼리 텍스트는 라벨/관계 그룹별 고정 템플릿 몇 개로만 구성하고,
+데이터는 orjson으로 직렬화한 JSON Lines 파일에 스트리밍으로 기록함.
+쿼리 텍스트가 바뀌지 않으므로 Neo4j 플랜 캐시가 재사용되고,
+값이 쿼리에 삽입되지 않아 이스케이프 문제가 생기지 않음.
+
+출력:
+    templates.cypher
+        // @schema
+        CREATE CONSTRAINT concept_id IF NOT EXISTS
+            FOR (n:Concept) REQUIRE n.id IS UNIQUE;
+        // @template node:Concept
+        UNWIND $rows AS row MERGE (n:Concept {id: row.id}) SET n += row.props;
+    params.jsonl
+        {"t":"node:Concept","row":{"id":"concept_...","props":{"name":"LangGraph"}}}
+
+ParameterizedLoader가 같은 템플릿의 연속된 행을 배치로 묶어 드라이버로 실행함.
+"""
+
+import time
+from pathlib import Path
+from typing import Iterator, Optional, Union
+
+import orjson
+
+from src.core.exceptions import ExportError
+from src.tools.cypher.batch_export import (
+    node_template,
+    relationship_template,
+    schema_statements,
+)
+from src.tools.cypher.manager import GraphState
+
+
+TEMPLATES_FILE = "templates.cypher"
+PARAMS_FILE = "params.jsonl"
+
+_SCHEMA_MARKER = "// @schema"
+_TEMPLATE_MARKER = "// @template "
+
+
+def node_template_key(label: str) -> str:
+    return f"node:{label}"
+
+
+def relationship_template_key(
+    rel_type: str,
+    source_label: Optional[str] = None,
+    target_label: Optional[str] = None
+) -> str:
+    return f"rel:{rel_type}:{source_label or ''}:{target_label or ''}"
+
+
+def read_templates(path: Union[str, Path]) -> tuple[list[str], dict[str, str]]:
+    """templates.cypher 읽기
+
+    Returns:
+        (스키마 문장 목록, {템플릿 키: 쿼리})
+    """
+    schema: list[str] = []
+    templates: dict[str, str] = {}
+    key: Optional[str] = None
+
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            if line == _SCHEMA_MARKER:
+                key = None
+            elif line.startswith(_TEMPLATE_MARKER):
+                key = line[len(_TEMPLATE_MARKER):].strip()
+            elif not line.startswith("//"):
+                statement = line.rstrip(";")
+                if key is None:
+                    schema.append(statement)
+                else:
+                    templates[key] = statement
+
+    return schema, templates
+
+
+class ParameterizedExporter:
+    """파라미터 템플릿 + JSON Lines 내보내기
+
+    사용법:
+        exporter = ParameterizedExporter()
+        stats = exporter.export(state, "data/output/neo4j/params")
+    """
+
+    def export(self, state: GraphState, output_dir: Union[str, Path]) -> dict:
+        """templates.cypher / params.jsonl 저장
+
+        Returns:
+            {templates_file, params_file, templates, nodes, relationships}
+        """
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        templates: dict[str, str] = {}
+        stats = {
+            "templates_file": str(output_dir / TEMPLATES_FILE),
+            "params_file": str(output_dir / PARAMS_FILE),
+            "nodes": 0,
+            "relationships": 0,
+        }
+
+        # 같은 템플릿의 행이 연속되도록 라벨/관계 그룹 순서로 기록
+        with open(output_dir / PARAMS_FILE, "wb", buffering=1 << 20) as f:
+            for key, template, row in self._iter_rows(state):
+                templates.setdefault(key, template)
+                f.write(orjson.dumps({"t": key, "row": row}))
+                f.write(b"\n")
+                if key.startswith("node:"):
+                    stats["nodes"] += 1
+                else:
+                    stats["relationships"] += 1
+
+        with open(output_dir / TEMPLATES_FILE, "w", encoding="utf-8") as f:
+            f.write(_SCHEMA_MARKER + "\n")
+            for statement in schema_statements(state.get_labels()):
+                f.write(statement + ";\n")
+            for key, template in templates.items():
+                f.write(f"\n{_TEMPLATE_MARKER}{key}\n{template};\n")
+
+        stats["templates"] = len(templates)
+        return stats
+
+    def _iter_rows(self, state: GraphState) -> Iterator[tuple[str, str, dict]]:
+        """(템플릿 키, 템플릿, 행)"""
+        for label in state.get_labels():
+            key = node_template_key(label)
+            template = node_template(label)
+            for node_id in state.get_node_ids(label):
+                yield key, template, {
+                    "id": node_id,
+                    "props": state.nodes[node_id].properties,
+                }
+
+        groups: dict[tuple, list[int]] = {}
+        for index, rel in enumerate(state.relationships):
+            source = state.nodes.get(rel.source_id)
+            target = state.nodes.get(rel.target_id)
+            group = (
+                rel.rel_type,
+                source.label if source else None,
+                target.label if target else None,
+            )
+            groups.setdefault(group, []).append(index)
+
+        for group, indexes in groups.items():
+            key = relationship_template_key(*group)
+            template = relationship_template(*group)
+            for index in indexes:
+                rel = state.relationships[index]
+                yield key, template, {
+                    "source": rel.source_id,
+                    "target": rel.target_id,
+                    "props": rel.properties,
+                }
+
+
+class ParameterizedLoader:
+    """templates.cypher + params.jsonl을 Neo4j에 적재
+
+    같은 템플릿의 연속된 행을 batch_size 단위로 묶어
+    쓰기 트랜잭션 하나로 실행함 (드라이버 측 배치).
+
+    사용법:
+        loader = ParameterizedLoader.from_config(get_config().neo4j)
+        stats = loader.load("data/output/neo4j/params")
+        loader.close()
+    """
+
+    def __init__(self, driver, database: str = "neo4j", batch_size: int = 1000):
+        self.driver = driver
+        self.database = database
+        self.batch_size = max(1, batch_size)
+
+    @classmethod
+    def from_config(
+        cls, config, batch_size: Optional[int] = None
+    ) -> "ParameterizedLoader":
+        """Neo4jConfig로 드라이버 생성"""
+        try:
+            from neo4j import GraphDatabase
+        except ImportError:
+            raise ExportError(
+                "Neo4j 적재에는 neo4j 패키지가 필요합니다 (pip install -e .[neo4j])"
+            )
+
+        driver = GraphDatabase.driver(
+            config.uri, auth=(config.username, config.password)
+        )
+        return cls(driver, config.database, batch_size or config.export_batch_size)
+
+    def close(self):
+        self.driver.close()
+
+    def load(self, export_dir: Union[str, Path]) -> dict:
+        """스키마 생성 후 파라미터 배치 실행
+
+        Returns:
+            {schema, rows, batches, seconds, rows_per_second}
+        """
+        export_dir = Path(export_dir)
+        schema, templates = read_templates(export_dir / TEMPLATES_FILE)
+
+        stats = {"schema": 0, "rows": 0, "batches": 0}
+        started = time.perf_counter()
+
+        with self.driver.session(database=self.database) as session:
+            for statement in schema:
+                session.run(statement).consume()
+                stats["schema"] += 1
+
+            for key, rows in self._iter_batches(export_dir / PARAMS_FILE):
+                template = templates.get(key)
+                if template is None:
+                    raise ExportError(f"templates.cypher에 없는 템플릿: {key}")
+                session.execute_write(_run_batch, template, rows)
+                stats["rows"] += len(rows)
+                stats["batches"] += 1
+
+        elapsed = time.perf_counter() - started
+        stats["seconds"] = round(elapsed, 3)
+        stats["rows_per_second"] = round(stats["rows"] / elapsed, 1) if elapsed else 0.0
+        return stats
+
+    def _iter_batches(self, params_path: Path) -> Iterator[tuple[str, list[dict]]]:
+        """params.jsonl을 스트리밍으로 읽어 (템플릿 키, 행 배치) 생성"""
+        key: Optional[str] = None
+        rows: list[dict] = []
+
+        with open(params_path, "rb", buffering=1 << 20) as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = orjson.loads(line)
+                if rows and (record["t"] != key or len(rows) >= self.batch_size):
+                    yield key, rows
+                    rows = []
+                key = record["t"]
+                rows.append(record["row"])
+
+        if rows:
+            yield key, rows
+
+
+def _run_batch(tx, template: str, rows: list[dict]):
+    tx.run(template, rows=rows).consume()
@@ -0,0 +1,354 @@
+"""그래프 스냅샷 (바이너리 사이드카)
+
+GraphState를 문자열 인터닝 + 배열 기반의 고정 레이아웃으로 저장.
+로드할 때는 파일을 한 번 읽고 각 섹션을 memoryview.cast로 복사 없이 해석하며
+(섹션이 8바이트 정렬이라 mmap으로 열어도 같은 방식으로 읽을 수 있음),
+노드/관계는 모두 GraphState 객체로 옮기므로 mmap 대신 일반 읽기를 사용함.
+스냅샷이 다루는 graph.cypher의 바이트 오프셋을 함께 기록하여
+다음 실행에서는 그 이후에 추가된 Cypher만 파싱하면 됨.
+
+레이아웃 (리틀 엔디언, 각 섹션은 8바이트 정렬):
+    header
+    strings.offsets  uint64[string_count + 1]
+    strings.blob     utf-8 bytes
+    nodes.id         uint32[node_count]      (문자열 인덱스)
+    nodes.label      uint32[node_count]
+    nodes.props      uint32[node_count + 1]  (props 시작 위치)
+    rels.source      uint32[rel_count]
+    rels.target      uint32[rel_count]
+    rels.type        uint32[rel_count]
+    rels.props       uint32[rel_count + 1]
+    props.key        uint32[prop_count]
+    props.kind       uint8[prop_count]
+    props.value      int64[prop_count]       (문자열 인덱스 / 정수 / 실수 비트)
+
+int64 범위를 벗어난 정수는 10진 문자열로 인터닝하고 별도 종류(_KIND_BIGINT)로 표시함.
+"""
+
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Optional, Union
+
+import xxhash
+
+from src.tools.cypher.manager import GraphNode, GraphRelationship, GraphState
+
+
+MAGIC = b"KGSNAP01"
+VERSION = 1
+
+# 스냅샷이 다루는 Cypher 파일 구간의 끝부분 지문 크기
+FINGERPRINT_BYTES = 1 << 16
+
+_HEADER = struct.Struct("<8sIIQQQQQQ")
+_SECTIONS = (
+    ("str_offsets", "Q"),
+    ("str_blob", "B"),
+    ("node_id", "I"),
+    ("node_label", "I"),
+    ("node_props", "I"),
+    ("rel_source", "I"),
+    ("rel_target", "I"),
+    ("rel_type", "I"),
+    ("rel_props", "I"),
+    ("prop_key", "I"),
+    ("prop_kind", "B"),
+    ("prop_value", "q"),
+)
+_SECTION_TABLE = struct.Struct("<" + "QQ" * len(_SECTIONS))
+
+_KIND_STR = 0
+_KIND_INT = 1
+_KIND_FLOAT = 2
+_KIND_BOOL = 3
+_KIND_NULL = 4
+_KIND_BIGINT = 5
+
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+_DOUBLE = struct.Struct("<d")
+_INT64 = struct.Struct("<q")
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def cypher_fingerprint(cypher_path: Union[str, Path], offset: int) -> int:
+    """Cypher 파일의 [offset - FINGERPRINT_BYTES, offset) 구간 해시"""
+    start = max(0, offset - FINGERPRINT_BYTES)
+    hasher = xxhash.xxh64()
+    with open(cypher_path, "rb") as f:
+        f.seek(start)
+        hasher.update(f.read(offset - start))
+    return hasher.intdigest()
+
+
+class _StringTable:
+    """문자열 인터닝 테이블"""
+
+    def __init__(self):
+        self.index: dict[str, int] = {}
+        self.offsets = array("Q", [0])
+        self.blob = bytearray()
+
+    def intern(self, value: str) -> int:
+        sid = self.index.get(value)
+        if sid is None:
+            sid = len(self.index)
+            self.index[value] = sid
+            self.blob += value.encode("utf-8")
+            self.offsets.append(len(self.blob))
+        return sid
+
+
+class GraphSnapshot:
+    """그래프 스냅샷 저장/로드
+
+    사용법:
+        GraphSnapshot.save(state, "graph.cypher.snap", "graph.cypher")
+        offset = GraphSnapshot.load_into(state, "graph.cypher.snap", "graph.cypher")
+    """
+
+    @staticmethod
+    def save(
+        state: GraphState,
+        snapshot_path: Union[str, Path],
+        cypher_path: Union[str, Path],
+        cypher_offset: Optional[int] = None
+    ) -> int:
+        """스냅샷 저장 (임시 파일에 쓰고 교체)
+
+        Args:
+            state: 저장할 그래프 상태
+            snapshot_path: 스냅샷 파일 경로
+            cypher_path: 스냅샷이 다루는 Cypher 파일
+            cypher_offset: 반영된 Cypher 바이트 오프셋 (None이면 현재 파일 크기)
+
+        Returns:
+            기록된 Cypher 오프셋
+        """
+        cypher_path = Path(cypher_path)
+        if cypher_offset is None:
+            cypher_offset = cypher_path.stat().st_size if cypher_path.exists() else 0
+        fingerprint = (
+            cypher_fingerprint(cypher_path, cypher_offset) if cypher_offset else 0
+        )
+
+        strings = _StringTable()
+        node_id = array("I")
+        node_label = array("I")
+        node_props = array("I", [0])
+        rel_source = array("I")
+        rel_target = array("I")
+        rel_type = array("I")
+        rel_props = array("I")
+        prop_key = array("I")
+        prop_kind = array("B")
+        prop_value = array("q")
+
+        def add_props(properties: dict):
+            for key, value in properties.items():
+                prop_key.append(strings.intern(key))
+                if isinstance(value, bool):
+                    prop_kind.append(_KIND_BOOL)
+                    prop_value.append(int(value))
+                elif value is None:
+                    prop_kind.append(_KIND_NULL)
+                    prop_value.append(0)
+                elif isinstance(value, int):
+                    if _INT64_MIN <= value <= _INT64_MAX:
+                        prop_kind.append(_KIND_INT)
+                        prop_value.append(value)
+                    else:
+                        prop_kind.append(_KIND_BIGINT)
+                        prop_value.append(strings.intern(str(value)))
+                elif isinstance(value, float):
+                    prop_kind.append(_KIND_FLOAT)
+                    prop_value.append(_INT64.unpack(_DOUBLE.pack(value))[0])
+                else:
+                    prop_kind.append(_KIND_STR)
+                    prop_value.append(strings.intern(str(value)))
+
+        for node in state.nodes.values():
+            node_id.append(strings.intern(node.id))
+            node_label.append(strings.intern(node.label))
+            add_props(node.properties)
+            node_props.append(len(prop_key))
+
+        rel_props.append(len(prop_key))
+        for rel in state.relationships:
+            rel_source.append(strings.intern(rel.source_id))
+            rel_target.append(strings.intern(rel.target_id))
+            rel_type.append(strings.intern(rel.rel_type))
+            add_props(rel.properties)
+            rel_props.append(len(prop_key))
+
+        payloads = {
+            "str_offsets": strings.offsets,
+            "str_blob": strings.blob,
+            "node_id": node_id,
+            "node_label": node_label,
+            "node_props": node_props,
+            "rel_source": rel_source,
+            "rel_target": rel_target,
+            "rel_type": rel_type,
+            "rel_props": rel_props,
+            "prop_key": prop_key,
+            "prop_kind": prop_kind,
+            "prop_value": prop_value,
+        }
+
+        if sys.byteorder != "little":
+            for name, typecode in _SECTIONS:
+                if typecode != "B":
+                    payloads[name].byteswap()
+
+        header = _HEADER.pack(
+            MAGIC, VERSION, 0, cypher_offset, fingerprint,
+            len(strings.index), len(node_id), len(rel_source), len(prop_key)
+        )
+
+        table = []
+        position = _align(_HEADER.size + _SECTION_TABLE.size)
+        for name, _ in _SECTIONS:
+            size = len(memoryview(payloads[name]).cast("B"))
+            table.extend((position, size))
+            position = _align(position + size)
+
+        snapshot_path = Path(snapshot_path)
+        snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = snapshot_path.with_name(f"{snapshot_path.name}.{os.getpid()}.tmp")
+
+        with open(tmp_path, "wb") as f:
+            f.write(header)
+            f.write(_SECTION_TABLE.pack(*table))
+            for (name, _), section_offset in zip(_SECTIONS, table[::2]):
+                f.write(b"\0" * (section_offset - f.tell()))
+                f.write(memoryview(payloads[name]).cast("B"))
+            f.flush()
+            os.fsync(f.fileno())
+
+        os.replace(tmp_path, snapshot_path)
+        return cypher_offset
+
+    @staticmethod
+    def read_offset(
+        snapshot_path: Union[str, Path],
+        cypher_path: Union[str, Path]
+    ) -> Optional[int]:
+        """스냅샷이 현재 Cypher 파일과 일치하면 반영된 오프셋 반환"""
+        snapshot_path = Path(snapshot_path)
+        cypher_path = Path(cypher_path)
+        if not snapshot_path.exists() or not cypher_path.exists():
+            return None
+
+        with open(snapshot_path, "rb") as f:
+            raw = f.read(_HEADER.size)
+        if len(raw) < _HEADER.size:
+            return None
+
+        magic, version, _, offset, fingerprint, *_ = _HEADER.unpack(raw)
+        if magic != MAGIC or version != VERSION:
+            return None
+        if offset > cypher_path.stat().st_size:
+            return None
+        if offset and cypher_fingerprint(cypher_path, offset) != fingerprint:
+            return None
+        return offset
+
+    @staticmethod
+    def load_into(
+        state: GraphState,
+        snapshot_path: Union[str, Path],
+        cypher_path: Union[str, Path]
+    ) -> Optional[int]:
+        """스냅샷을 GraphState에 반영
+
+        Returns:
+            스냅샷이 다루는 Cypher 오프셋, 사용할 수 없으면 None
+        """
+        offset = GraphSnapshot.read_offset(snapshot_path, cypher_path)
+        if offset is None:
+            return None
+
+        GraphSnapshot._decode(Path(snapshot_path).read_bytes(), state)
+        return offset
+
+    @staticmethod
+    def _decode(data: bytes, state: GraphState):
+        """스냅샷 바이트에서 노드/관계 복원"""
+        view = memoryview(data)
+        sections = {}
+        try:
+            table = _SECTION_TABLE.unpack_from(view, _HEADER.size)
+            for index, (name, typecode) in enumerate(_SECTIONS):
+                start, size = table[index * 2], table[index * 2 + 1]
+                section = view[start:start + size]
+                if typecode == "B":
+                    sections[name] = section
+                elif sys.byteorder == "little":
+                    sections[name] = section.cast(typecode)
+                else:
+                    swapped = array(typecode, section.tobytes())
+                    swapped.byteswap()
+                    sections[name] = swapped
+
+            str_offsets = sections["str_offsets"]
+            blob = sections["str_blob"]
+            strings = [
+                str(blob[str_offsets[i]:str_offsets[i + 1]], "utf-8")
+                for i in range(len(str_offsets) - 1)
+            ]
+
+            prop_key = sections["prop_key"]
+            prop_kind = sections["prop_kind"]
+            prop_value = sections["prop_value"]
+
+            def props(start: int, end: int) -> dict:
+                result = {}
+                for i in range(start, end):
+                    kind = prop_kind[i]
+                    value = prop_value[i]
+                    if kind == _KIND_STR:
+                        value = strings[value]
+                    elif kind == _KIND_FLOAT:
+                        value = _DOUBLE.unpack(_INT64.pack(value))[0]
+                    elif kind == _KIND_BOOL:
+                        value = bool(value)
+                    elif kind == _KIND_NULL:
+                        value = None
+                    elif kind == _KIND_BIGINT:
+                        value = int(strings[value])
+                    result[strings[prop_key[i]]] = value
+                return result
+
+            node_id = sections["node_id"]
+            node_label = sections["node_label"]
+            node_props = sections["node_props"]
+            for i in range(len(node_id)):
+                state.add_node(GraphNode(
+                    id=strings[node_id[i]],
+                    label=strings[node_label[i]],
+                    properties=props(node_props[i], node_props[i + 1])
+                ))
+
+            rel_source = sections["rel_source"]
+            rel_target = sections["rel_target"]
+            rel_type = sections["rel_type"]
+            rel_props = sections["rel_props"]
+            for i in range(len(rel_source)):
+                state.add_relationship(GraphRelationship(
+                    source_id=strings[rel_source[i]],
+                    target_id=strings[rel_target[i]],
+                    rel_type=strings[rel_type[i]],
+                    properties=props(rel_props[i], rel_props[i + 1])
+                ))
+        finally:
+            for section in sections.values():
+                if isinstance(section, memoryview):
+                    section.release()
+            view.release()
@@ -0,0 +1,472 @@
+"""SQLite 기반 그래프 상태
+
+GraphState와 같은 조회/추가 API를 디스크의 SQLite 데이터베이스로 제공.
+노드/관계는 필요할 때만 읽어 GraphNode/GraphRelationship으로 만들므로
+메모리에 그래프 전체를 올리지 않음.
+
+스키마:
+    nodes(seq, id UNIQUE, label, name_key, canon_key, props)
+        인덱스: (label, seq), (label, name_key), (label, canon_key)
+    relationships(pos, source, target, type, props)
+        인덱스: (source, target, type), target
+    meta(key, value)
+        반영된 graph.cypher 오프셋/지문, canonical key 규칙 버전
+
+canon_key는 Concept 노드만 채움 (canonical.py). 별칭 설정이 바뀌면 열 때 다시 계산함.
+
+props는 orjson으로 직렬화한 JSON.
+반환된 노드/관계 객체를 직접 수정해도 저장되지 않으므로 add_node/add_relationship을 사용.
+"""
+
+import sqlite3
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import Iterator, Optional, Union
+
+import orjson
+
+from src.tools.cypher.canonical import canonical_key, get_canonicalizer
+from src.tools.cypher.manager import GraphNode, GraphRelationship, normalize_name
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS nodes (
+    seq INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    label TEXT NOT NULL,
+    name_key TEXT,
+    canon_key TEXT,
+    props BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS nodes_label ON nodes (label, seq);
+CREATE INDEX IF NOT EXISTS nodes_name ON nodes (label, name_key, seq);
+
+CREATE TABLE IF NOT EXISTS relationships (
+    pos INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    target TEXT NOT NULL,
+    type TEXT NOT NULL,
+    props BLOB NOT NULL,
+    UNIQUE (source, target, type)
+);
+CREATE INDEX IF NOT EXISTS relationships_target ON relationships (target);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# 이 수만큼 쓰기가 쌓이면 커밋 (대량 로드 시 저널 크기 제한)
+_COMMIT_INTERVAL = 50_000
+
+
+def _dumps(props: dict) -> bytes:
+    return orjson.dumps(props)
+
+
+def _loads(raw) -> dict:
+    return orjson.loads(raw) if raw else {}
+
+
+class _NodeMapping(Mapping):
+    """nodes 테이블의 읽기 전용 dict 뷰 (id → GraphNode)"""
+
+    def __init__(self, state: "SQLiteGraphState"):
+        self._state = state
+
+    def __getitem__(self, node_id: str) -> GraphNode:
+        row = self._state._conn.execute(
+            "SELECT id, label, props FROM nodes WHERE id = ?", (node_id,)
+        ).fetchone()
+        if row is None:
+            raise KeyError(node_id)
+        return GraphNode(id=row[0], label=row[1], properties=_loads(row[2]))
+
+    def __contains__(self, node_id) -> bool:
+        return self._state._conn.execute(
+            "SELECT 1 FROM nodes WHERE id = ?", (node_id,)
+        ).fetchone() is not None
+
+    def __iter__(self) -> Iterator[str]:
+        for (node_id,) in self._state._conn.execute(
+            "SELECT id FROM nodes ORDER BY seq"
+        ):
+            yield node_id
+
+    def __len__(self) -> int:
+        return self._state._node_count
+
+    def values(self) -> Iterator[GraphNode]:
+        for row in self._state._conn.execute(
+            "SELECT id, label, props FROM nodes ORDER BY seq"
+        ):
+            yield GraphNode(id=row[0], label=row[1], properties=_loads(row[2]))
+
+    def items(self) -> Iterator[tuple[str, GraphNode]]:
+        for node in self.values():
+            yield node.id, node
+
+
+class _RelationshipSequence(Sequence):
+    """relationships 테이블의 읽기 전용 리스트 뷰 (추가 순서)"""
+
+    def __init__(self, state: "SQLiteGraphState"):
+        self._state = state
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        row = self._state._conn.execute(
+            "SELECT source, target, type, props FROM relationships WHERE pos = ?",
+            (index,)
+        ).fetchone()
+        if row is None:
+            raise IndexError(index)
+        return _relationship(row)
+
+    def __iter__(self) -> Iterator[GraphRelationship]:
+        for row in self._state._conn.execute(
+            "SELECT source, target, type, props FROM relationships ORDER BY pos"
+        ):
+            yield _relationship(row)
+
+    def __len__(self) -> int:
+        return self._state._rel_count
+
+
+def _relationship(row) -> GraphRelationship:
+    return GraphRelationship(
+        source_id=row[0], target_id=row[1], rel_type=row[2], properties=_loads(row[3])
+    )
+
+
+class SQLiteGraphState:
+    """SQLite 기반 그래프 상태 (GraphState와 같은 API)
+
+    사용법:
+        state = SQLiteGraphState("data/output/graph.cypher.db")
+        state.add_node(node)
+        state.get_concept_id("LangGraph")
+        state.commit()
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._pending_writes = 0
+        self._sync_canonical_keys()
+
+        self._node_count = self._conn.execute(
+            "SELECT COUNT(*) FROM nodes"
+        ).fetchone()[0]
+        # 라벨별 노드 수 (추가/교체 시 증분 갱신)
+        self._label_counts: dict[str, int] = dict(
+            self._conn.execute("SELECT label, COUNT(*) FROM nodes GROUP BY label")
+        )
+        self._rel_count = self._conn.execute(
+            "SELECT COUNT(*) FROM relationships"
+        ).fetchone()[0]
+
+        self.nodes = _NodeMapping(self)
+        self.relationships = _RelationshipSequence(self)
+
+    # ------------------------------------------------------------------
+    # 저장소 관리
+    # ------------------------------------------------------------------
+
+    def commit(self):
+        """쌓인 쓰기 커밋"""
+        self._conn.commit()
+        self._pending_writes = 0
+
+    def close(self):
+        self.commit()
+        self._conn.close()
+
+    def clear(self):
+        """모든 노드/관계/메타 삭제"""
+        self._conn.execute("DELETE FROM nodes")
+        self._conn.execute("DELETE FROM relationships")
+        self._conn.execute("DELETE FROM meta")
+        self.commit()
+        self._node_count = 0
+        self._rel_count = 0
+        self._label_counts = {}
+        self._sync_canonical_keys()
+
+    def _sync_canonical_keys(self):
+        """canon_key 열 추가 (이전 스키마) 및 규칙/별칭이 바뀌었으면 다시 계산"""
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(nodes)")}
+        if "canon_key" not in columns:
+            self._conn.execute("ALTER TABLE nodes ADD COLUMN canon_key TEXT")
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS nodes_canon ON nodes (label, canon_key, seq)"
+        )
+
+        version = get_canonicalizer().version
+        if self.get_meta("canonical_version") != version:
+            updates = []
+            for node_id, raw in self._conn.execute(
+                "SELECT id, props FROM nodes WHERE label = 'Concept'"
+            ).fetchall():
+                name = _loads(raw).get("name")
+                updates.append((canonical_key(name) if name else None, node_id))
+            self._conn.executemany(
+                "UPDATE nodes SET canon_key = ? WHERE id = ?", updates
+            )
+            self.set_meta("canonical_version", version)
+        self.commit()
+
+    def get_meta(self, key: str) -> Optional[str]:
+        row = self._conn.execute(
+            "SELECT value FROM meta WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: str):
+        self._conn.execute(
+            "INSERT INTO meta (key, value) VALUES (?, ?) "
+            "ON CONFLICT (key) DO UPDATE SET value = excluded.value",
+            (key, value)
+        )
+
+    def _wrote(self):
+        self._pending_writes += 1
+        if self._pending_writes >= _COMMIT_INTERVAL:
+            self.commit()
+
+    # ------------------------------------------------------------------
+    # 노드
+    # ------------------------------------------------------------------
+
+    def has_node(self, node_id: str) -> bool:
+        """노드 존재 여부"""
+        return node_id in self.nodes
+
+    def find_node_id(self, label: str, name: str) -> Optional[str]:
+        """라벨 + 이름으로 노드 ID 찾기 (대소문자 무시, 먼저 추가된 노드 우선)"""
+        row = self._conn.execute(
+            "SELECT id FROM nodes WHERE label = ? AND name_key = ? "
+            "ORDER BY seq LIMIT 1",
+            (label, normalize_name(name)),
+        ).fetchone()
+        return row[0] if row else None
+
+    def get_labels(self) -> list[str]:
+        """노드가 있는 라벨 목록"""
+        return [
+            row[0] for row in self._conn.execute(
+                "SELECT label FROM nodes GROUP BY label ORDER BY MIN(seq)"
+            )
+        ]
+
+    def get_label(self, node_id: str) -> Optional[str]:
+        """노드 라벨 (없는 노드면 None)"""
+        row = self._conn.execute(
+            "SELECT label FROM nodes WHERE id = ?", (node_id,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def get_node_ids(self, label: str) -> list[str]:
+        """라벨별 노드 ID 목록"""
+        return [
+            row[0] for row in self._conn.execute(
+                "SELECT id FROM nodes WHERE label = ? ORDER BY seq", (label,)
+            )
+        ]
+
+    def get_names(self, label: str) -> list[str]:
+        """라벨별 노드 이름 목록"""
+        names = []
+        for (raw,) in self._conn.execute(
+            "SELECT props FROM nodes WHERE label = ? ORDER BY seq", (label,)
+        ):
+            names.append(_loads(raw).get("name", ""))
+        return names
+
+    def count(self, label: str) -> int:
+        """라벨별 노드 수"""
+        return self._label_counts.get(label, 0)
+
+    def stats(self) -> dict:
+        """노드/관계 수 (증분 유지되는 카운터 사용)"""
+        return {
+            "total_nodes": self._node_count,
+            "total_relationships": self._rel_count,
+            "concept_count": self.count("Concept"),
+            "tag_count": self.count("Tag"),
+            "thought_count": self.count("Thought"),
+            "category_count": self.count("Category"),
+        }
+
+    def has_concept(self, concept_name: str) -> bool:
+        """개념 존재 여부 (이름으로 검색)"""
+        return self.get_concept_id(concept_name) is not None
+
+    def get_concept_id(self, concept_name: str) -> Optional[str]:
+        """개념 ID 찾기 (이름이 같은 개념이 없으면 canonical key가 같은 개념)"""
+        node_id = self.find_node_id("Concept", concept_name)
+        if node_id is not None:
+            return node_id
+        row = self._conn.execute(
+            "SELECT id FROM nodes WHERE label = 'Concept' AND canon_key = ? "
+            "ORDER BY seq LIMIT 1",
+            (canonical_key(concept_name),),
+        ).fetchone()
+        return row[0] if row else None
+
+    def get_category_id(self, category_name: str) -> Optional[str]:
+        """카테고리 ID 찾기"""
+        return self.find_node_id("Category", category_name)
+
+    def get_tag_id(self, tag_name: str) -> Optional[str]:
+        """태그 ID 찾기"""
+        return self.find_node_id("Tag", tag_name)
+
+    def get_all_concepts(self) -> list[str]:
+        """모든 개념 이름 목록"""
+        return self.get_names("Concept")
+
+    def get_all_categories(self) -> list[str]:
+        """모든 카테고리 이름 목록"""
+        return self.get_names("Category")
+
+    def get_all_tags(self) -> list[str]:
+        """모든 태그 이름 목록"""
+        return self.get_names("Tag")
+
+    def add_node(self, node: GraphNode):
+        """노드 추가 (같은 ID가 있으면 교체)"""
+        name = node.properties.get("name")
+        name_key = normalize_name(name) if name else None
+        canon_key = canonical_key(name) if name and node.label == "Concept" else None
+        params = (node.label, name_key, canon_key, _dumps(node.properties), node.id)
+
+        row = self._conn.execute(
+            "SELECT label FROM nodes WHERE id = ?", (node.id,)
+        ).fetchone()
+
+        if row is not None:
+            self._conn.execute(
+                "UPDATE nodes SET label = ?, name_key = ?, canon_key = ?, props = ? "
+                "WHERE id = ?",
+                params,
+            )
+            self._label_counts[row[0]] -= 1
+        else:
+            self._conn.execute(
+                "INSERT INTO nodes (label, name_key, canon_key, props, id) "
+                "VALUES (?, ?, ?, ?, ?)",
+                params,
+            )
+            self._node_count += 1
+        self._label_counts[node.label] = self._label_counts.get(node.label, 0) + 1
+        self._wrote()
+
+    # ------------------------------------------------------------------
+    # 관계
+    # ------------------------------------------------------------------
+
+    def has_relationship(self, source_id: str, target_id: str, rel_type: str) -> bool:
+        """관계 존재 여부 (source, target, type 기준)"""
+        return self._conn.execute(
+            "SELECT 1 FROM relationships WHERE source = ? AND target = ? AND type = ?",
+            (source_id, target_id, rel_type)
+        ).fetchone() is not None
+
+    def get_relationship(
+        self,
+        source_id: str,
+        target_id: str,
+        rel_type: str
+    ) -> Optional[GraphRelationship]:
+        """관계 찾기"""
+        row = self._conn.execute(
+            "SELECT source, target, type, props FROM relationships "
+            "WHERE source = ? AND target = ? AND type = ?",
+            (source_id, target_id, rel_type)
+        ).fetchone()
+        return _relationship(row) if row else None
+
+    def get_relationships(
+        self,
+        node_id: str,
+        direction: str = "out",
+        rel_type: Optional[str] = None
+    ) -> list[GraphRelationship]:
+        """노드에 연결된 관계 목록
+
+        Args:
+            node_id: 노드 ID
+            direction: "out" | "in" | "both"
+            rel_type: 관계 타입 필터 (None이면 전체)
+        """
+        type_filter = " AND type = ?" if rel_type else ""
+        params = (node_id, rel_type) if rel_type else (node_id,)
+
+        rels = []
+        if direction in ("out", "both"):
+            rels.extend(_relationship(row) for row in self._conn.execute(
+                "SELECT source, target, type, props FROM relationships "
+                "WHERE source = ?" + type_filter + " ORDER BY pos", params
+            ))
+        if direction in ("in", "both"):
+            rels.extend(_relationship(row) for row in self._conn.execute(
+                "SELECT source, target, type, props FROM relationships "
+                "WHERE target = ?" + type_filter + " ORDER BY pos", params
+            ))
+        return rels
+
+    def get_neighbors(
+        self,
+        node_id: str,
+        direction: str = "out",
+        rel_type: Optional[str] = None
+    ) -> list[str]:
+        """인접 노드 ID 목록"""
+        neighbors = []
+        for rel in self.get_relationships(node_id, direction, rel_type):
+            neighbors.append(
+                rel.target_id if rel.source_id == node_id else rel.source_id
+            )
+        return neighbors
+
+    def add_relationship(self, rel: GraphRelationship) -> bool:
+        """관계 추가 (중복이면 프로퍼티만 갱신)
+
+        Returns:
+            새로 추가되었으면 True
+        """
+        key = (rel.source_id, rel.target_id, rel.rel_type)
+        row = self._conn.execute(
+            "SELECT pos, props FROM relationships "
+            "WHERE source = ? AND target = ? AND type = ?", key
+        ).fetchone()
+
+        if row is not None:
+            if rel.properties:
+                props = _loads(row[1])
+                props.update(rel.properties)
+                self._conn.execute(
+                    "UPDATE relationships SET props = ? WHERE pos = ?",
+                    (_dumps(props), row[0])
+                )
+                self._wrote()
+            return False
+
+        self._conn.execute(
+            "INSERT INTO relationships (pos, source, target, type, props) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (self._rel_count, *key, _dumps(rel.properties))
+        )
+        self._rel_count += 1
+        self._wrote()
+        return True
@@ -0,0 +1,150 @@
+"""기존 그래프 읽기 전용 뷰
+
+Analyst Agent가 WorkflowState의 existing_graph로 넘기는 객체.
+노드/관계를 dict로 복사하지 않고 CypherManager의 상태 인덱스를
+그대로 참조하며, 각 항목은 접근할 때만 만들어짐.
+개념/태그/카테고리 이름 목록은 라벨별 노드 수가 바뀔 때까지 한 번 만든 것을
+재사용함 (반환된 목록은 수정하지 말 것).
+
+기존 dict 형태와 같은 키를 지원:
+    view["concepts"], view.get("categories", []), view["stats"], view["cypher_manager"]
+"""
+
+from collections.abc import Mapping, Sequence
+from types import MappingProxyType
+from typing import Iterator
+
+from src.tools.cypher.manager import CypherManager
+
+
+_KEYS = (
+    "concepts",
+    "tags",
+    "categories",
+    "nodes",
+    "relationships",
+    "stats",
+    "cypher_manager",
+)
+
+
+class _NodesView(Mapping):
+    """id → {"label", "properties"} (읽기 전용)"""
+
+    def __init__(self, manager: CypherManager):
+        self._manager = manager
+
+    def __getitem__(self, node_id: str) -> dict:
+        node = self._manager.state.nodes[node_id]
+        return {"label": node.label, "properties": MappingProxyType(node.properties)}
+
+    def __contains__(self, node_id) -> bool:
+        return self._manager.state.has_node(node_id)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._manager.state.nodes)
+
+    def __len__(self) -> int:
+        return len(self._manager.state.nodes)
+
+
+class _RelationshipsView(Sequence):
+    """{"source", "target", "type", "properties"} 목록 (읽기 전용)"""
+
+    def __init__(self, manager: CypherManager):
+        self._manager = manager
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return self._as_dict(self._manager.state.relationships[index])
+
+    def __iter__(self) -> Iterator[dict]:
+        for rel in self._manager.state.relationships:
+            yield self._as_dict(rel)
+
+    def __len__(self) -> int:
+        return len(self._manager.state.relationships)
+
+    @staticmethod
+    def _as_dict(rel) -> dict:
+        return {
+            "source": rel.source_id,
+            "target": rel.target_id,
+            "type": rel.rel_type,
+            "properties": MappingProxyType(rel.properties),
+        }
+
+
+class GraphView(Mapping):
+    """기존 그래프 읽기 전용 뷰
+
+    사용법:
+        view = GraphView(manager)
+        view.state.get_concept_id("LangGraph")   # 인덱스 조회
+        view["stats"]                            # 증분 유지되는 카운터
+    """
+
+    def __init__(self, manager: CypherManager):
+        self._manager = manager
+        self._nodes = _NodesView(manager)
+        self._relationships = _RelationshipsView(manager)
+        # 라벨 → (상태 객체, 노드 수, 이름 목록)
+        self._names: dict[str, tuple] = {}
+
+    @property
+    def cypher_manager(self) -> CypherManager:
+        return self._manager
+
+    @property
+    def state(self):
+        """현재 그래프 상태 (재로드되어도 최신 상태를 가리킴)"""
+        return self._manager.state
+
+    def _cached_names(self, label: str) -> list[str]:
+        """라벨별 이름 목록 (상태가 교체되거나 노드 수가 바뀌면 다시 만듦)"""
+        state = self.state
+        count = state.count(label)
+        cached = self._names.get(label)
+        if cached is None or cached[0] is not state or cached[1] != count:
+            cached = (state, count, state.get_names(label))
+            self._names[label] = cached
+        return cached[2]
+
+    @property
+    def concepts(self) -> list[str]:
+        return self._cached_names("Concept")
+
+    @property
+    def tags(self) -> list[str]:
+        return self._cached_names("Tag")
+
+    @property
+    def categories(self) -> list[str]:
+        return self._cached_names("Category")
+
+    @property
+    def nodes(self) -> _NodesView:
+        return self._nodes
+
+    @property
+    def relationships(self) -> _RelationshipsView:
+        return self._relationships
+
+    @property
+    def stats(self) -> dict:
+        return self.state.stats()
+
+    def __getitem__(self, key: str):
+        if key not in _KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_KEYS)
+
+    def __len__(self) -> int:
+        return len(_KEYS)
+
+    def __repr__(self) -> str:
+        return f"GraphView({self._manager.output_path}, {self.stats})"
@@ -0,0 +1,195 @@
+"""Cypher 파일 append writer (crash-safe)
+
+쿼리 배치를 다음 순서로 기록:
+    1. 같은 디렉토리의 staging 파일에 배치 전체를 기록하고 fsync (write-ahead)
+    2. 파일 잠금(.lock, advisory) 획득
+    3. 큰 버퍼 한 번으로 graph.cypher에 append 후 fsync
+    4. staging 파일 삭제, 잠금 해제
+
+각 배치는 시작/끝 마커로 감싸고 끝 마커에 문장 수와 xxh64 체크섬을
+기록하므로, 로더는 체크섬이 맞지 않거나 끝 마커가 없는(중간에 끊긴)
+배치를 버릴 수 있음. 1~3 사이에 비정상 종료된 staging 파일은
+다음 기록 시 잠금 안에서 복구(append)됨.
+
+배치 형식:
+    // === Added: 2024-01-15 12:00:00 ===
+    // @batch begin id=3f2a...
+    MERGE ...
+    // @batch end id=3f2a... count=12 xxh64=9c1e...
+"""
+
+import os
+import re
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Union
+
+import xxhash
+
+try:
+    import fcntl
+except ImportError:  # Windows: 잠금 없이 동작
+    fcntl = None
+
+
+BATCH_BEGIN = "// @batch begin"
+BATCH_END = "// @batch end"
+
+_BEGIN_PATTERN = re.compile(r"^// @batch begin id=(\w+)\s*$")
+_END_PATTERN = re.compile(
+    r"^// @batch end id=(\w+) count=(\d+) xxh64=([0-9a-f]+)\s*$"
+)
+_STAGED_PATTERN = re.compile(r"^\.(?P<name>.+)\.(?P<pid>\d+)\.(?P<id>\w+)\.staged$")
+
+
+def parse_batch_marker(line: str) -> Optional[tuple]:
+    """배치 마커 파싱
+
+    Returns:
+        ("begin", id) / ("end", id, count, checksum) / None
+    """
+    match = _BEGIN_PATTERN.match(line)
+    if match:
+        return ("begin", match.group(1))
+    match = _END_PATTERN.match(line)
+    if match:
+        return ("end", match.group(1), int(match.group(2)), match.group(3))
+    return None
+
+
+def _pid_alive(pid: int) -> bool:
+    if pid == os.getpid():
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except (PermissionError, OSError):
+        return True
+    return True
+
+
+class CypherFileWriter:
+    """graph.cypher append writer
+
+    사용법:
+        writer = CypherFileWriter("data/output/graph.cypher")
+        end_offset = writer.append_batch(queries)
+
+        # 잠금 안에서 다른 작업과 함께 기록
+        staged = writer.stage(queries)
+        with writer.lock():
+            ...
+            end_offset = writer.commit(staged)
+    """
+
+    def __init__(self, path: Union[str, Path], buffer_size: int = 1 << 20):
+        self.path = Path(path)
+        self.buffer_size = buffer_size
+        self._lock_depth = 0
+        self._lock_file = None
+
+    @property
+    def lock_path(self) -> Path:
+        return self.path.with_name(self.path.name + ".lock")
+
+    @contextmanager
+    def lock(self):
+        """advisory 파일 잠금 (같은 객체 안에서 재진입 가능)"""
+        if self._lock_depth == 0:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._lock_file = open(self.lock_path, "a+")
+            if fcntl is not None:
+                fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_EX)
+        self._lock_depth += 1
+        try:
+            yield
+        finally:
+            self._lock_depth -= 1
+            if self._lock_depth == 0:
+                if fcntl is not None:
+                    fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_UN)
+                self._lock_file.close()
+                self._lock_file = None
+
+    def format_batch(self, queries: list[str], batch_id: str) -> bytes:
+        """헤더/마커/체크섬이 포함된 배치 블록"""
+        body = "".join(query + "\n" for query in queries).encode("utf-8")
+        checksum = xxhash.xxh64_hexdigest(body)
+        count = sum(1 for query in queries if query.strip())
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+        header = (
+            f"\n// === Added: {timestamp} ===\n"
+            f"{BATCH_BEGIN} id={batch_id}\n"
+        ).encode("utf-8")
+        trailer = (
+            f"{BATCH_END} id={batch_id} count={count} xxh64={checksum}\n"
+        ).encode("utf-8")
+        return header + body + trailer
+
+    def stage(self, queries: list[str]) -> Path:
+        """배치를 staging 파일에 기록하고 fsync"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        batch_id = uuid.uuid4().hex[:16]
+        staged = self.path.with_name(
+            f".{self.path.name}.{os.getpid()}.{batch_id}.staged"
+        )
+
+        with open(staged, "wb") as f:
+            f.write(self.format_batch(queries, batch_id))
+            f.flush()
+            os.fsync(f.fileno())
+
+        return staged
+
+    def commit(self, staged: Path) -> int:
+        """staging 파일을 graph.cypher에 append (잠금 안에서 호출)
+
+        Returns:
+            append 후 파일 끝 오프셋
+        """
+        with self.lock():
+            self.recover()
+            end_offset = self._append(staged.read_bytes())
+            staged.unlink()
+            return end_offset
+
+    def append_batch(self, queries: list[str]) -> int:
+        """stage + commit
+
+        Returns:
+            append 후 파일 끝 오프셋
+        """
+        return self.commit(self.stage(queries))
+
+    def recover(self) -> int:
+        """비정상 종료로 남은 staging 파일 복구 (잠금 안에서 호출)
+
+        Returns:
+            복구한 배치 수
+        """
+        recovered = 0
+        for staged in sorted(self.path.parent.glob(f".{self.path.name}.*.staged")):
+            match = _STAGED_PATTERN.match(staged.name)
+            if not match or _pid_alive(int(match.group("pid"))):
+                continue
+
+            data = staged.read_bytes()
+            lines = data.decode("utf-8", errors="replace").rstrip("\n").split("\n")
+            if lines and parse_batch_marker(lines[-1]):
+                self._append(data)
+                recovered += 1
+            staged.unlink()
+
+        return recovered
+
+    def _append(self, data: bytes) -> int:
+        """한 번의 write로 append 후 fsync"""
+        with open(self.path, "ab", buffering=self.buffer_size) as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+            return f.tell()
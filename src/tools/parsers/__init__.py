@@ -21,6 +21,11 @@ from src.tools.parsers.docx_parser import (
     DocxDocument,
     DocxParserTool,
 )
+from src.tools.parsers.chunker import (
+    Chunk,
+    ContentDefinedChunker,
+    section_offsets,
+)
 
 __all__ = [
     "ParsedDocument",
@@ -34,4 +39,7 @@ __all__ = [
     "CSVParserTool",
     "DocxDocument",
     "DocxParserTool",
+    "Chunk",
+    "ContentDefinedChunker",
+    "section_offsets",
 ]
@@ -0,0 +1,143 @@
+"""내용 기반 청킹 (content-defined chunking)
+
+고정 오프셋으로 자르면 앞쪽에 글자가 추가될 때 뒤의 모든 경계가 밀려
+청크 단위 캐시가 전부 무효가 됨. 여기서는 경계를 내용으로 정함.
+
+    - 경계 후보: 문단 끝(빈 줄)과 섹션 시작
+    - 섹션 시작: min_size 이상이면 항상 자름 (섹션 정렬)
+    - 문단 끝: 직전 64글자의 gear 롤링 해시 상위 비트가 0이면 자름 (평균 avg_size)
+    - max_size까지 후보에서 잘리지 않으면 마지막 문단 끝, 없으면 줄 끝/max_size에서 자름
+
+해시는 최근 64글자에만 의존하므로 수정 지점 이후 경계는 곧 다시 맞춰지고,
+청크 ID(내용의 xxh64)가 같은 청크는 캐시된 결과를 그대로 쓸 수 있음.
+"""
+
+import math
+import re
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+import xxhash
+
+
+_MASK64 = (1 << 64) - 1
+_GEAR = [xxhash.xxh64_intdigest(bytes([i])) for i in range(256)]
+
+# 문단 하나의 대략적인 길이 (문단 끝에서 자를 확률을 정할 때 사용, 고정값이어야 경계가 안정적)
+_PARAGRAPH_HINT = 256
+
+
+@dataclass
+class Chunk:
+    """청크"""
+    id: str        # 내용 해시 (xxh64)
+    text: str
+    start: int     # 원문 내 시작 오프셋
+    end: int
+
+
+def section_offsets(doc) -> list[int]:
+    """ParsedDocument.sections 제목이 본문(content)에서 시작하는 위치
+
+    제목(level)이 있는 섹션만 사용 (텍스트 파서의 섹션은 문단 단위라 제외)
+    """
+    offsets = []
+    position = 0
+    for section in doc.sections:
+        title = str(section.get("title", "")).strip()
+        if not title or "level" not in section:
+            continue
+        match = re.compile(rf"^{re.escape(title)}", re.MULTILINE).search(
+            doc.content, position
+        )
+        if match is None:
+            continue
+        offsets.append(match.start())
+        position = match.end()
+    return offsets
+
+
+class ContentDefinedChunker:
+    """내용 기반 청커
+
+    사용법:
+        chunker = ContentDefinedChunker(min_size=1000, avg_size=2000, max_size=3000)
+        chunks = chunker.chunk(doc.content, section_offsets(doc))
+    """
+
+    def __init__(
+        self, min_size: int = 1000, avg_size: int = 2000, max_size: int = 3000
+    ):
+        if not 0 < min_size <= avg_size <= max_size:
+            raise ValueError("min_size <= avg_size <= max_size 이어야 합니다")
+
+        self.min_size = min_size
+        self.avg_size = avg_size
+        self.max_size = max_size
+
+        # gear 해시의 하위 비트는 마지막 몇 글자(문단 끝이면 항상 "\n\n")에만
+        # 의존하므로 최근 64글자가 모두 섞인 상위 비트로 판정
+        bits = round(math.log2(max(1.0, (avg_size - min_size) / _PARAGRAPH_HINT)))
+        self._mask = ((1 << bits) - 1) << (64 - bits)
+
+    def chunk(
+        self, text: str, section_starts: Optional[Iterable[int]] = None
+    ) -> list[Chunk]:
+        """텍스트를 청크로 나눔
+
+        Args:
+            text: 본문
+            section_starts: 섹션 시작 오프셋 (경계로 우선 사용)
+
+        Returns:
+            Chunk 목록 (이어 붙이면 원문)
+        """
+        starts = set(section_starts or ())
+        chunks = []
+        start = 0
+        while start < len(text):
+            end = self._cut_point(text, start, starts)
+            body = text[start:end]
+            chunks.append(Chunk(
+                id=xxhash.xxh64_hexdigest(body.strip()),
+                text=body,
+                start=start,
+                end=end,
+            ))
+            start = end
+        return chunks
+
+    def _cut_point(self, text: str, start: int, section_starts: set[int]) -> int:
+        """start부터의 청크 끝 위치"""
+        n = len(text)
+        limit = min(n, start + self.max_size)
+        if limit == n and n - start <= self.min_size:
+            return n
+
+        h = 0
+        last_paragraph = last_line = -1
+        for i in range(start, limit):
+            c = ord(text[i])
+            h = ((h << 1) + _GEAR[(c ^ (c >> 8)) & 0xFF]) & _MASK64
+
+            end = i + 1
+            if end - start < self.min_size or end == n:
+                continue
+
+            if end in section_starts:
+                return end
+
+            if text[i] == "\n":
+                last_line = end
+                if text[i - 1] == "\n":
+                    last_paragraph = end
+                    if h & self._mask == 0:
+                        return end
+
+        if limit == n:
+            return n
+        if last_paragraph > 0:
+            return last_paragraph
+        if last_line > 0:
+            return last_line
+        return limit
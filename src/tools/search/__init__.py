@@ -0,0 +1,10 @@
+"""검색 도구"""
+
+from src.tools.search.centroids import CategoryCentroids
+from src.tools.search.vector_search import ConceptVectorIndex, normalize_rows
+
+__all__ = [
+    "CategoryCentroids",
+    "ConceptVectorIndex",
+    "normalize_rows",
+]
@@ -0,0 +1,256 @@
+"""카테고리 중심 벡터
+
+카테고리별로 소속 문서 임베딩(단위 벡터)의 합과 개수를 저장하고,
+새 문서는 정규화된 중심과의 코사인 유사도로 분류함.
+문서가 할당될 때마다 합/개수만 갱신하므로 평균이 점진적으로 유지됨.
+
+반영한 벡터는 문서 키(Thought ID)별로 함께 저장하므로, 같은 문서가
+다시 들어오면 이전 기여분을 빼고 교체함 (실행마다 중복 누적되지 않음).
+
+    <dir>/sums.npy      float64[categories, dim]
+    <dir>/members.npy   float32[documents, dim]
+    <dir>/meta.json     {version, model, dim, names, counts, hits, fallbacks,
+                         members, member_rows}
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+
+from src.tools.cypher.manager import normalize_name
+
+
+# 저장 형식 버전 (문서별 기여분이 없는 이전 형식은 초기화 후 다시 구성)
+_FORMAT_VERSION = 2
+
+
+class CategoryCentroids:
+    """카테고리 중심 벡터 분류기
+
+    사용법:
+        centroids = CategoryCentroids(
+            "data/output/graph.cypher.centroids", model="bge-m3"
+        )
+        match = centroids.classify(vector)   # (카테고리, 유사도, 2위와의 차이) 또는 None
+        centroids.update("AI", vector, key="thought_3f2a...")
+        centroids.save()
+    """
+
+    def __init__(self, directory: Union[str, Path], model: str = ""):
+        """초기화
+
+        Args:
+            directory: 저장 디렉토리
+            model: 임베딩 모델명 (저장된 것과 다르면 초기화)
+        """
+        self.directory = Path(directory)
+        self.model = model
+
+        self.names: list[str] = []
+        self.counts: list[int] = []
+        self.hits = 0
+        self.fallbacks = 0
+        self._rows: dict[str, int] = {}
+        self._sums: Optional[np.ndarray] = None
+        # 문서 키 → (카테고리 행, 반영한 단위 벡터)
+        self._members: dict[str, tuple[int, np.ndarray]] = {}
+
+        self._load()
+
+    @property
+    def sums_path(self) -> Path:
+        return self.directory / "sums.npy"
+
+    @property
+    def members_path(self) -> Path:
+        return self.directory / "members.npy"
+
+    @property
+    def meta_path(self) -> Path:
+        return self.directory / "meta.json"
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def count(self, name: str) -> int:
+        """카테고리에 반영된 문서 수"""
+        row = self._rows.get(normalize_name(name))
+        return self.counts[row] if row is not None else 0
+
+    def hit_rate(self) -> float:
+        """누적 로컬 분류 비율"""
+        total = self.hits + self.fallbacks
+        return self.hits / total if total else 0.0
+
+    # ------------------------------------------------------------------
+    # 저장/로드
+    # ------------------------------------------------------------------
+
+    def _load(self):
+        if not self.meta_path.exists() or not self.sums_path.exists():
+            return
+
+        meta = json.loads(self.meta_path.read_text(encoding="utf-8"))
+        if meta.get("version") != _FORMAT_VERSION or (
+                self.model and meta.get("model") != self.model):
+            self.reset()
+            return
+
+        sums = np.load(self.sums_path)
+        names = meta.get("names", [])
+        if sums.ndim != 2 or sums.shape[0] != len(names):
+            self.reset()
+            return
+
+        self.names = names
+        self.counts = meta.get("counts", [0] * len(names))
+        self.hits = meta.get("hits", 0)
+        self.fallbacks = meta.get("fallbacks", 0)
+        self._rows = {normalize_name(name): i for i, name in enumerate(names)}
+        self._sums = sums
+
+        member_keys = meta.get("members", [])
+        if member_keys and self.members_path.exists():
+            vectors = np.load(self.members_path)
+            if vectors.shape[0] == len(member_keys):
+                self._members = {
+                    key: (row, vector)
+                    for key, row, vector in zip(
+                        member_keys, meta.get("member_rows", []), vectors
+                    )
+                }
+
+    def save(self):
+        """중심/메타 저장"""
+        if self._sums is None:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        tmp_path = self.sums_path.with_name(f"sums.{os.getpid()}.tmp.npy")
+        np.save(tmp_path, self._sums)
+        os.replace(tmp_path, self.sums_path)
+
+        member_keys = list(self._members)
+        vectors = (
+            np.stack([self._members[key][1] for key in member_keys])
+            if member_keys else np.zeros((0, self._sums.shape[1]), dtype=np.float32)
+        )
+        tmp_path = self.members_path.with_name(f"members.{os.getpid()}.tmp.npy")
+        np.save(tmp_path, vectors)
+        os.replace(tmp_path, self.members_path)
+
+        tmp_path = self.meta_path.with_name(self.meta_path.name + ".tmp")
+        tmp_path.write_text(
+            json.dumps({
+                "version": _FORMAT_VERSION,
+                "model": self.model,
+                "dim": int(self._sums.shape[1]),
+                "names": self.names,
+                "counts": self.counts,
+                "hits": self.hits,
+                "fallbacks": self.fallbacks,
+                "members": member_keys,
+                "member_rows": [self._members[key][0] for key in member_keys],
+            }, ensure_ascii=False),
+            encoding="utf-8"
+        )
+        os.replace(tmp_path, self.meta_path)
+
+    def reset(self):
+        """중심 비우기"""
+        for path in (self.sums_path, self.members_path, self.meta_path):
+            if path.exists():
+                path.unlink()
+        self.names = []
+        self.counts = []
+        self.hits = 0
+        self.fallbacks = 0
+        self._rows = {}
+        self._sums = None
+        self._members = {}
+
+    # ------------------------------------------------------------------
+    # 분류/갱신
+    # ------------------------------------------------------------------
+
+    def classify(
+        self,
+        vector: np.ndarray,
+        allowed: Optional[set[str]] = None
+    ) -> Optional[tuple[str, float, float]]:
+        """가장 가까운 카테고리
+
+        Args:
+            vector: 문서 임베딩
+            allowed: 후보 카테고리 (정규화 이름, None이면 전체)
+
+        Returns:
+            (카테고리, 코사인 유사도, 2위와의 차이) 또는 None
+        """
+        if self._sums is None:
+            return None
+
+        rows = np.arange(len(self.names))
+        if allowed is not None:
+            rows = np.array(
+                [
+                    i
+                    for i, name in enumerate(self.names)
+                    if normalize_name(name) in allowed
+                ],
+                dtype=np.int64,
+            )
+        if rows.size == 0:
+            return None
+
+        centroids = self._sums[rows]
+        norms = np.linalg.norm(centroids, axis=1)
+        norms[norms == 0] = 1.0
+        query = np.asarray(vector, dtype=np.float64)
+        query = query / (np.linalg.norm(query) or 1.0)
+
+        scores = centroids @ query / norms
+        order = np.argsort(-scores)
+        best = float(scores[order[0]])
+        second = float(scores[order[1]]) if order.size > 1 else 0.0
+        return self.names[rows[order[0]]], best, best - second
+
+    def update(self, name: str, vector: np.ndarray, key: Optional[str] = None):
+        """카테고리에 문서 임베딩 반영
+
+        Args:
+            name: 카테고리
+            vector: 문서 임베딩
+            key: 문서 키 (Thought ID). 이미 반영된 키면 이전 기여분을 빼고 교체
+        """
+        vector = np.asarray(vector, dtype=np.float64)
+        # 문서별 기여분이 float32로 저장되므로 더할 때도 같은 값 사용 (교체 시 정확히 상쇄)
+        vector = (
+            (vector / (np.linalg.norm(vector) or 1.0))
+            .astype(np.float32)
+            .astype(np.float64)
+        )
+
+        if key is not None and key in self._members:
+            old_row, old_vector = self._members.pop(key)
+            self._sums[old_row] -= old_vector
+            self.counts[old_row] -= 1
+
+        name_key = normalize_name(name)
+        row = self._rows.get(name_key)
+        if row is None:
+            if self._sums is None:
+                self._sums = np.zeros((0, vector.shape[0]))
+            row = len(self.names)
+            self._rows[name_key] = row
+            self.names.append(name)
+            self.counts.append(0)
+            self._sums = np.vstack([self._sums, np.zeros(vector.shape[0])])
+
+        self._sums[row] += vector
+        self.counts[row] += 1
+        if key is not None:
+            self._members[key] = (row, vector.astype(np.float32))
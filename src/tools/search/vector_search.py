@@ -0,0 +1,421 @@
+"""개념 임베딩 벡터 인덱스
+
+개념 이름의 임베딩을 메모리 맵 float32 행렬에 저장하고
+정규화된 행끼리의 내적(코사인 유사도)으로 top-k를 찾음.
+
+    <dir>/vectors.f32   float32[capacity, dim]  (단위 벡터, 추가 순서)
+    <dir>/keys.txt      행별 개념 이름 (공백 정리된 원본)
+    <dir>/meta.json     {model, dim, count}
+
+같은 정규화 이름은 한 번만 임베딩되므로 인덱스 자체가 임베딩 캐시 역할을 함.
+검색 질의로만 쓰인 이름은 메모리에만 두고 저장하지 않음 (add한 이름만 행이 됨).
+검색은 행렬을 block_rows 단위로 나눠 곱하고 argpartition으로 후보를 병합하므로
+개념 수가 수십만이어도 메모리 사용량이 일정함.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Callable, Iterable, Optional, Union
+
+import numpy as np
+
+from src.tools.cypher.manager import normalize_name
+
+
+EmbedFn = Callable[[list[str]], list[list[float]]]
+
+_INITIAL_CAPACITY = 1024
+
+
+def _display(name: str) -> str:
+    return " ".join(str(name).split())
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """행 단위 L2 정규화 (영벡터는 그대로)"""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+class ConceptVectorIndex:
+    """개념 임베딩 인덱스
+
+    사용법:
+        index = ConceptVectorIndex("data/output/graph.cypher.vectors",
+                                   embed_fn=llm.embed, model="bge-m3")
+        index.add(["LangGraph", "머신러닝"])
+        index.search(["ML"], k=5, min_score=0.7)
+        index.flush()
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        embed_fn: Optional[EmbedFn] = None,
+        model: str = "",
+        batch_size: int = 64,
+        block_rows: int = 65536
+    ):
+        """초기화
+
+        Args:
+            directory: 인덱스 디렉토리
+            embed_fn: 텍스트 목록 → 벡터 목록
+            model: 임베딩 모델명 (저장된 인덱스와 다르면 초기화)
+            batch_size: 임베딩 요청당 텍스트 수
+            block_rows: 검색 시 한 번에 곱하는 행 수
+        """
+        self.directory = Path(directory)
+        self.embed_fn = embed_fn
+        self.model = model
+        self.batch_size = max(1, batch_size)
+        self.block_rows = max(1, block_rows)
+
+        self.dim: Optional[int] = None
+        self.count = 0
+        self._names: list[str] = []
+        self._rows: dict[str, int] = {}
+        self._matrix: Optional[np.memmap] = None
+        # 인덱스에 없는 질의 이름의 단위 벡터 (정규화 이름 → 벡터, 저장하지 않음)
+        self._query_vectors: dict[str, np.ndarray] = {}
+
+        self._load()
+
+    @property
+    def vectors_path(self) -> Path:
+        return self.directory / "vectors.f32"
+
+    @property
+    def keys_path(self) -> Path:
+        return self.directory / "keys.txt"
+
+    @property
+    def meta_path(self) -> Path:
+        return self.directory / "meta.json"
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __contains__(self, name: str) -> bool:
+        return normalize_name(name) in self._rows
+
+    def names(self) -> list[str]:
+        return list(self._names)
+
+    def vector(self, name: str) -> Optional[np.ndarray]:
+        """저장된 단위 벡터 (없으면 None)"""
+        row = self._rows.get(normalize_name(name))
+        if row is None:
+            return None
+        return np.asarray(self._matrix[row])
+
+    # ------------------------------------------------------------------
+    # 저장/로드
+    # ------------------------------------------------------------------
+
+    def _load(self):
+        if not self.meta_path.exists():
+            return
+
+        meta = json.loads(self.meta_path.read_text(encoding="utf-8"))
+        if self.model and meta.get("model") != self.model:
+            # 모델이 바뀌면 벡터 공간이 달라지므로 새로 구성
+            self.reset()
+            return
+
+        self.dim = meta.get("dim")
+        if not self.dim or not self.vectors_path.exists():
+            return
+
+        names = []
+        if self.keys_path.exists():
+            names = self.keys_path.read_text(encoding="utf-8").splitlines()
+
+        capacity = self.vectors_path.stat().st_size // (4 * self.dim)
+        self.count = min(meta.get("count", 0), len(names), capacity)
+        self._names = names[:self.count]
+        self._rows = {normalize_name(name): i for i, name in enumerate(self._names)}
+        if capacity:
+            self._matrix = np.memmap(
+                self.vectors_path,
+                dtype=np.float32,
+                mode="r+",
+                shape=(capacity, self.dim),
+            )
+
+    def flush(self):
+        """벡터/키/메타 저장"""
+        if self.dim is None:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        if self._matrix is not None:
+            self._matrix.flush()
+
+        with open(self.keys_path, "w", encoding="utf-8") as f:
+            for name in self._names:
+                f.write(name + "\n")
+
+        tmp_path = self.meta_path.with_name(self.meta_path.name + ".tmp")
+        tmp_path.write_text(
+            json.dumps({"model": self.model, "dim": self.dim, "count": self.count}),
+            encoding="utf-8"
+        )
+        os.replace(tmp_path, self.meta_path)
+
+    def reset(self):
+        """인덱스 비우기"""
+        self._matrix = None
+        for path in (self.vectors_path, self.keys_path, self.meta_path):
+            if path.exists():
+                path.unlink()
+        self.dim = None
+        self.count = 0
+        self._names = []
+        self._rows = {}
+        self._query_vectors = {}
+
+    def _ensure_capacity(self, needed: int):
+        capacity = self._matrix.shape[0] if self._matrix is not None else 0
+        if needed <= capacity:
+            return
+
+        new_capacity = max(_INITIAL_CAPACITY, capacity)
+        while new_capacity < needed:
+            new_capacity *= 2
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        if self._matrix is not None:
+            self._matrix.flush()
+            self._matrix = None
+        with open(self.vectors_path, "ab") as f:
+            f.truncate(new_capacity * self.dim * 4)
+        self._matrix = np.memmap(
+            self.vectors_path,
+            dtype=np.float32,
+            mode="r+",
+            shape=(new_capacity, self.dim),
+        )
+
+    # ------------------------------------------------------------------
+    # 추가/임베딩
+    # ------------------------------------------------------------------
+
+    def add(self, names: Iterable[str]) -> int:
+        """아직 없는 이름만 임베딩해서 추가
+
+        Returns:
+            새로 추가한 수
+
+        Raises:
+            embed_fn이 던지는 예외 (예: LLMConnectionError)
+        """
+        pending: dict[str, str] = {}
+        for name in names:
+            display = _display(name)
+            key = normalize_name(display)
+            if key and key not in self._rows and key not in pending:
+                pending[key] = display
+
+        if not pending:
+            return 0
+
+        # 질의로 이미 임베딩한 이름은 그 벡터를 그대로 사용
+        cached = [
+            (key, display)
+            for key, display in pending.items()
+            if key in self._query_vectors
+        ]
+        if cached:
+            vectors = np.stack([self._query_vectors.pop(key) for key, _ in cached])
+            self._append(cached, vectors)
+
+        items = [
+            (key, display) for key, display in pending.items() if key not in self._rows
+        ]
+        for start in range(0, len(items), self.batch_size):
+            batch = items[start:start + self.batch_size]
+            self._append(batch, self._embed_batch([display for _, display in batch]))
+
+        return len(pending)
+
+    def add_vectors(self, names: list[str], vectors: np.ndarray) -> int:
+        """이미 계산된 벡터 추가 (같은 이름이 있으면 건너뜀)"""
+        batch, rows = [], []
+        for name, vector in zip(names, vectors):
+            display = _display(name)
+            key = normalize_name(display)
+            if key and key not in self._rows:
+                batch.append((key, display))
+                rows.append(vector)
+        if batch:
+            self._append(batch, np.asarray(rows, dtype=np.float32))
+        return len(batch)
+
+    def _embed_batch(self, texts: list[str]) -> np.ndarray:
+        if self.embed_fn is None:
+            raise ValueError("embed_fn이 설정되지 않았습니다")
+        return np.asarray(self.embed_fn(texts), dtype=np.float32)
+
+    def _append(self, batch: list[tuple[str, str]], vectors: np.ndarray):
+        if vectors.ndim != 2 or len(vectors) != len(batch):
+            raise ValueError("임베딩 결과의 형태가 올바르지 않습니다")
+        if self.dim is None:
+            self.dim = int(vectors.shape[1])
+        elif vectors.shape[1] != self.dim:
+            raise ValueError(f"임베딩 차원 불일치: {vectors.shape[1]} != {self.dim}")
+
+        start = self.count
+        self._ensure_capacity(start + len(batch))
+        self._matrix[start:start + len(batch)] = normalize_rows(vectors)
+
+        for offset, (key, display) in enumerate(batch):
+            self._rows[key] = start + offset
+            self._names.append(display)
+        self.count += len(batch)
+
+    def embed(self, names: list[str]) -> np.ndarray:
+        """이름 목록의 단위 벡터
+
+        인덱스에 없는 이름은 임베딩만 하고 행으로 추가하지 않음
+        (질의 벡터는 메모리에 두었다가 같은 이름을 add하면 재사용).
+        """
+        keys = [normalize_name(_display(name)) for name in names]
+        pending: dict[str, str] = {}
+        for key, name in zip(keys, names):
+            if key not in self._rows and key not in self._query_vectors:
+                pending.setdefault(key, _display(name))
+
+        items = list(pending.items())
+        for start in range(0, len(items), self.batch_size):
+            batch = items[start:start + self.batch_size]
+            vectors = self._embed_batch([display for _, display in batch])
+            if vectors.ndim != 2 or len(vectors) != len(batch):
+                raise ValueError("임베딩 결과의 형태가 올바르지 않습니다")
+            if self.dim is not None and vectors.shape[1] != self.dim:
+                raise ValueError(f"임베딩 차원 불일치: {vectors.shape[1]} != {self.dim}")
+            self.dim = self.dim or int(vectors.shape[1])
+            for (key, _), vector in zip(batch, normalize_rows(vectors)):
+                self._query_vectors[key] = vector
+
+        if not keys:
+            return np.zeros((0, self.dim or 0), np.float32)
+        return np.stack([
+            np.asarray(self._matrix[self._rows[key]]) if key in self._rows
+            else self._query_vectors[key]
+            for key in keys
+        ])
+
+    # ------------------------------------------------------------------
+    # 검색
+    # ------------------------------------------------------------------
+
+    def row_mask(self, names: Iterable[str]) -> np.ndarray:
+        """허용할 이름의 행 마스크 (search의 allowed로 재사용)
+
+        이후 추가된 행은 허용되지 않음.
+        """
+        mask = np.zeros(self.count, dtype=bool)
+        for name in names:
+            row = self._rows.get(normalize_name(_display(name)))
+            if row is not None:
+                mask[row] = True
+        return mask
+
+    def search(
+        self,
+        names: list[str],
+        k: int = 10,
+        min_score: float = 0.0,
+        allowed: Optional[Union[Iterable[str], np.ndarray]] = None,
+        exclude_self: bool = True
+    ) -> list[list[tuple[str, float]]]:
+        """이름별 코사인 유사도 top-k
+
+        Args:
+            names: 질의 이름 목록 (인덱스에 없는 이름은 임베딩만 하고 추가하지 않음)
+            k: 질의당 결과 수
+            min_score: 최소 유사도
+            allowed: 결과로 허용할 이름 또는 row_mask 결과 (None이면 전체)
+            exclude_self: 질의와 같은 이름 제외
+
+        Returns:
+            질의별 [(이름, 유사도)] (유사도 내림차순)
+        """
+        if not names:
+            return []
+        queries = self.embed(names)
+        return self.search_vectors(
+            queries, k, min_score, allowed,
+            exclude=(
+                [self._rows.get(normalize_name(_display(n)), -1) for n in names]
+                if exclude_self else None
+            )
+        )
+
+    def search_vectors(
+        self,
+        queries: np.ndarray,
+        k: int = 10,
+        min_score: float = 0.0,
+        allowed: Optional[Union[Iterable[str], np.ndarray]] = None,
+        exclude: Optional[list[int]] = None
+    ) -> list[list[tuple[str, float]]]:
+        """질의 벡터별 top-k (queries는 단위 벡터)"""
+        m = len(queries)
+        if m == 0 or self.count == 0:
+            return [[] for _ in range(m)]
+
+        mask = None
+        if isinstance(allowed, np.ndarray):
+            # 미리 만든 마스크: 그 뒤에 추가된 행은 허용하지 않음
+            mask = allowed[:self.count]
+            if mask.size < self.count:
+                mask = np.concatenate(
+                    [mask, np.zeros(self.count - mask.size, dtype=bool)]
+                )
+        elif allowed is not None:
+            mask = self.row_mask(allowed)
+
+        k = min(k, self.count)
+        best_scores = np.full((m, 0), -np.inf, dtype=np.float32)
+        best_rows = np.zeros((m, 0), dtype=np.int64)
+        exclude_rows = (
+            np.asarray(exclude, dtype=np.int64) if exclude is not None else None
+        )
+        queries = np.asarray(queries, dtype=np.float32)
+
+        for start in range(0, self.count, self.block_rows):
+            end = min(start + self.block_rows, self.count)
+            scores = queries @ np.asarray(self._matrix[start:end]).T
+
+            if mask is not None:
+                scores[:, ~mask[start:end]] = -np.inf
+            if exclude_rows is not None:
+                hit = (exclude_rows >= start) & (exclude_rows < end)
+                scores[np.nonzero(hit)[0], exclude_rows[hit] - start] = -np.inf
+
+            block_k = min(k, end - start)
+            top = np.argpartition(-scores, block_k - 1, axis=1)[:, :block_k]
+            top_scores = np.take_along_axis(scores, top, axis=1)
+
+            best_scores = np.concatenate([best_scores, top_scores], axis=1)
+            best_rows = np.concatenate([best_rows, top + start], axis=1)
+            if best_scores.shape[1] > k:
+                keep = np.argpartition(-best_scores, k - 1, axis=1)[:, :k]
+                best_scores = np.take_along_axis(best_scores, keep, axis=1)
+                best_rows = np.take_along_axis(best_rows, keep, axis=1)
+
+        order = np.argsort(-best_scores, axis=1)
+        best_scores = np.take_along_axis(best_scores, order, axis=1)
+        best_rows = np.take_along_axis(best_rows, order, axis=1)
+
+        results = []
+        for i in range(m):
+            results.append([
+                (self._names[row], float(score))
+                for row, score in zip(best_rows[i], best_scores[i])
+                if np.isfinite(score) and score >= min_score
+            ])
+        return results
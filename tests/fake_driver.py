@@ -0,0 +1,145 @@
+"""인메모리 Neo4j 드라이버 (테스트용)
+
+Neo4jBoltSink / ParameterizedLoader를 Neo4j 없이 실행해 보기 위한 대체 드라이버.
+batch_export의 UNWIND 템플릿과 스키마 문장만 해석하며,
+트랜잭션은 함수가 끝난 뒤에 한 번에 반영됨.
+
+사용법:
+    driver = FakeNeo4jDriver(transient_failures=2)
+    sink = Neo4jBoltSink(driver, batch_size=100)
+    sink.write(nodes, relationships)
+    driver.nodes["concept_..."]  # {"labels": {"Concept"}, "props": {...}}
+"""
+
+import re
+import threading
+from typing import Optional
+
+
+_NODE_TEMPLATE = re.compile(r"UNWIND \$rows AS row MERGE \(n:(\w+) \{id: row\.id\}\)")
+_REL_TEMPLATE = re.compile(
+    r"UNWIND \$rows AS row "
+    r"MATCH \(a(?::(\w+))? \{id: row\.source\}\) "
+    r"MATCH \(b(?::(\w+))? \{id: row\.target\}\) "
+    r"MERGE \(a\)-\[r:(\w+)\]->\(b\)"
+)
+
+
+class FakeTransientError(Exception):
+    """재시도 가능한 일시적 오류 (neo4j TransientError 대용)"""
+
+    def is_retryable(self) -> bool:
+        return True
+
+
+class _FakeResult:
+    def consume(self):
+        return None
+
+
+class _FakeTransaction:
+    """쓰기 내용을 모았다가 커밋 시 드라이버에 반영"""
+
+    def __init__(self, driver: "FakeNeo4jDriver"):
+        self.driver = driver
+        self.node_writes: list[tuple[str, dict]] = []
+        self.rel_writes: list[tuple[Optional[str], Optional[str], str, dict]] = []
+
+    def run(self, query: str, rows: Optional[list[dict]] = None, **_):
+        rows = rows or []
+        match = _NODE_TEMPLATE.match(query)
+        if match:
+            self.node_writes.extend((match.group(1), row) for row in rows)
+            return _FakeResult()
+
+        match = _REL_TEMPLATE.match(query)
+        if match:
+            source_label, target_label, rel_type = match.groups()
+            for row in rows:
+                self.rel_writes.append((source_label, target_label, rel_type, row))
+            return _FakeResult()
+
+        if query.startswith("CREATE "):
+            self.driver.schema.add(query)
+            return _FakeResult()
+
+        raise ValueError(f"FakeNeo4jDriver가 해석할 수 없는 쿼리: {query[:80]}")
+
+    def commit(self):
+        driver = self.driver
+        for label, row in self.node_writes:
+            node = driver.nodes.setdefault(row["id"], {"labels": set(), "props": {}})
+            node["labels"].add(label)
+            node["props"].update(row.get("props") or {})
+
+        for source_label, target_label, rel_type, row in self.rel_writes:
+            source = driver.nodes.get(row["source"])
+            target = driver.nodes.get(row["target"])
+            # MATCH 실패 시 해당 행은 아무것도 만들지 않음
+            if source is None or target is None:
+                continue
+            if source_label and source_label not in source["labels"]:
+                continue
+            if target_label and target_label not in target["labels"]:
+                continue
+            key = (row["source"], row["target"], rel_type)
+            driver.relationships.setdefault(key, {}).update(row.get("props") or {})
+
+
+class _FakeSession:
+    def __init__(self, driver: "FakeNeo4jDriver"):
+        self.driver = driver
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        pass
+
+    def run(self, query: str, **params):
+        tx = _FakeTransaction(self.driver)
+        result = tx.run(query, **params)
+        with self.driver.lock:
+            tx.commit()
+        return result
+
+    def execute_write(self, work, *args, **kwargs):
+        with self.driver.lock:
+            self.driver.transactions += 1
+            if self.driver.transient_failures > 0:
+                self.driver.transient_failures -= 1
+                raise FakeTransientError("injected transient failure")
+
+        tx = _FakeTransaction(self.driver)
+        result = work(tx, *args, **kwargs)
+        with self.driver.lock:
+            tx.commit()
+        return result
+
+
+class FakeNeo4jDriver:
+    """인메모리 Neo4j 드라이버
+
+    Args:
+        transient_failures: 처음 N번의 execute_write에서 FakeTransientError 발생
+    """
+
+    def __init__(self, transient_failures: int = 0):
+        self.nodes: dict[str, dict] = {}
+        self.relationships: dict[tuple[str, str, str], dict] = {}
+        self.schema: set[str] = set()
+        self.transactions = 0
+        self.transient_failures = transient_failures
+        self.lock = threading.Lock()
+
+    def session(self, database: Optional[str] = None, **_) -> _FakeSession:
+        return _FakeSession(self)
+
+    def verify_connectivity(self):
+        return None
+
+    def close(self):
+        pass
@@ -0,0 +1,77 @@
+"""AnalystAgent: 여러 문서를 한 프롬프트로 카테고리 분류"""
+
+import pytest
+
+from src.agents.analyst_agent.agent import AnalystAgent
+from src.core.exceptions import LLMError
+
+
+class _FakeLLM:
+    """배치 요청에는 id별 카테고리를, 문서별 요청에는 "개별"을 돌려주는 LLM"""
+
+    def __init__(self, drop: tuple[int, ...] = (), fail_batches: bool = False):
+        self.prompts: list[str] = []
+        self.drop = drop
+        self.fail_batches = fail_batches
+
+    def __call__(self, prompt, system_prompt=None):
+        self.prompts.append(prompt)
+        ids = [
+            int(line.split(":")[1])
+            for line in prompt.splitlines()
+            if line.startswith("### id:")
+        ]
+        if not ids:
+            return {"category": "개별"}
+        if self.fail_batches:
+            raise LLMError("응답 파싱 실패")
+        return {"results": [
+            {"id": i, "category": f"카테고리{i}"} for i in ids if i not in self.drop
+        ]}
+
+
+def _docs(count: int) -> list[dict]:
+    return [
+        {
+            "title": f"문서 {i}",
+            "analysis": {"summary": "요약", "concepts": [{"name": "개념"}]},
+        }
+        for i in range(count)
+    ]
+
+
+def _agent(monkeypatch, llm) -> AnalystAgent:
+    agent = AnalystAgent()
+    monkeypatch.setattr(agent, "invoke_llm_json", llm)
+    return agent
+
+
+def test_documents_share_one_prompt(monkeypatch):
+    llm = _FakeLLM()
+    agent = _agent(monkeypatch, llm)
+
+    categories = agent._categorize_with_llm(_docs(3), ["AI"])
+
+    assert categories == ["카테고리1", "카테고리2", "카테고리3"]
+    assert len(llm.prompts) == 1
+    assert agent._llm_prompts == 1
+
+
+def test_missing_documents_fall_back_to_single_prompts(monkeypatch):
+    llm = _FakeLLM(drop=(2,))
+    agent = _agent(monkeypatch, llm)
+
+    categories = agent._categorize_with_llm(_docs(3), [])
+
+    assert categories == ["카테고리1", "개별", "카테고리3"]
+    assert agent._llm_prompts == 2
+
+
+@pytest.mark.parametrize("count, prompts", [(1, 1), (3, 4)])
+def test_failed_or_single_batches_use_single_prompts(monkeypatch, count, prompts):
+    llm = _FakeLLM(fail_batches=True)
+    agent = _agent(monkeypatch, llm)
+
+    assert agent._categorize_with_llm(_docs(count), []) == ["개별"] * count
+    assert len(llm.prompts) == prompts
+    assert agent._llm_prompts == prompts
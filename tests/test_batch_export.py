@@ -0,0 +1,148 @@
+"""BatchCypherExporter: UNWIND 배치 스크립트 왕복"""
+
+import re
+
+from src.tools.cypher.batch_export import BatchCypherExporter, format_literal
+from src.tools.cypher.loader import parse_statement
+from src.tools.cypher.manager import GraphNode, GraphRelationship, GraphState
+
+_NODE_TEMPLATE = re.compile(r"UNWIND \$rows AS row MERGE \(n:(\w+) \{id: row\.id\}\)")
+_REL_TEMPLATE = re.compile(
+    r"UNWIND \$rows AS row MATCH \(a(?::(\w+))? \{id: row\.source\}\) "
+    r"MATCH \(b(?::(\w+))? \{id: row\.target\}\) MERGE \(a\)-\[r:(\w+)\]->\(b\)"
+)
+_TOKEN = re.compile(
+    r'\s*(?:(?P<string>"(?:[^"\\]|\\.)*")|(?P<key>`(?:[^`]|``)*`|[A-Za-z_]\w*)'
+    r'|(?P<number>-?\d+(?:\.\d*)?(?:[eE][-+]?\d+)?)|(?P<punct>[\[\]{},:]))'
+)
+_ESCAPES = {"n": "\n", "r": "\r", "t": "\t"}
+
+
+def _parse_literal(text: str):
+    """format_literal 결과를 파이썬 값으로 (테스트용 최소 파서)"""
+    tokens = [
+        (match.lastgroup, match.group(match.lastgroup))
+        for match in _TOKEN.finditer(text)
+    ]
+    position = 0
+
+    def value():
+        nonlocal position
+        kind, token = tokens[position]
+        position += 1
+        if kind == "string":
+            return re.sub(
+                r"\\(.)", lambda m: _ESCAPES.get(m.group(1), m.group(1)), token[1:-1]
+            )
+        if kind == "number":
+            return float(token) if any(c in token for c in ".eE") else int(token)
+        if kind == "key":
+            return {"true": True, "false": False, "null": None}[token]
+        if token == "[":
+            items = []
+            while tokens[position][1] != "]":
+                items.append(value())
+                if tokens[position][1] == ",":
+                    position += 1
+            position += 1
+            return items
+        result = {}
+        while tokens[position][1] != "}":
+            key = tokens[position][1]
+            key = key[1:-1].replace("``", "`") if key.startswith("`") else key
+            position += 2
+            result[key] = value()
+            if tokens[position][1] == ",":
+                position += 1
+        position += 1
+        return result
+
+    return value()
+
+
+def _replay(path) -> tuple[dict, dict, list[str]]:
+    """스크립트를 읽어 노드/관계/스키마 재구성"""
+    nodes, relationships, schema = {}, {}, []
+    rows = None
+    for line in path.read_text(encoding="utf-8").splitlines():
+        if line.startswith(":param rows => "):
+            rows = _parse_literal(line[len(":param rows => "):])
+        elif line.startswith("CREATE "):
+            schema.append(line)
+        elif match := _NODE_TEMPLATE.match(line):
+            for row in rows:
+                nodes[row["id"]] = (match.group(1), row["props"])
+        elif match := _REL_TEMPLATE.match(line):
+            source_label, target_label, rel_type = match.groups()
+            for row in rows:
+                assert nodes[row["source"]][0] == source_label
+                assert nodes[row["target"]][0] == target_label
+                relationships[(row["source"], row["target"], rel_type)] = row["props"]
+    return nodes, relationships, schema
+
+
+def _state(count: int) -> GraphState:
+    state = GraphState()
+    for i in range(count):
+        state.add_node(GraphNode(id=f"c{i}", label="Concept", properties={
+            "name": f"개념 {i}", "note": 'quote " and \\ slash\nline', "weight": i * 0.5,
+        }))
+    state.add_node(
+        GraphNode(
+            id="t0", label="Thought", properties={"title": "노트", "draft": False}
+        )
+    )
+    for i in range(count):
+        state.add_relationship(
+            GraphRelationship(
+                source_id="t0",
+                target_id=f"c{i}",
+                rel_type="MENTIONS",
+                properties={"rank": i},
+            )
+        )
+    return state
+
+
+def test_batched_script_round_trip(tmp_path):
+    state = _state(7)
+    path = tmp_path / "graph_batched.cypher"
+
+    stats = BatchCypherExporter(batch_size=3).export(state, path)
+    nodes, relationships, schema = _replay(path)
+
+    assert stats["nodes"] == 8
+    assert stats["relationships"] == 7
+    assert stats["batches"] == 3 + 1 + 3
+    assert nodes == {
+        node.id: (node.label, node.properties) for node in state.nodes.values()
+    }
+    assert relationships == {
+        (rel.source_id, rel.target_id, rel.rel_type): rel.properties
+        for rel in state.relationships
+    }
+    assert any(
+        "concept_id" in statement and "UNIQUE" in statement for statement in schema
+    )
+    assert any("thought_id" in statement for statement in schema)
+
+
+def test_format_literal_quotes_non_identifier_keys():
+    value = {"plain": [1, 2.5, True, None], "with space": "a\"b", "back`tick": {}}
+    assert _parse_literal(format_literal(value)) == value
+
+
+def test_single_relationship_statement_uses_labels():
+    state = _state(1)
+    rel = state.relationships[0]
+    statement = rel.to_cypher(
+        state.get_label(rel.source_id), state.get_label(rel.target_id)
+    )
+
+    assert statement.startswith('MATCH (a:Thought {id: "t0"}), (b:Concept {id: "c0"})')
+    parsed = parse_statement(statement)
+    assert (parsed.source_id, parsed.target_id, parsed.properties) == (
+        "t0",
+        "c0",
+        {"rank": 0},
+    )
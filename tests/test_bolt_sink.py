@@ -0,0 +1,113 @@
+"""Neo4jBoltSink: FakeNeo4jDriver로 재시도와 동시 배치 수 확인"""
+
+import time
+
+import pytest
+
+from fake_driver import FakeNeo4jDriver, _FakeSession
+from src.core.exceptions import ExportError
+from src.tools.cypher import Neo4jBoltSink
+from src.tools.cypher.manager import GraphNode, GraphRelationship
+
+
+def _graph(count: int) -> tuple[list[GraphNode], list[GraphRelationship]]:
+    nodes = [
+        GraphNode(id=f"c{i}", label="Concept", properties={"name": f"C{i}"})
+        for i in range(count)
+    ]
+    relationships = [
+        GraphRelationship(
+            source_id=f"c{i}", target_id=f"c{i + 1}", rel_type="RELATED_TO"
+        )
+        for i in range(count - 1)
+    ]
+    return nodes, relationships
+
+
+class _TrackingSession(_FakeSession):
+    def execute_write(self, work, *args, **kwargs):
+        driver = self.driver
+        with driver.lock:
+            driver.active += 1
+            driver.max_active = max(driver.max_active, driver.active)
+        try:
+            time.sleep(0.01)
+            return super().execute_write(work, *args, **kwargs)
+        finally:
+            with driver.lock:
+                driver.active -= 1
+
+
+class _TrackingDriver(FakeNeo4jDriver):
+    """동시에 진행 중인 execute_write 수를 기록"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.active = 0
+        self.max_active = 0
+
+    def session(self, database=None, **_):
+        return _TrackingSession(self)
+
+
+def test_write_creates_nodes_and_relationships():
+    nodes, relationships = _graph(25)
+    driver = FakeNeo4jDriver()
+    sink = Neo4jBoltSink(driver, batch_size=10, retry_backoff=0)
+
+    stats = sink.write(nodes, relationships)
+
+    assert stats["nodes"] == 25
+    assert stats["relationships"] == 24
+    assert stats["batches"] == 3 + 3
+    assert driver.nodes["c0"]["props"] == {"name": "C0"}
+    assert ("c0", "c1", "RELATED_TO") in driver.relationships
+    assert len(driver.relationships) == 24
+
+
+def test_transient_failures_are_retried():
+    nodes, relationships = _graph(5)
+    driver = FakeNeo4jDriver(transient_failures=2)
+    sink = Neo4jBoltSink(driver, batch_size=100, max_retries=3, retry_backoff=0)
+
+    stats = sink.write(nodes, relationships)
+
+    assert stats["retries"] == 2
+    assert len(driver.nodes) == 5
+    assert len(driver.relationships) == 4
+
+
+def test_exhausted_retries_raise_export_error():
+    nodes, _ = _graph(3)
+    driver = FakeNeo4jDriver(transient_failures=10)
+    sink = Neo4jBoltSink(driver, batch_size=100, max_retries=2, retry_backoff=0)
+
+    with pytest.raises(ExportError):
+        sink.write(nodes, [])
+
+    assert driver.transactions == 3
+    assert driver.nodes == {}
+
+
+def test_in_flight_batches_are_bounded():
+    nodes, relationships = _graph(60)
+    driver = _TrackingDriver()
+    sink = Neo4jBoltSink(driver, batch_size=2, max_in_flight=3, retry_backoff=0)
+
+    stats = sink.write(nodes, relationships)
+
+    assert 1 < driver.max_active <= 3
+    assert stats["nodes"] == 60
+    assert len(driver.relationships) == 59
+
+
+def test_relationships_run_after_all_nodes():
+    # 노드 배치가 모두 커밋된 뒤 관계를 쓰므로 MATCH 실패로 빠지는 관계가 없어야 함
+    nodes, relationships = _graph(40)
+    driver = _TrackingDriver()
+    sink = Neo4jBoltSink(driver, batch_size=1, max_in_flight=8, retry_backoff=0)
+
+    sink.write(nodes, relationships)
+
+    assert driver.active == 0
+    assert len(driver.relationships) == 39
@@ -0,0 +1,88 @@
+"""개념 이름 canonical key: 표기 정규화와 별칭"""
+
+import unicodedata
+
+import pytest
+
+from src.tools.cypher.canonical import ConceptCanonicalizer, fold_name
+from src.tools.cypher.manager import GraphNode, GraphState
+
+
+@pytest.mark.parametrize("variant", [
+    "LangGraph",
+    "langgraph ",
+    "Lang Graph",
+    "lang-graph",
+    "lang_graph",
+    "Lang.Graph",
+    "ＬａｎｇＧｒａｐｈ",
+    "(LangGraph)",
+])
+def test_spelling_variants_fold_together(variant):
+    assert fold_name(variant) == fold_name("LangGraph") == "langgraph"
+
+
+def test_decomposed_hangul_is_composed():
+    name = "지식 그래프"
+    assert fold_name(unicodedata.normalize("NFD", name)) == fold_name(name) == "지식그래프"
+
+
+@pytest.mark.parametrize("jamo, composed", [
+    ("ㅎㅏㄴ", "한"),
+    ("ㄱㅏㅂㅅ", "값"),
+    ("ㅇㅓㅂㅅㄷㅏ", "없다"),
+    ("ㅎㅏㄴㅏ", "하나"),
+    ("ㄷㅏㄹㄱ", "닭"),
+])
+def test_compatibility_jamo_are_composed(jamo, composed):
+    assert fold_name(jamo) == fold_name(composed)
+
+
+def test_programming_language_symbols_are_kept():
+    assert fold_name("C++") != fold_name("C")
+    assert fold_name("C#") != fold_name("C")
+    assert fold_name("c ++") == fold_name("C++")
+    # 기호만으로 된 이름도 빈 키가 되지 않음
+    assert fold_name("...") != ""
+
+
+def test_aliases_map_to_canonical_name():
+    canonicalizer = ConceptCanonicalizer({
+        "LangGraph": ["랭그래프", "랭 그래프"],
+        "Neo4j": "네오포제이",
+    })
+
+    assert canonicalizer.key("랭그래프") == canonicalizer.key("Lang Graph")
+    assert canonicalizer.key("랭-그래프") == canonicalizer.key("LangGraph")
+    assert canonicalizer.key("네오포제이") == canonicalizer.key("neo4j")
+    assert canonicalizer.key("그래프") != canonicalizer.key("LangGraph")
+
+
+def test_version_changes_with_rules():
+    base = ConceptCanonicalizer({"LangGraph": ["랭그래프"]})
+
+    assert base.version == ConceptCanonicalizer({"LangGraph": "랭그래프"}).version
+    assert base.version != ConceptCanonicalizer({"LangGraph": ["랭체인"]}).version
+    assert (
+        base.version
+        != ConceptCanonicalizer({"LangGraph": ["랭그래프"]}, enabled=False).version
+    )
+
+
+def test_disabled_only_ignores_case_and_spaces():
+    canonicalizer = ConceptCanonicalizer({"LangGraph": ["랭그래프"]}, enabled=False)
+
+    assert canonicalizer.key("Lang  Graph") == "lang graph"
+    assert canonicalizer.key("lang-graph") != canonicalizer.key("LangGraph")
+    assert canonicalizer.key("랭그래프") != canonicalizer.key("LangGraph")
+
+
+def test_state_links_variants_to_existing_concept():
+    state = GraphState()
+    state.add_node(GraphNode(
+        id="concept_langgraph", label="Concept", properties={"name": "LangGraph"}
+    ))
+
+    assert state.get_concept_id("Lang-Graph") == "concept_langgraph"
+    assert state.get_concept_id("ＬａｎｇＧｒａｐｈ") == "concept_langgraph"
+    assert state.get_concept_id("LangChain") is None
@@ -0,0 +1,32 @@
+"""cluster_categories: 동시에 제안된 새 카테고리 정리"""
+
+from collections import Counter
+
+from src.tools.analysis import cluster_categories
+
+
+def test_variants_collapse_to_most_proposed_name():
+    mapping = cluster_categories(Counter({"AI": 3, "ai": 1, " Ai ": 1, "요리": 1}), [])
+
+    assert mapping == {"AI": "AI", "ai": "AI", " Ai ": "AI", "요리": "요리"}
+
+
+def test_existing_category_wins():
+    mapping = cluster_categories(Counter({"ai": 2, "개발": 1}), ["AI", "일상"])
+
+    assert mapping == {"ai": "AI", "개발": "개발"}
+
+
+def test_neighbors_join_groups():
+    def neighbors(names):
+        near = {"인공지능": [("AI", 0.92)], "머신러닝": [("인공지능", 0.88)]}
+        return [near.get(name, []) for name in names]
+
+    proposed = Counter({"인공지능": 2, "머신러닝": 2, "요리": 1})
+    mapping = cluster_categories(proposed, ["AI"], neighbors=neighbors)
+
+    assert mapping == {"인공지능": "AI", "머신러닝": "AI", "요리": "요리"}
+    assert cluster_categories(Counter(), ["AI"]) == {}
+    assert cluster_categories(Counter({"요리": 1}), [], neighbors=lambda names: None) == {
+        "요리": "요리"
+    }
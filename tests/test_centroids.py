@@ -0,0 +1,56 @@
+"""CategoryCentroids: 중심 벡터 분류와 문서별 교체"""
+
+import numpy as np
+import pytest
+
+from src.tools.search import CategoryCentroids
+
+
+@pytest.fixture
+def centroids(tmp_path):
+    centroids = CategoryCentroids(tmp_path / "centroids", model="test")
+    centroids.update("AI", np.array([1.0, 0.1, 0.0]), key="t1")
+    centroids.update("AI", np.array([0.9, 0.0, 0.1]), key="t2")
+    centroids.update("요리", np.array([0.0, 1.0, 0.0]), key="t3")
+    return centroids
+
+
+def test_classify_picks_the_nearest_centroid(centroids):
+    name, score, margin = centroids.classify(np.array([1.0, 0.0, 0.0]))
+
+    assert name == "AI"
+    assert score > 0.9
+    assert margin > 0.8
+    assert centroids.classify(np.array([1.0, 0.0, 0.0]), allowed={"요리"})[0] == "요리"
+    assert centroids.classify(np.array([1.0, 0.0, 0.0]), allowed=set()) is None
+
+
+def test_update_with_same_key_replaces_contribution(centroids):
+    before = centroids._sums.copy()
+
+    centroids.update("AI", np.array([1.0, 0.1, 0.0]), key="t1")
+    assert centroids.count("ai") == 2
+    np.testing.assert_array_equal(centroids._sums, before)
+
+    # 다른 카테고리로 옮기면 이전 카테고리에서 빠짐
+    centroids.update("요리", np.array([0.0, 2.0, 0.0]), key="t1")
+    assert centroids.count("AI") == 1
+    assert centroids.count("요리") == 2
+
+
+def test_state_survives_reload(tmp_path, centroids):
+    centroids.hits = 3
+    centroids.fallbacks = 1
+    centroids.save()
+
+    reloaded = CategoryCentroids(tmp_path / "centroids", model="test")
+    assert reloaded.names == ["AI", "요리"]
+    assert reloaded.hit_rate() == 0.75
+    np.testing.assert_allclose(reloaded._sums, centroids._sums)
+
+    # 다시 반영해도 중복 누적되지 않음
+    reloaded.update("AI", np.array([0.9, 0.0, 0.1]), key="t2")
+    assert reloaded.count("AI") == 2
+
+    # 모델이 바뀌면 초기화
+    assert len(CategoryCentroids(tmp_path / "centroids", model="other")) == 0
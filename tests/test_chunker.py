@@ -0,0 +1,80 @@
+"""ContentDefinedChunker: 경계 안정성과 크기 제한"""
+
+import random
+
+import pytest
+
+from src.tools.parsers.chunker import ContentDefinedChunker
+
+
+def _paragraph(rng: random.Random) -> str:
+    words = [f"w{rng.randrange(1000)}" for _ in range(rng.randrange(20, 80))]
+    return " ".join(words)
+
+
+def _document(seed: int, paragraphs: int = 120) -> list[str]:
+    rng = random.Random(seed)
+    return [_paragraph(rng) for _ in range(paragraphs)]
+
+
+@pytest.fixture
+def chunker():
+    return ContentDefinedChunker(min_size=1000, avg_size=2000, max_size=3000)
+
+
+def test_chunks_cover_text_and_respect_max_size(chunker):
+    text = "\n\n".join(_document(1))
+
+    chunks = chunker.chunk(text)
+
+    assert "".join(chunk.text for chunk in chunks) == text
+    assert chunks[0].start == 0 and chunks[-1].end == len(text)
+    for prev, cur in zip(chunks, chunks[1:]):
+        assert prev.end == cur.start
+    assert all(len(chunk.text) <= chunker.max_size for chunk in chunks)
+    assert all(len(chunk.text) >= chunker.min_size for chunk in chunks[:-1])
+
+
+def test_insertion_keeps_most_chunk_ids(chunker):
+    paragraphs = _document(2)
+    original = "\n\n".join(paragraphs)
+    edited = "\n\n".join(
+        paragraphs[:10]
+        + ["새로 추가한 문단 " + _paragraph(random.Random(99))]
+        + paragraphs[10:]
+    )
+
+    before = [chunk.id for chunk in chunker.chunk(original)]
+    after = {chunk.id for chunk in chunker.chunk(edited)}
+
+    # 삽입 지점 이후 경계가 다시 맞춰져 대부분의 청크가 그대로 남음
+    kept = sum(1 for chunk_id in before if chunk_id in after)
+    assert len(before) >= 10
+    assert kept >= len(before) - 3
+
+
+def test_section_starts_are_boundaries(chunker):
+    paragraphs = _document(3, paragraphs=60)
+    sections = ["# 섹션 A\n\n", "# 섹션 B\n\n", "# 섹션 C\n\n"]
+    parts = []
+    for i, title in enumerate(sections):
+        parts.append(title + "\n\n".join(paragraphs[i * 20:(i + 1) * 20]) + "\n\n")
+    text = "".join(parts)
+    starts = [text.index(title) for title in sections]
+
+    chunks = chunker.chunk(text, starts)
+
+    boundaries = {chunk.start for chunk in chunks}
+    assert set(starts) <= boundaries
+
+
+def test_short_text_is_single_chunk(chunker):
+    chunks = chunker.chunk("짧은 문서")
+    assert len(chunks) == 1
+    assert chunks[0].text == "짧은 문서"
+    assert chunker.chunk("") == []
+
+
+def test_invalid_sizes_raise():
+    with pytest.raises(ValueError):
+        ContentDefinedChunker(min_size=2000, avg_size=1000, max_size=3000)
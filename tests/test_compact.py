@@ -0,0 +1,76 @@
+"""compact_cypher_file: 중복 제거 후 같은 그래프로 다시 로드"""
+
+import pytest
+
+from src.core.exceptions import ExportError
+from src.tools.cypher.compact import compact_cypher_file
+from src.tools.cypher.manager import CypherManager, GraphNode, GraphRelationship
+
+
+def _node(node_id: str, label: str, **properties) -> str:
+    return GraphNode(id=node_id, label=label, properties=properties).to_cypher()
+
+
+def _rel(source: str, target: str, rel_type: str, **properties) -> str:
+    return GraphRelationship(source, target, rel_type, properties).to_cypher()
+
+
+def _load(path):
+    manager = CypherManager(str(path), use_snapshot=False)
+    return manager.load_existing()
+
+
+def _write(path, lines: list[str]):
+    path.write_text("".join(line + "\n" for line in lines), encoding="utf-8")
+
+
+def test_compaction_keeps_the_same_graph(tmp_path):
+    path = tmp_path / "graph.cypher"
+    lines = []
+    for run in range(5):
+        # 실행마다 같은 노드/관계를 다시 MERGE하고 프로퍼티를 갱신
+        lines.append(f"// === Added: run {run} ===")
+        lines.append(_node("t1", "Thought", title="노트", version=run))
+        lines.append(_node("c1", "Concept", name="LangGraph"))
+        lines.append(_node(f"c{run + 2}", "Concept", name=f"개념 {run}"))
+        lines.append(_rel("t1", "c1", "MENTIONS"))
+        lines.append(_rel("t1", f"c{run + 2}", "MENTIONS", confidence=0.5))
+    _write(path, lines)
+    before = _load(path)
+
+    stats = compact_cypher_file(path)
+    after = _load(path)
+
+    assert stats["statements_before"] == 25
+    assert stats["statements_after"] == 7 + 6
+    assert stats["bytes_saved"] > 0
+    assert after.nodes == before.nodes
+    assert after.nodes["t1"].properties["version"] == 4
+    assert {
+        (rel.source_id, rel.target_id, rel.rel_type) for rel in after.relationships
+    } == {
+        (rel.source_id, rel.target_id, rel.rel_type) for rel in before.relationships
+    }
+
+    # 압축 직후 스냅샷이 새 파일과 일치
+    manager = CypherManager(str(path))
+    assert len(manager.load_existing().nodes) == len(after.nodes)
+    assert manager.loaded_offset == path.stat().st_size
+
+
+def test_unrecognized_lines_stop_compaction_unless_forced(tmp_path):
+    path = tmp_path / "graph.cypher"
+    _write(path, [
+        _node("c1", "Concept", name="A"),
+        "CREATE (x:Weird)",
+        _node("c2", "Concept", name="B"),
+    ])
+    original = path.read_bytes()
+
+    with pytest.raises(ExportError):
+        compact_cypher_file(path)
+    assert path.read_bytes() == original
+
+    stats = compact_cypher_file(path, force=True)
+    assert stats["skipped_lines"] == 1
+    assert sorted(_load(path).nodes) == ["c1", "c2"]
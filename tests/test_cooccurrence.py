@@ -0,0 +1,72 @@
+"""공동 출현 수: 벡터화 계산과 단순 계산 비교"""
+
+from collections import Counter
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+from src.tools.analysis import CooccurrenceMiner, cooccurrence_pairs
+from src.tools.cypher.manager import GraphState
+
+
+def _brute_force(doc_index: np.ndarray, concept_index: np.ndarray) -> Counter:
+    by_doc: dict[int, set[int]] = {}
+    for doc, concept in zip(doc_index.tolist(), concept_index.tolist()):
+        by_doc.setdefault(doc, set()).add(concept)
+
+    counts = Counter()
+    for concepts in by_doc.values():
+        counts.update(combinations(sorted(concepts), 2))
+    return counts
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_pairs_match_brute_force(seed):
+    rng = np.random.default_rng(seed)
+    size = int(rng.integers(1, 400))
+    # 중복 출현과 순서가 섞인 입력
+    doc_index = rng.integers(0, 30, size=size)
+    concept_index = rng.integers(0, 25, size=size)
+
+    left, right, counts = cooccurrence_pairs(doc_index, concept_index)
+
+    assert np.all(left < right)
+    result = dict(zip(zip(left.tolist(), right.tolist()), counts.tolist()))
+    assert result == dict(_brute_force(doc_index, concept_index))
+
+
+def test_pairs_empty_and_single_concept_docs():
+    empty = np.array([], dtype=np.int64)
+    assert all(a.size == 0 for a in cooccurrence_pairs(empty, empty))
+
+    # 문서마다 개념이 하나뿐이면 쌍이 없음
+    left, right, counts = cooccurrence_pairs(np.array([0, 1, 2]), np.array([5, 5, 3]))
+    assert left.size == right.size == counts.size == 0
+
+
+def test_miner_scores_new_concept_pairs():
+    new_concepts = [
+        {"name": name, "source_file": source}
+        for source, names in {
+            "a.md": ["LangGraph", "Agent"],
+            "b.md": ["LangGraph", "Agent"],
+            "c.md": ["Cypher"],
+            "d.md": ["Neo4j"],
+        }.items()
+        for name in names
+    ]
+    miner = CooccurrenceMiner(min_count=2, min_pmi=0.5, min_jaccard=0.5)
+
+    pairs = miner.mine(GraphState(), new_concepts)
+
+    assert len(pairs) == 1
+    pair = pairs[0]
+    assert {pair.source, pair.target} == {"LangGraph", "Agent"}
+    assert pair.count == 2
+    assert pair.jaccard == pytest.approx(1.0)
+    assert pair.pmi == pytest.approx(np.log(2 * 4 / (2 * 2)))
+
+    assert (
+        miner.mine(GraphState(), new_concepts, exclude=[("Agent", "LangGraph")]) == []
+    )
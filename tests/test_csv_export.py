@@ -0,0 +1,77 @@
+"""Neo4jCSVExporter: neo4j-admin 임포트 CSV"""
+
+import csv
+
+from src.tools.cypher import Neo4jCSVExporter
+from src.tools.cypher.manager import GraphNode, GraphRelationship, GraphState
+
+
+def _read(path) -> list[list[str]]:
+    with open(path, encoding="utf-8", newline="") as f:
+        return list(csv.reader(f))
+
+
+def _state() -> GraphState:
+    state = GraphState()
+    state.add_node(GraphNode(id="c1", label="Concept", properties={
+        "name": "LangGraph", "description": "줄바꿈\n\"따옴표\", 쉼표", "weight": 2,
+    }))
+    state.add_node(
+        GraphNode(id="c2", label="Concept", properties={"name": "Neo4j", "weight": 0.5})
+    )
+    state.add_node(
+        GraphNode(id="t1", label="Thought", properties={"title": "노트", "draft": True})
+    )
+    state.add_relationship(
+        GraphRelationship(
+            source_id="t1",
+            target_id="c1",
+            rel_type="MENTIONS",
+            properties={"confidence": 0.9},
+        )
+    )
+    state.add_relationship(
+        GraphRelationship(source_id="c1", target_id="c2", rel_type="RELATED_TO")
+    )
+    # 끝점 노드가 없는 관계 (내보내면 neo4j-admin 임포트가 실패함)
+    state.add_relationship(
+        GraphRelationship(source_id="c1", target_id="gone", rel_type="RELATED_TO")
+    )
+    return state
+
+
+def test_nodes_and_relationships_round_trip(tmp_path):
+    stats = Neo4jCSVExporter().export(_state(), tmp_path)
+
+    assert stats["nodes"] == 3
+    assert stats["relationships"] == 2
+    assert stats["skipped_relationships"] == 1
+
+    concepts = _read(tmp_path / "nodes_Concept.csv")
+    assert concepts[0] == ["id:ID", "name", "description", "weight:double", ":LABEL"]
+    assert concepts[1] == ["c1", "LangGraph", "줄바꿈\n\"따옴표\", 쉼표", "2", "Concept"]
+    assert concepts[2] == ["c2", "Neo4j", "", "0.5", "Concept"]
+
+    thoughts = _read(tmp_path / "nodes_Thought.csv")
+    assert thoughts[0] == ["id:ID", "title", "draft:boolean", ":LABEL"]
+    assert thoughts[1] == ["t1", "노트", "true", "Thought"]
+
+    mentions = _read(tmp_path / "relationships_MENTIONS.csv")
+    assert mentions == [
+        [":START_ID", ":END_ID", ":TYPE", "confidence:double"],
+        ["t1", "c1", "MENTIONS", "0.9"],
+    ]
+    related = _read(tmp_path / "relationships_RELATED_TO.csv")
+    assert related == [[":START_ID", ":END_ID", ":TYPE"], ["c1", "c2", "RELATED_TO"]]
+
+
+def test_import_command_lists_every_file(tmp_path):
+    stats = Neo4jCSVExporter().export(_state(), tmp_path)
+    command = stats["import_command"]
+
+    assert command.startswith("neo4j-admin database import full")
+    for path in stats["node_files"]:
+        assert f"--nodes={path}" in command
+    for path in stats["relationship_files"]:
+        assert f"--relationships={path}" in command
+    assert command.endswith(" neo4j")
@@ -0,0 +1,128 @@
+"""CypherStreamLoader: 배치 검증과 끊긴 기록 복구"""
+
+from src.tools.cypher.loader import CypherStreamLoader
+from src.tools.cypher.manager import CypherManager, GraphNode, GraphState
+from src.tools.cypher.writer import CypherFileWriter
+
+
+def _node(node_id: str, name: str) -> str:
+    return GraphNode(id=node_id, label="Concept", properties={"name": name}).to_cypher()
+
+
+def _load(path) -> tuple[GraphState, CypherStreamLoader, int]:
+    state = GraphState()
+    loader = CypherStreamLoader()
+    end_offset = loader.load_into(state, path)
+    return state, loader, end_offset
+
+
+def test_complete_batches_are_loaded(tmp_path):
+    path = tmp_path / "graph.cypher"
+    writer = CypherFileWriter(path)
+    writer.append_batch([_node("a", "A"), _node("b", "B")])
+    writer.append_batch([_node("c", "C")])
+
+    state, loader, end_offset = _load(path)
+
+    assert sorted(state.nodes) == ["a", "b", "c"]
+    assert loader.rejected_batches == 0
+    assert end_offset == path.stat().st_size
+
+
+def test_torn_string_does_not_swallow_following_batches(tmp_path):
+    path = tmp_path / "graph.cypher"
+    writer = CypherFileWriter(path)
+    writer.append_batch([_node("a", "A")])
+    writer.append_batch([_node("b", "B long name")])
+
+    # 두 번째 배치를 문자열 한가운데서 자름 (비정상 종료)
+    data = path.read_bytes()
+    path.write_bytes(data[:data.rfind(b"long")])
+
+    writer.append_batch([_node("c", "C")])
+    writer.append_batch([_node("d", "D")])
+
+    state, loader, end_offset = _load(path)
+
+    assert sorted(state.nodes) == ["a", "c", "d"]
+    assert loader.rejected_batches == 1
+    assert end_offset == path.stat().st_size
+
+
+def test_batch_without_end_marker_is_rejected(tmp_path):
+    path = tmp_path / "graph.cypher"
+    writer = CypherFileWriter(path)
+    writer.append_batch([_node("a", "A")])
+    writer.append_batch([_node("b", "B"), _node("c", "C")])
+
+    # 끝 마커 줄을 잘라냄
+    data = path.read_bytes()
+    path.write_bytes(data[:data.rfind(b"// @batch end")])
+
+    state, loader, _ = _load(path)
+
+    assert sorted(state.nodes) == ["a"]
+    assert loader.rejected_batches == 1
+
+
+def test_checksum_mismatch_is_rejected(tmp_path):
+    path = tmp_path / "graph.cypher"
+    writer = CypherFileWriter(path)
+    writer.append_batch([_node("a", "A")])
+    writer.append_batch([_node("b", "B")])
+
+    data = path.read_bytes()
+    path.write_bytes(data.replace(b'name: "B"', b'name: "X"'))
+
+    state, loader, _ = _load(path)
+
+    assert sorted(state.nodes) == ["a"]
+    assert loader.rejected_batches == 1
+
+
+def test_legacy_multiline_statement_outside_batches(tmp_path):
+    path = tmp_path / "graph.cypher"
+    path.write_text(
+        'MERGE (n:Concept {id: "a", name: "first\nsecond"})\n'
+        'MERGE (n:Concept {id: "b", name: "B"})\n',
+        encoding="utf-8"
+    )
+
+    state, loader, _ = _load(path)
+
+    assert state.nodes["a"].properties["name"] == "first\nsecond"
+    assert "b" in state.nodes
+    assert loader.skipped == 0
+
+
+def test_append_reloads_when_file_was_replaced(tmp_path):
+    path = tmp_path / "graph.cypher"
+    manager = CypherManager(str(path), use_snapshot=False)
+    manager.load_existing()
+    manager.append_queries([_node("a", "A")])
+
+    # 다른 프로세스가 더 큰 내용으로 교체 (압축 등)
+    path.write_text(
+        "".join(_node(f"x{i}", f"X{i}") + "\n" for i in range(20)),
+        encoding="utf-8"
+    )
+    manager.append_queries([_node("b", "B")])
+
+    assert "a" not in manager.state.nodes
+    assert {"b", "x0", "x19"} <= set(manager.state.nodes)
+
+
+def test_append_applies_queries_to_state(tmp_path):
+    path = tmp_path / "graph.cypher"
+    manager = CypherManager(str(path))
+    manager.load_existing()
+
+    # 호출자가 state에 반영하지 않은 쿼리도 스냅샷에 포함되어야 함
+    manager.append_queries([_node("a", "A"), _node("b", "B")])
+    manager.save_snapshot()
+
+    assert manager.loaded_offset == path.stat().st_size
+    reloaded = CypherManager(str(path))
+    reloaded.load_existing()
+    assert sorted(reloaded.state.nodes) == ["a", "b"]
+    assert reloaded.loaded_offset == manager.loaded_offset
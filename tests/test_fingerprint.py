@@ -0,0 +1,88 @@
+"""MinHash 유사도와 DocumentFingerprintIndex 임계값"""
+
+import random
+
+import numpy as np
+import pytest
+
+from src.tools.analysis import DocumentFingerprintIndex, MinHasher
+
+
+def _text(seed: int, words: int = 600) -> str:
+    rng = random.Random(seed)
+    vocabulary = [f"단어{i}" for i in range(300)] + [f"word{i}" for i in range(300)]
+    return " ".join(rng.choice(vocabulary) for _ in range(words))
+
+
+def _edit(text: str) -> str:
+    words = text.split()
+    words[len(words) // 2] = "수정됨"
+    return " ".join(words)
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = DocumentFingerprintIndex(tmp_path / "graph.fingerprints.db", threshold=0.9)
+    yield index
+    index.close()
+
+
+def test_identical_text_has_similarity_one():
+    hasher = MinHasher()
+    # 공백/대소문자/전각 차이는 정규화됨
+    a = hasher.signature("LangGraph  에이전트\n파이프라인")
+    b = hasher.signature("ｌａｎｇｇｒａｐｈ 에이전트 파이프라인")
+    assert MinHasher.similarity(a, b) == 1.0
+
+
+def test_similarity_estimates_shingle_jaccard():
+    hasher = MinHasher(num_perm=256)
+    a_text = _text(1)
+    b_text = " ".join(a_text.split()[:400] + _text(2).split()[:200])
+
+    a_set = set(hasher.shingle_hashes(a_text).tolist())
+    b_set = set(hasher.shingle_hashes(b_text).tolist())
+    exact = len(a_set & b_set) / len(a_set | b_set)
+
+    estimate = MinHasher.similarity(hasher.signature(a_text), hasher.signature(b_text))
+    assert estimate == pytest.approx(exact, abs=0.1)
+
+
+def test_small_edit_is_found_above_threshold(index):
+    original = _text(3)
+    index.add("a.md", "hash-a", index.signature(original), {"concepts": []})
+    index.add("other.md", "hash-o", index.signature(_text(4)), {"concepts": []})
+
+    match = index.query(index.signature(_edit(original)))
+
+    assert match is not None
+    key, similarity = match
+    assert key == "a.md"
+    assert similarity >= index.threshold
+
+
+def test_different_text_is_not_matched(index):
+    index.add("a.md", "hash-a", index.signature(_text(5)), {"concepts": []})
+
+    assert index.query(index.signature(_text(6))) is None
+
+
+def test_exclude_skips_own_key(index):
+    text = _text(7)
+    signature = index.signature(text)
+    index.add("a.md", "hash-a", signature, {"concepts": []})
+
+    assert index.query(signature, exclude=["a.md"]) is None
+
+    index.add("copy.md", "hash-a", signature, {"concepts": ["x"]})
+    assert index.query(signature, exclude=["a.md"]) == ("copy.md", 1.0)
+
+
+def test_cached_analysis_requires_same_hash(index):
+    signature = index.signature(_text(8))
+    index.add("a.md", "hash-a", signature, {"concepts": ["LangGraph"]})
+
+    assert index.cached_analysis("a.md", "hash-a") == {"concepts": ["LangGraph"]}
+    assert index.cached_analysis("a.md", "hash-b") is None
+    assert len(index) == 1
+    assert signature.dtype == np.uint32
@@ -0,0 +1,107 @@
+"""GraphState: 라벨/이름 인덱스와 관계 인덱스"""
+
+from src.tools.cypher.manager import (
+    CypherManager,
+    GraphNode,
+    GraphRelationship,
+    GraphState,
+)
+
+def _concept(node_id: str, name: str) -> GraphNode:
+    return GraphNode(id=node_id, label="Concept", properties={"name": name})
+
+
+def test_lookup_by_label_and_name():
+    state = GraphState()
+    state.add_node(_concept("c1", "LangGraph"))
+    state.add_node(GraphNode(id="t1", label="Tag", properties={"name": "agents"}))
+
+    assert state.find_node_id("Concept", " langgraph") == "c1"
+    assert state.find_node_id("Tag", "LangGraph") is None
+    assert state.get_node_ids("Concept") == ["c1"]
+    assert state.get_all_tags() == ["agents"]
+    assert state.count("Concept") == 1
+
+
+def test_first_node_with_a_name_wins():
+    state = GraphState()
+    state.add_node(_concept("c1", "LangGraph"))
+    state.add_node(_concept("c2", "langgraph"))
+
+    assert state.get_concept_id("LangGraph") == "c1"
+    assert state.count("Concept") == 2
+
+
+def test_renamed_node_is_reindexed():
+    state = GraphState()
+    state.add_node(_concept("c1", "LangGraph"))
+    state.add_node(_concept("c1", "LangChain"))
+
+    assert state.get_concept_id("LangChain") == "c1"
+    assert state.get_concept_id("LangGraph") is None
+    assert state.get_node_ids("Concept") == ["c1"]
+
+
+def test_surviving_node_takes_over_the_name():
+    state = GraphState()
+    state.add_node(_concept("c1", "LangGraph"))
+    state.add_node(_concept("c2", "langgraph"))
+
+    state.add_node(_concept("c1", "LangChain"))
+
+    assert state.get_concept_id("LangGraph") == "c2"
+    assert state.get_concept_id("LangChain") == "c1"
+
+
+def test_replacing_node_with_same_name_keeps_order():
+    state = GraphState()
+    state.add_node(_concept("c1", "A"))
+    state.add_node(_concept("c2", "B"))
+    state.add_node(
+        GraphNode(id="c1", label="Concept", properties={"name": "A", "x": 1})
+    )
+
+    assert state.get_node_ids("Concept") == ["c1", "c2"]
+    assert state.nodes["c1"].properties["x"] == 1
+
+
+def test_neighbors_follow_relationships():
+    state = GraphState(
+        nodes={"a": _concept("a", "A"), "b": _concept("b", "B")},
+        relationships=[
+            GraphRelationship(source_id="a", target_id="b", rel_type="RELATED_TO")
+        ],
+    )
+
+    assert state.get_neighbors("a") == ["b"]
+    assert state.get_neighbors("b", "in") == ["a"]
+    assert state.get_neighbors("a", "out", "MENTIONS") == []
+
+
+def test_duplicate_relationship_merges_properties():
+    state = GraphState()
+    assert state.add_relationship(GraphRelationship("t1", "c1", "MENTIONS", {"a": 1}))
+    assert not state.add_relationship(
+        GraphRelationship("t1", "c1", "MENTIONS", {"b": 2})
+    )
+    assert state.add_relationship(GraphRelationship("t1", "c1", "RELATED_TO"))
+
+    assert len(state.relationships) == 2
+    assert state.get_relationship("t1", "c1", "MENTIONS").properties == {"a": 1, "b": 2}
+    assert state.has_relationship("t1", "c1", "RELATED_TO")
+    assert not state.has_relationship("c1", "t1", "RELATED_TO")
+    assert state.get_neighbors("c1", "in") == ["t1", "t1"]
+    assert state.get_neighbors("t1", "both", "MENTIONS") == ["c1"]
+
+
+def test_existing_relationship_yields_no_query(tmp_path):
+    manager = CypherManager(str(tmp_path / "graph.cypher"))
+    rel, query = manager.create_relationship(
+        "t1", "c1", "MENTIONS", {"confidence": 0.8}
+    )
+    assert query
+    manager.state.add_relationship(rel)
+
+    again, again_query = manager.create_relationship("t1", "c1", "MENTIONS")
+    assert again is rel
+    assert again_query == ""
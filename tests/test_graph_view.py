@@ -0,0 +1,65 @@
+"""GraphView: 복사 없는 읽기 전용 그래프 뷰"""
+
+import pytest
+
+from src.tools.cypher import GraphView
+from src.tools.cypher.manager import (
+    CypherManager,
+    GraphNode,
+    GraphRelationship,
+    GraphState,
+)
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = CypherManager(str(tmp_path / "graph.cypher"))
+    manager.state.add_node(
+        GraphNode(id="c1", label="Concept", properties={"name": "LangGraph"})
+    )
+    manager.state.add_node(
+        GraphNode(id="t1", label="Thought", properties={"title": "노트"})
+    )
+    manager.state.add_relationship(GraphRelationship("t1", "c1", "MENTIONS", {"w": 1}))
+    return manager
+
+
+def test_view_exposes_the_legacy_keys(manager):
+    view = GraphView(manager)
+
+    assert view["concepts"] == ["LangGraph"]
+    assert view.get("categories", []) == []
+    assert view["stats"] == manager.state.stats()
+    assert view["cypher_manager"] is manager
+    assert view["nodes"]["c1"]["label"] == "Concept"
+    assert "t1" in view["nodes"]
+    assert list(view["relationships"]) == [
+        {"source": "t1", "target": "c1", "type": "MENTIONS", "properties": {"w": 1}}
+    ]
+    with pytest.raises(KeyError):
+        view["missing"]
+
+
+def test_view_is_read_only(manager):
+    view = GraphView(manager)
+
+    with pytest.raises(TypeError):
+        view["nodes"]["c1"]["properties"]["name"] = "변경"
+    with pytest.raises(TypeError):
+        view["relationships"][0]["properties"]["w"] = 2
+    assert manager.state.nodes["c1"].properties["name"] == "LangGraph"
+
+
+def test_name_lists_follow_state_changes(manager):
+    view = GraphView(manager)
+    concepts = view.concepts
+    assert view.concepts is concepts
+
+    manager.state.add_node(
+        GraphNode(id="c2", label="Concept", properties={"name": "Neo4j"})
+    )
+    assert view.concepts == ["LangGraph", "Neo4j"]
+
+    # 재로드로 상태 객체가 바뀌어도 새 상태를 가리킴
+    manager.state = GraphState()
+    assert view.concepts == []
+    assert len(view["nodes"]) == 0
@@ -0,0 +1,94 @@
+"""KeywordIndex: BM25 점수와 문서 빈도 저장"""
+
+import math
+from collections import Counter
+
+import pytest
+
+from src.tools.analysis import KeywordIndex, keyword_concepts, tokenize
+
+
+DOCUMENTS = {
+    "a.md": "오늘 LangGraph로 에이전트를 만들었다. LangGraph 그래프 상태를 공부",
+    "b.md": "오늘 Neo4j에 그래프를 저장했다. Neo4j Cypher 쿼리",
+    "c.md": "오늘 점심은 김치찌개",
+    "d.md": "Cypher 쿼리 최적화와 인덱스. 인덱스 설계",
+}
+
+
+def _bm25(
+    documents: dict[str, str], k1: float = 1.5, b: float = 0.75
+) -> dict[str, dict[str, float]]:
+    """공식 그대로 계산한 BM25 (비교용)"""
+    tokens = {key: tokenize(text) for key, text in documents.items()}
+    n = len(documents)
+    avgdl = sum(len(t) for t in tokens.values()) / n
+    df = Counter(term for t in tokens.values() for term in set(t))
+
+    scores = {}
+    for key, doc_tokens in tokens.items():
+        scores[key] = {}
+        for term, tf in Counter(doc_tokens).items():
+            idf = math.log(1 + (n - df[term] + 0.5) / (df[term] + 0.5))
+            norm = k1 * (1 - b + b * len(doc_tokens) / avgdl)
+            scores[key][term] = idf * tf * (k1 + 1) / (tf + norm)
+    return scores
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = KeywordIndex(tmp_path / "graph.cypher.keywords.db")
+    yield index
+    index.close()
+
+
+def test_tokenize_strips_particles_and_predicates():
+    assert tokenize("LangGraph로 에이전트를 만들었다 그래프의 상태") == [
+        "langgraph", "에이전트", "그래프", "상태"
+    ]
+
+
+def test_scores_match_reference_bm25(index):
+    index.update(DOCUMENTS)
+    keywords = index.extract(DOCUMENTS, top_k=20)
+    expected = _bm25(DOCUMENTS)
+
+    for key, ranked in keywords.items():
+        assert [score for _, score in ranked] == sorted(
+            (s for _, s in ranked), reverse=True
+        )
+        for term, score in ranked:
+            assert score == pytest.approx(expected[key][term], abs=1e-4)
+
+    # 코퍼스 전체에 흔한 "오늘"보다 문서 고유 용어가 먼저
+    assert keywords["a.md"][0][0] == "langgraph"
+    assert keywords["b.md"][-1][0] == "오늘"
+
+
+def test_document_frequency_survives_reopen_and_replacement(tmp_path):
+    path = tmp_path / "graph.cypher.keywords.db"
+    index = KeywordIndex(path)
+    index.update(DOCUMENTS)
+    index.close()
+
+    index = KeywordIndex(path)
+    assert len(index) == 4
+    assert index.document_frequency("오늘") == 3
+    assert index.document_frequency("cypher") == 2
+
+    # 같은 키로 다시 들어온 문서는 이전 기여분을 빼고 교체
+    index.update({"c.md": "Cypher 공부"})
+    assert len(index) == 4
+    assert index.document_frequency("오늘") == 2
+    assert index.document_frequency("cypher") == 3
+    assert index.document_frequency("김치찌개") == 0
+    index.close()
+
+
+def test_keyword_concepts_drop_low_scores():
+    concepts = keyword_concepts([("langgraph", 4.0), ("그래프", 2.0), ("오늘", 0.5)])
+
+    assert [c["name"] for c in concepts] == ["langgraph", "그래프"]
+    assert concepts[0]["confidence"] == 0.7
+    assert concepts[1]["confidence"] == 0.5
+    assert keyword_concepts([]) == []
@@ -0,0 +1,52 @@
+"""CypherManager: 내용 기반 노드 ID와 변경 없는 Thought 건너뛰기"""
+
+from src.tools.cypher.loader import parse_statement
+from src.tools.cypher.manager import CypherManager
+
+
+def test_ids_are_stable_and_normalized(tmp_path):
+    first = CypherManager(str(tmp_path / "graph.cypher"))
+    second = CypherManager(str(tmp_path / "graph.cypher"))
+
+    concept_id = first.generate_node_id("Concept", "LangGraph")
+    assert concept_id == second.generate_node_id("Concept", "  langgraph ")
+    assert concept_id.startswith("concept_")
+    assert concept_id != first.generate_node_id("Tag", "LangGraph")
+    assert concept_id != first.generate_node_id("Concept", "LangChain")
+
+
+def test_thoughts_are_keyed_by_source_and_section(tmp_path):
+    manager = CypherManager(str(tmp_path / "graph.cypher"))
+
+    a, _ = manager.create_thought_node("노트", "본문", "a/note.md")
+    b, _ = manager.create_thought_node("노트", "본문", "b/note.md")
+    section, _ = manager.create_thought_node("노트", "본문", "a/note.md", section="요약")
+
+    assert len({a.id, b.id, section.id}) == 3
+    assert section.properties["section"] == "요약"
+
+
+def test_unchanged_thought_returns_empty_query(tmp_path):
+    manager = CypherManager(str(tmp_path / "graph.cypher"))
+    node, query = manager.create_thought_node("노트", "본문", "note.md")
+    manager.state.add_node(node)
+
+    same, same_query = manager.create_thought_node("노트", "본문", "note.md")
+    assert same is node
+    assert same_query == ""
+
+    changed, changed_query = manager.create_thought_node("노트", "바뀐 본문", "note.md")
+    assert changed.id == node.id
+    assert changed.properties["created_at"] == node.properties["created_at"]
+    assert changed_query
+
+
+def test_node_statement_merges_by_id_only(tmp_path):
+    manager = CypherManager(str(tmp_path / "graph.cypher"))
+    node, query = manager.create_thought_node("노트", 'quote " 본문', "note.md")
+
+    assert query.startswith(f'MERGE (n:Thought {{id: "{node.id}"}}) SET n += {{')
+    parsed = parse_statement(query)
+    assert (parsed.id, parsed.label, parsed.properties) == (
+        node.id, "Thought", node.properties
+    )
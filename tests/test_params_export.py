@@ -0,0 +1,137 @@
+"""ParameterizedExporter / ParameterizedLoader: 템플릿 + JSON Lines 왕복"""
+
+import orjson
+import pytest
+
+from src.core.exceptions import ExportError
+from src.tools.cypher.batch_export import node_template, relationship_template
+from src.tools.cypher.manager import GraphNode, GraphRelationship, GraphState
+from src.tools.cypher.params_export import (
+    PARAMS_FILE,
+    TEMPLATES_FILE,
+    ParameterizedExporter,
+    ParameterizedLoader,
+    read_templates,
+)
+
+
+class _Result:
+    def consume(self):
+        return None
+
+
+class _RecordingDriver:
+    """실행된 문장과 파라미터 행을 기록하는 드라이버"""
+
+    def __init__(self):
+        self.schema: list[str] = []
+        self.batches: list[tuple[str, list[dict]]] = []
+
+    def session(self, database=None):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return None
+
+    def run(self, query, rows=None):
+        if rows is None:
+            self.schema.append(query)
+        else:
+            self.batches.append((query, rows))
+        return _Result()
+
+    def execute_write(self, work, *args):
+        return work(self, *args)
+
+
+def _state() -> GraphState:
+    state = GraphState()
+    for i in range(5):
+        state.add_node(GraphNode(id=f"c{i}", label="Concept", properties={
+            "name": f"개념 {i}", "text": 'quote " and \\ slash\nline', "weight": i / 4,
+        }))
+    state.add_node(GraphNode(id="t0", label="Thought", properties={"title": "노트"}))
+    for i in range(5):
+        state.add_relationship(
+            GraphRelationship(
+                source_id="t0",
+                target_id=f"c{i}",
+                rel_type="MENTIONS",
+                properties={"rank": i},
+            )
+        )
+    state.add_relationship(
+        GraphRelationship(source_id="c0", target_id="c1", rel_type="RELATED_TO")
+    )
+    return state
+
+
+def test_export_writes_templates_and_rows(tmp_path):
+    stats = ParameterizedExporter().export(_state(), tmp_path)
+
+    assert stats["nodes"] == 6
+    assert stats["relationships"] == 6
+    assert stats["templates"] == 4
+
+    schema, templates = read_templates(tmp_path / TEMPLATES_FILE)
+    assert templates["node:Concept"] == node_template("Concept")
+    assert templates["rel:MENTIONS:Thought:Concept"] == relationship_template(
+        "MENTIONS", "Thought", "Concept"
+    )
+    assert any("concept_id" in statement for statement in schema)
+
+    records = [
+        orjson.loads(line)
+        for line in (tmp_path / PARAMS_FILE).read_bytes().splitlines()
+    ]
+    assert len(records) == 12
+    assert {
+        "t": "node:Concept",
+        "row": {"id": "c0", "props": _state().nodes["c0"].properties},
+    } in records
+
+
+def test_loader_replays_the_same_graph(tmp_path):
+    state = _state()
+    ParameterizedExporter().export(state, tmp_path)
+    driver = _RecordingDriver()
+
+    stats = ParameterizedLoader(driver, batch_size=2).load(tmp_path)
+
+    assert stats["rows"] == 12
+    assert stats["schema"] == len(driver.schema)
+    # 같은 템플릿의 연속된 행만 batch_size 단위로 묶임 (3 + 1 + 3 + 1)
+    assert stats["batches"] == 8
+    assert all(len(rows) <= 2 for _, rows in driver.batches)
+
+    nodes, relationships = {}, {}
+    for template, rows in driver.batches:
+        for row in rows:
+            if "id" in row:
+                label = template.split("(n:")[1].split(" ")[0]
+                nodes[row["id"]] = (label, row["props"])
+            else:
+                rel_type = template.split("[r:")[1].split("]")[0]
+                relationships[(row["source"], row["target"], rel_type)] = row["props"]
+
+    assert nodes == {
+        node.id: (node.label, node.properties) for node in state.nodes.values()
+    }
+    assert relationships == {
+        (rel.source_id, rel.target_id, rel.rel_type): rel.properties
+        for rel in state.relationships
+    }
+
+
+def test_unknown_template_raises(tmp_path):
+    ParameterizedExporter().export(_state(), tmp_path)
+    with open(tmp_path / PARAMS_FILE, "ab") as f:
+        f.write(
+            orjson.dumps({"t": "node:Missing", "row": {"id": "x", "props": {}}}) + b"\n"
+        )
+
+    with pytest.raises(ExportError):
+        ParameterizedLoader(_RecordingDriver()).load(tmp_path)
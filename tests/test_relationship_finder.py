@@ -0,0 +1,69 @@
+"""RelationshipCandidateFinder: 개념별 후보 검색과 프롬프트 예산 분할"""
+
+from src.tools.analysis import (
+    LexicalIndex,
+    RelationshipCandidateFinder,
+    estimate_tokens,
+    pack_by_budget,
+)
+from src.tools.cypher.manager import GraphNode, GraphRelationship, GraphState
+
+
+def _state() -> GraphState:
+    state = GraphState()
+    for name in ["LangGraph", "LangChain", "Neo4j", "Cypher", "김치찌개"]:
+        state.add_node(GraphNode(id=name, label="Concept", properties={"name": name}))
+    state.add_node(GraphNode(id="t1", label="Thought", properties={"title": "그래프 DB"}))
+    state.add_relationship(GraphRelationship("t1", "Neo4j", "MENTIONS"))
+    state.add_relationship(GraphRelationship("t1", "Cypher", "MENTIONS"))
+    return state
+
+
+def test_lexical_index_ranks_by_jaccard():
+    index = LexicalIndex(["LangGraph", "LangChain", "Neo4j", "langgraph"])
+
+    hits = index.search("LangGraphs", k=2)
+
+    assert hits == [("LangGraph", 7 / 8), ("langgraph", 7 / 8)]
+    assert index.search("Lang Graph", k=5)[-1][0] == "LangChain"
+    assert index.search("") == []
+
+
+def test_cooccurring_concepts_become_candidates():
+    finder = RelationshipCandidateFinder(_state())
+
+    candidates = finder.find([
+        {"name": "그래프 쿼리", "source_file": "db.md"},
+        {"name": "Neo4j", "source_file": "db.md"},
+    ], k=3)
+
+    # 같은 문서의 기존 개념(Neo4j)과 그 개념을 언급한 Thought의 개념(Cypher)
+    assert candidates["그래프 쿼리"][:2] == ["Neo4j", "Cypher"]
+    assert "Neo4j" not in candidates.get("Neo4j", [])
+
+
+def test_embedding_hits_are_fused():
+    calls = []
+
+    def vector_search(names, k):
+        calls.append((names, k))
+        return [[("김치찌개", 0.9)] for _ in names]
+
+    finder = RelationshipCandidateFinder(_state(), vector_search=vector_search)
+    candidates = finder.find([{"name": "LangGraph 튜토리얼", "source_file": "a.md"}], k=2)
+
+    assert calls == [(["LangGraph 튜토리얼"], 4)]
+    assert set(candidates["LangGraph 튜토리얼"]) == {"LangGraph", "김치찌개"}
+    assert RelationshipCandidateFinder(GraphState()).find([{"name": "A"}]) == {}
+
+
+def test_pack_by_budget_respects_tokens_and_count():
+    items = ["가" * 10, "나" * 10, "다" * 10, "라" * 100]
+    cost = estimate_tokens("가" * 10)
+
+    groups = pack_by_budget(items, str, budget_tokens=cost * 2)
+    assert groups == [items[:2], items[2:3], items[3:]]
+
+    assert pack_by_budget(items[:3], str, budget_tokens=10_000, max_items=2) == [
+        items[:2], items[2:3]
+    ]
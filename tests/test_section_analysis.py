@@ -0,0 +1,100 @@
+"""ResearchAgent: 바뀐 섹션만 다시 추출"""
+
+import pytest
+
+from src.agents.research_agent.agent import ResearchAgent
+from src.core.exceptions import LLMError
+from src.tools.analysis import SectionCache
+from src.tools.parsers import DocumentParserTool
+
+
+def _markdown(intro: str) -> str:
+    return (
+        "# 노트\n\n"
+        f"## 소개\n\n{intro}\n\n"
+        "## 설계\n\nLangGraph로 에이전트 파이프라인을 구성한다.\n\n"
+        "## 저장\n\nNeo4j에 그래프를 저장한다.\n"
+    )
+
+
+class _FakeLLM:
+    """섹션 요청에 섹션별 개념을 돌려주는 LLM (down이면 실패)"""
+
+    def __init__(self, drop_last: bool = False):
+        self.calls = 0
+        self.down = False
+        self.drop_last = drop_last
+
+    def __call__(self, prompt, system_prompt=None):
+        self.calls += 1
+        if self.down:
+            raise LLMError("LLM 서버에 연결할 수 없음")
+        ids = [
+            int(line.split(":")[1])
+            for line in prompt.splitlines()
+            if line.startswith("### id:")
+        ]
+        if self.drop_last:
+            ids = ids[:-1]
+        return {
+            "sections": [{"id": i, "concepts": [{"name": f"개념{i}"}]} for i in ids],
+            "category": "개발",
+            "summary": "요약",
+        }
+
+
+@pytest.fixture
+def agent(monkeypatch):
+    agent = ResearchAgent()
+    llm = _FakeLLM()
+    monkeypatch.setattr(agent, "invoke_llm_json", llm)
+    agent.fake_llm = llm
+    return agent
+
+
+def _analyze(agent, tmp_path, cache, intro):
+    path = tmp_path / "note.md"
+    path.write_text(_markdown(intro), encoding="utf-8")
+    doc = DocumentParserTool().parse(str(path))
+    return agent._analyze(doc, None, cache, [], doc_key="note.md")
+
+
+def test_only_changed_sections_are_extracted(agent, tmp_path):
+    cache = SectionCache(tmp_path / "sections.db")
+
+    _, source = _analyze(agent, tmp_path, cache, "처음 쓴 소개.")[:2]
+    assert source == "llm"
+    stored = cache.load("note.md")
+    assert len(stored) == 4
+
+    analysis, source, _ = _analyze(agent, tmp_path, cache, "고쳐 쓴 소개.")
+    assert source == "sections"
+    assert agent.fake_llm.calls == 2
+    assert analysis["category"] == "개발"
+    assert (
+        sum(1 for key in stored if cache.load("note.md")[key][0] != stored[key][0]) == 1
+    )
+
+
+def test_missing_sections_are_not_cached(tmp_path, monkeypatch):
+    agent = ResearchAgent()
+    monkeypatch.setattr(agent, "invoke_llm_json", _FakeLLM(drop_last=True))
+    cache = SectionCache(tmp_path / "sections.db")
+
+    analysis, _, _ = _analyze(agent, tmp_path, cache, "소개.")
+
+    assert analysis.get("incomplete") is True
+    assert len(cache.load("note.md")) == 3
+
+
+def test_llm_outage_falls_back_once(agent, tmp_path):
+    cache = SectionCache(tmp_path / "sections.db")
+    _analyze(agent, tmp_path, cache, "처음 쓴 소개.")
+    agent.fake_llm.calls = 0
+    agent.fake_llm.down = True
+
+    analysis, _, _ = _analyze(agent, tmp_path, cache, "고쳐 쓴 소개.")
+
+    # 섹션 추출 1회 + 문서 전체 1회 (섹션을 다시 보내지 않음)
+    assert agent.fake_llm.calls == 2
+    assert analysis.get("fallback")
@@ -0,0 +1,79 @@
+"""GraphSnapshot: 저장 → 로드 왕복과 Cypher 파일 검증"""
+
+from src.tools.cypher.manager import GraphNode, GraphRelationship, GraphState
+from src.tools.cypher.snapshot import GraphSnapshot
+
+
+def _state() -> GraphState:
+    state = GraphState()
+    state.add_node(GraphNode(id="c1", label="Concept", properties={
+        "name": "LangGraph",
+        "description": "에이전트 \"그래프\"\n두 번째 줄",
+        "count": 3,
+        "negative": -(1 << 63),
+        "big": 1 << 70,
+        "score": 0.25,
+        "verified": True,
+        "note": None,
+    }))
+    state.add_node(GraphNode(id="c2", label="Concept", properties={"name": "Neo4j"}))
+    state.add_node(GraphNode(id="t1", label="Thought", properties={}))
+    state.add_relationship(GraphRelationship(
+        source_id="t1", target_id="c1", rel_type="MENTIONS", properties={"weight": 2}
+    ))
+    state.add_relationship(GraphRelationship(
+        source_id="c1", target_id="c2", rel_type="RELATED_TO"
+    ))
+    return state
+
+
+def test_round_trip_preserves_nodes_relationships_and_types(tmp_path):
+    cypher_path = tmp_path / "graph.cypher"
+    cypher_path.write_text("// graph\n", encoding="utf-8")
+    snapshot_path = tmp_path / "graph.cypher.snap"
+    state = _state()
+
+    offset = GraphSnapshot.save(state, snapshot_path, cypher_path)
+    loaded = GraphState()
+    assert GraphSnapshot.load_into(loaded, snapshot_path, cypher_path) == offset
+
+    assert offset == cypher_path.stat().st_size
+    assert loaded.nodes == state.nodes
+    for key, value in state.nodes["c1"].properties.items():
+        assert type(loaded.nodes["c1"].properties[key]) is type(value)
+    assert [
+        (rel.source_id, rel.target_id, rel.rel_type, rel.properties)
+        for rel in loaded.relationships
+    ] == [
+        (rel.source_id, rel.target_id, rel.rel_type, rel.properties)
+        for rel in state.relationships
+    ]
+    assert loaded.get_concept_id("neo4j") == "c2"
+    assert loaded.get_neighbors("t1", "out", "MENTIONS") == ["c1"]
+
+
+def test_snapshot_is_rejected_when_cypher_changed(tmp_path):
+    cypher_path = tmp_path / "graph.cypher"
+    cypher_path.write_text("// first\n", encoding="utf-8")
+    snapshot_path = tmp_path / "graph.cypher.snap"
+    offset = GraphSnapshot.save(_state(), snapshot_path, cypher_path)
+
+    # 뒤에 추가된 내용은 그대로 유효 (오프셋 이후만 다시 파싱)
+    with open(cypher_path, "a", encoding="utf-8") as f:
+        f.write("// appended\n")
+    assert GraphSnapshot.read_offset(snapshot_path, cypher_path) == offset
+
+    # 앞부분이 바뀌거나 파일이 짧아지면 사용하지 않음
+    cypher_path.write_text("// other!\n// appended\n", encoding="utf-8")
+    assert GraphSnapshot.read_offset(snapshot_path, cypher_path) is None
+    cypher_path.write_text("", encoding="utf-8")
+    assert GraphSnapshot.load_into(GraphState(), snapshot_path, cypher_path) is None
+
+
+def test_corrupt_snapshot_is_ignored(tmp_path):
+    cypher_path = tmp_path / "graph.cypher"
+    cypher_path.write_text("// graph\n", encoding="utf-8")
+    snapshot_path = tmp_path / "graph.cypher.snap"
+    snapshot_path.write_bytes(b"not a snapshot")
+
+    assert GraphSnapshot.read_offset(snapshot_path, cypher_path) is None
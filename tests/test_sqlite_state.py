@@ -0,0 +1,107 @@
+"""SQLiteGraphState: GraphState와 같은 결과 + 재시작 후 유지"""
+
+import pytest
+
+from src.tools.cypher.manager import (
+    CypherManager,
+    GraphNode,
+    GraphRelationship,
+    GraphState,
+)
+from src.tools.cypher.sqlite_state import SQLiteGraphState
+
+
+def _fill(state):
+    state.add_node(
+        GraphNode(id="c1", label="Concept", properties={"name": "LangGraph", "n": 1})
+    )
+    state.add_node(
+        GraphNode(id="c2", label="Concept", properties={"name": "langgraph"})
+    )
+    state.add_node(GraphNode(id="c3", label="Concept", properties={"name": "Neo4j"}))
+    state.add_node(GraphNode(id="t1", label="Thought", properties={"title": "노트"}))
+    state.add_node(
+        GraphNode(id="c1", label="Concept", properties={"name": "LangGraph", "n": 2})
+    )
+    state.add_relationship(GraphRelationship("t1", "c1", "MENTIONS", {"w": 1}))
+    state.add_relationship(GraphRelationship("t1", "c3", "MENTIONS"))
+    state.add_relationship(GraphRelationship("t1", "c1", "MENTIONS", {"w": 2}))
+    state.add_relationship(GraphRelationship("c1", "c3", "RELATED_TO"))
+
+
+def _snapshot(state) -> dict:
+    return {
+        "nodes": {
+            node_id: (node.label, node.properties)
+            for node_id, node in state.nodes.items()
+        },
+        "relationships": [
+            (rel.source_id, rel.target_id, rel.rel_type, rel.properties)
+            for rel in state.relationships
+        ],
+        "labels": state.get_labels(),
+        "concepts": state.get_all_concepts(),
+        "stats": state.stats(),
+        "langgraph": state.get_concept_id("LANGGRAPH"),
+        "label_of": state.get_label("t1"),
+        "neighbors": state.get_neighbors("t1", "out", "MENTIONS"),
+        "incoming": state.get_neighbors("c3", "in"),
+        "has": state.has_relationship("t1", "c1", "MENTIONS"),
+    }
+
+
+@pytest.fixture
+def sqlite_state(tmp_path):
+    state = SQLiteGraphState(tmp_path / "graph.cypher.db")
+    yield state
+    state.close()
+
+
+def test_matches_in_memory_state(sqlite_state):
+    memory = GraphState()
+    _fill(memory)
+    _fill(sqlite_state)
+
+    assert _snapshot(sqlite_state) == _snapshot(memory)
+    assert sqlite_state.get_relationship("t1", "c1", "MENTIONS").properties == {"w": 2}
+    assert sqlite_state.get_label("missing") is None
+
+
+def test_contents_survive_reopen(tmp_path):
+    path = tmp_path / "graph.cypher.db"
+    state = SQLiteGraphState(path)
+    _fill(state)
+    state.set_meta("cypher_offset", "42")
+    expected = _snapshot(state)
+    state.commit()
+    state.close()
+
+    reopened = SQLiteGraphState(path)
+    assert _snapshot(reopened) == expected
+    assert reopened.get_meta("cypher_offset") == "42"
+    reopened.close()
+
+
+def test_manager_resumes_from_stored_offset(tmp_path):
+    path = tmp_path / "graph.cypher"
+    manager = CypherManager(str(path), backend="sqlite")
+    manager.load_existing()
+    manager.append_queries([
+        GraphNode(id="c1", label="Concept", properties={"name": "A"}).to_cypher(),
+    ])
+    manager.save_snapshot()
+    offset = manager.loaded_offset
+    manager.state.close()
+
+    # 다른 프로세스가 뒤에 추가한 내용만 새로 반영
+    other = CypherManager(str(path), backend="memory", use_snapshot=False)
+    other.load_existing()
+    other.append_queries([
+        GraphNode(id="c2", label="Concept", properties={"name": "B"}).to_cypher(),
+    ])
+
+    resumed = CypherManager(str(path), backend="sqlite")
+    state = resumed.load_existing()
+    assert sorted(state.nodes) == ["c1", "c2"]
+    assert resumed.loaded_offset > offset
+    state.close()
@@ -0,0 +1,55 @@
+"""triage_document: LLM이 필요 없는 문서 분류"""
+
+import pytest
+import xxhash
+
+from src.agents.research_agent.agent import ResearchAgent
+from src.tools.analysis import triage_document
+from src.tools.parsers.document_parser import ParsedDocument
+
+
+def _doc(content: str, file_type: str = "markdown", **metadata) -> ParsedDocument:
+    return ParsedDocument(
+        file_path=f"notes/doc.{file_type}", file_type=file_type, title="노트",
+        content=content, metadata=metadata, file_name=f"doc.{file_type}",
+    )
+
+
+@pytest.mark.parametrize("content, file_type, metadata, reason", [
+    ("  \n\n ", "markdown", {}, "empty"),
+    ("이름,나이", "csv", {"row_count": 0}, "csv_header"),
+    ("이름,나이,메모\n철수,10,LangGraph 공부를 시작함", "csv", {"row_count": 1}, None),
+    ("- [[LangGraph]]\n- https://neo4j.com/docs/cypher-manual\n- [문서](https://x.io/a)",
+     "markdown", {}, "links_only"),
+    ("장보기: 우유", "markdown", {}, "too_short"),
+    ("LangGraph로 에이전트 파이프라인을 구성하고 Neo4j에 저장한다.", "markdown", {}, None),
+])
+def test_triage_reasons(content, file_type, metadata, reason):
+    assert triage_document(_doc(content, file_type, **metadata)) == reason
+
+
+def test_short_note_with_a_link_is_too_short():
+    doc = _doc("참고: https://example.com/very/long/path 다시 볼 것")
+    assert triage_document(doc, max_link_ratio=0.9) == "too_short"
+    assert triage_document(doc, min_chars=5, max_link_ratio=0.9) is None
+
+
+def test_identical_content_reuses_the_first_analysis():
+    agent = ResearchAgent()
+    content = "LangGraph로 에이전트 파이프라인을 구성하고 Neo4j에 저장한다."
+    content_hash = xxhash.xxh3_64_hexdigest(content)
+    original = {"concepts": [{"name": "LangGraph"}], "category": "개발", "summary": "요약"}
+    agent._seen_contents[content_hash] = ("a/note.md", original)
+
+    analysis, source, duplicate_of = agent._triage(_doc(content), content_hash, [])
+
+    assert source == "triage"
+    assert analysis["triage"] == "duplicate"
+    assert analysis["concepts"] == original["concepts"]
+    assert analysis["concepts"][0] is not original["concepts"][0]
+    assert duplicate_of == {
+        "source_key": "a/note.md",
+        "similarity": 1.0,
+        "method": "exact",
+    }
+    assert agent._triage(_doc(content + " 추가"), "other", []) is None
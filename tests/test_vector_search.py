@@ -0,0 +1,82 @@
+"""ConceptVectorIndex: 저장/검색과 질의 이름 처리"""
+
+import numpy as np
+
+from src.tools.search import ConceptVectorIndex
+
+
+class _CharEmbedder:
+    """글자 빈도 벡터 (비슷한 철자면 코사인 유사도가 높음)"""
+
+    def __init__(self):
+        self.calls: list[list[str]] = []
+
+    def __call__(self, texts: list[str]) -> list[list[float]]:
+        self.calls.append(list(texts))
+        vectors = []
+        for text in texts:
+            vector = np.zeros(64)
+            for ch in text.casefold():
+                vector[ord(ch) % 64] += 1.0
+            vectors.append(vector.tolist())
+        return vectors
+
+
+def _index(tmp_path, embed=None) -> ConceptVectorIndex:
+    return ConceptVectorIndex(
+        tmp_path / "graph.cypher.vectors", embed_fn=embed or _CharEmbedder()
+    )
+
+
+def test_add_flush_and_reload(tmp_path):
+    index = _index(tmp_path)
+    assert index.add(["LangGraph", "LangChain", "Neo4j", "langgraph "]) == 3
+    index.flush()
+
+    embed = _CharEmbedder()
+    reloaded = _index(tmp_path, embed)
+
+    assert len(reloaded) == 3
+    assert reloaded.names() == ["LangGraph", "LangChain", "Neo4j"]
+    assert np.allclose(reloaded.vector("langchain"), index.vector("LangChain"))
+    # 이미 있는 이름은 다시 임베딩하지 않음
+    assert reloaded.add(["Neo4j"]) == 0
+    assert embed.calls == []
+
+
+def test_search_top_k_with_allowed_mask(tmp_path):
+    index = _index(tmp_path)
+    index.add(["LangGraph", "LangChain", "Neo4j", "GraphQL"])
+
+    hits = index.search(["LangGraph"], k=2)[0]
+    assert len(hits) == 2
+    assert all(name != "LangGraph" for name, _ in hits)
+
+    mask = index.row_mask(["Neo4j", "GraphQL"])
+    hits = index.search(["LangGraph"], k=5, allowed=mask)[0]
+    assert {name for name, _ in hits} <= {"Neo4j", "GraphQL"}
+
+    scores = [score for _, score in index.search(["LangGraph"], k=4)[0]]
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_query_names_are_not_persisted(tmp_path):
+    embed = _CharEmbedder()
+    index = _index(tmp_path, embed)
+    index.add(["LangGraph", "Neo4j"])
+    mask = index.row_mask(["LangGraph", "Neo4j"])
+
+    hits = index.search(["Lang Graph 튜토리얼"], k=1)[0]
+    index.flush()
+
+    assert hits[0][0] == "LangGraph"
+    assert len(index) == 2
+    assert "Lang Graph 튜토리얼" not in index
+    assert mask.size == index.count
+    assert len(_index(tmp_path)) == 2
+
+    # 질의로 임베딩한 벡터는 나중에 add할 때 재사용
+    calls = len(embed.calls)
+    assert index.add(["Lang Graph 튜토리얼"]) == 1
+    assert len(embed.calls) == calls
+    assert len(index) == 3